@@ -0,0 +1,67 @@
+import timeit
+import numpy as np
+from src.transformations.matrix import Matrix
+
+"""Benchmark comparing Matrix.multiply against the original implementation which built a Vector per row and per column. Run from the root of the project with: python -m benchmarks.bench_matrix_multiply"""
+
+SIZES = [2, 3, 100]
+REPEATS = 5
+
+# Minimal copy of the original list based vector, keeping its type and dimension checks on every dot product
+class _ListVector:
+    def __init__(self, values):
+        if len(values) < 1:
+            raise ValueError("Vector cannot have 0 dimensions")
+        self.d = len(values)
+        self.values = values
+
+    def dotProduct(self, v):
+        if not isinstance(v, _ListVector):
+            raise TypeError("You must input a vector.")
+        if self.d != v.d:
+            raise ValueError("Vectors don't have the same dimensions.")
+        result = 0
+        for i in range(self.d):
+            result += self.values[i] * v.values[i]
+        return result
+
+# The original multiply, materialising one vector per row of a and one per column of b
+def legacy_multiply(a: list[list[float]], b: list[list[float]]) -> list[list[float]]:
+    values, temp = [], []
+    vecArrA = [_ListVector(a[i]) for i in range(len(a))]
+    vecArrB = [_ListVector([row[i] for row in b]) for i in range(len(b[0]))]
+    for i in range(len(a)):
+        for j in range(len(b[0])):
+            temp.append(vecArrA[i].dotProduct(vecArrB[j]))
+        values.append(temp[:])
+        temp.clear()
+    return values
+
+# Helper function to time a callable, returning the best time per call in microseconds
+def best_time(f, number: int) -> float:
+    return min(timeit.repeat(f, number=number, repeat=REPEATS)) / number * 1e6
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'size':>6} {'legacy (us)':>14} {'multiply (us)':>14} {'speed-up':>10}")
+    for n in SIZES:
+        a, b = rng.uniform(-1, 1, (n, n)), rng.uniform(-1, 1, (n, n))
+        a_list, b_list = a.tolist(), b.tolist()
+        mat_a, mat_b = Matrix(a), Matrix(b)
+        assert np.allclose(legacy_multiply(a_list, b_list), mat_a.multiply(mat_b).as_array())
+
+        number = 20000 if n < 10 else 2
+        legacy = best_time(lambda: legacy_multiply(a_list, b_list), number)
+        current = best_time(lambda: mat_a.multiply(mat_b), number)
+        print(f"{n:>6} {legacy:>14.2f} {current:>14.2f} {legacy/current:>9.1f}x")
+
+    # Batched case: one 2x2 transformation applied to many points, as done for every plotted curve
+    points = rng.uniform(-100, 100, (2, 2000))
+    mat = Matrix(rng.uniform(-1, 1, (2, 2)))
+    mat_list, columns = mat.values, [[[x], [y]] for x, y in points.T.tolist()]
+    legacy = best_time(lambda: [legacy_multiply(mat_list, column) for column in columns], 5)
+    current = best_time(lambda: mat.multiply(points), 2000)
+    print(f"{'2x2000':>6} {legacy:>14.2f} {current:>14.2f} {legacy/current:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
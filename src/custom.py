@@ -1,7 +1,13 @@
-from random import randint, uniform
+import numpy as np
+from random import uniform
 
 """Script to store all neccessary custom functions"""
 
+# Functions are validated on PROBE_POINTS evenly spaced values between -PROBE_RANGE and PROBE_RANGE, and as many again around the bounds of the graph
+PROBE_RANGE = 1000
+PROBE_POINTS = 2001
+PROBE_MARGIN = 0.1
+
 # Custom rounding function used 
 def custom_round(value: float, decimals: int) -> int:
     rounded_value = round(value, decimals)
@@ -15,10 +21,33 @@ def custom_is_constant(user_input: str) -> bool:
     except ValueError:
         return False  
     
-# Custom method which tests a 100 different random values between -1000 and 1000 to see if the function inputted is actually valid, error is raised if function is not validz 
-def custom_test_valid_function(f) -> None:
-    for _ in range(100):
-        float(f(randint(-1000, 1000)))
+# Custom function which returns the deterministic grid of x values functions are probed on, denser within (and just around) the given bounds
+def custom_probe_grid(bounds: tuple = None) -> np.ndarray:
+    grid = np.linspace(-PROBE_RANGE, PROBE_RANGE, PROBE_POINTS)
+    if bounds is not None:
+        min_x, max_x = bounds[0], bounds[1]
+        margin = (max_x - min_x) * PROBE_MARGIN
+        grid = np.concatenate((grid, np.linspace(min_x - margin, max_x + margin, PROBE_POINTS)))
+    return np.unique(grid)
+
+# Custom function which returns the (start, end) x values of every run of True values in a mask over sorted x values, runs of a single value have no width and are left out
+def custom_mask_regions(x: np.ndarray, mask: np.ndarray) -> list[tuple]:
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+    return [(float(x[i]), float(x[j])) for i, j in zip(starts, ends) if j > i]
+
+# Custom method which evaluates the function over a deterministic probe grid in one go to see if the function inputted is actually valid, error is raised if function is not valid.
+# Returns the regions of the probe grid where the function is NaN or infinite
+def custom_test_valid_function(f, bounds: tuple = None) -> list[tuple]:
+    x = custom_probe_grid(bounds)
+    with np.errstate(all="ignore"):
+        y = np.asarray(f(x))
+        if np.iscomplexobj(y):
+            if np.any(y.imag[np.isfinite(y)] != 0):
+                raise TypeError("Function has complex values")
+            y = y.real
+        y = np.broadcast_to(y.astype(float), x.shape) # Constant parts of an expression evaluate to a single value
+    return custom_mask_regions(x, ~np.isfinite(y))
 
 # Custom function which returns a tuple containing random rgb values for a random color
 def custom_get_random_color() -> tuple:
@@ -0,0 +1,123 @@
+import numpy as np
+from colorama import Fore, Style
+from .vector import Vector
+from .matrix import Matrix, identity_matrix
+from .vector_array import VectorArray
+
+# Store PI as a constant
+PI = np.pi
+
+"""Class representing a 2D affine transformation as a 3x3 matrix in homogeneous coordinates"""
+class AffineTransform:
+
+    # Constructor for an affine transformation, defaults to the identity transformation
+    def __init__(self, matrix: Matrix = None) -> None:
+        if matrix is None:
+            matrix = identity_matrix(3)
+        if not isinstance(matrix, Matrix):
+            raise TypeError(Fore.RED + "Input a valid matrix" + Style.RESET_ALL)
+        if matrix.d != (3, 3):
+            raise ValueError(Fore.RED + "An affine transformation must be a 3x3 matrix" + Style.RESET_ALL)
+        self.matrix = matrix.freeze() # Transformations are shared between previews, history and caches so their matrix must not change
+
+    # Creates a transformation which translates by a vector (u)
+    @classmethod
+    def translation(cls, u: Vector):
+        ux, uy = u.values
+        return cls(Matrix([[1, 0, ux]
+                          ,[0, 1, uy]
+                          ,[0, 0, 1]]))
+
+    # Creates a transformation which projects onto a vector (u)
+    @classmethod
+    def projection(cls, u: Vector):
+        ux, uy = u.values
+        n = u.dotProduct(u)
+        return cls(Matrix([[ux*ux/n, ux*uy/n, 0]
+                          ,[ux*uy/n, uy*uy/n, 0]
+                          ,[0, 0, 1]]))
+
+    # Creates a transformation which shears by some scale factors kx and ky
+    @classmethod
+    def shearing(cls, kx: float, ky: float):
+        return cls(Matrix([[1, kx, 0]
+                          ,[ky, 1, 0]
+                          ,[0, 0, 1]]))
+
+    # Creates a transformation which scales by some scale factors kx and ky
+    @classmethod
+    def scaling(cls, kx: float, ky: float):
+        return cls(Matrix([[kx, 0, 0]
+                          ,[0, ky, 0]
+                          ,[0, 0, 1]]))
+
+    # Creates a transformation which reflects in a given direction (u), using the formula: 2P - I
+    @classmethod
+    def reflection(cls, u: Vector):
+        return cls(cls.projection(u).matrix.scale(2).add(identity_matrix(3).scale(-1)))
+
+    # Creates a transformation which rotates about a given point (u) by an angle (θ)
+    @classmethod
+    def rotation(cls, u: Vector, angle: float):
+        θ = angle * PI/180
+        c, s = np.cos(θ), np.sin(θ)
+        ux, uy = u.values
+        return cls(Matrix([[c, s, ux - (c*ux + s*uy)]
+                          ,[-s, c, uy - (-s*ux + c*uy)]
+                          ,[0, 0, 1]]))
+
+    # Method to compose 2 transformations, the result applies (t) first and then this transformation
+    def compose(self, t):
+        if not isinstance(t, AffineTransform):
+            raise TypeError(Fore.RED + "Input a valid affine transformation" + Style.RESET_ALL)
+        return AffineTransform(self.matrix.multiply(t.matrix))
+
+    # Method to compute the transformation which undoes this transformation
+    def inverse(self):
+        return AffineTransform(self.matrix.inverse())
+
+    # Method to check whether the transformation leaves every point where it is
+    def isIdentity(self) -> bool:
+        return self.matrix == identity_matrix(3)
+
+    # Method to apply the transformation to whole arrays of x and y values at once
+    def apply(self, x, y) -> tuple[np.ndarray, np.ndarray]:
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        (a, b, tx), (c, d, ty), _ = self.matrix.as_array()
+        return a*x + b*y + tx, c*x + d*y + ty
+
+    # Method to apply the transformation to a single vector
+    def applyVector(self, v: Vector) -> Vector:
+        x, y = self.apply(*v.as_array())
+        return Vector([float(x), float(y)])
+
+    # Method to apply the transformation to every point of a 2D vector array
+    def applyVectorArray(self, va: VectorArray) -> VectorArray:
+        return VectorArray.fromXY(*self.apply(*va.xy()))
+
+    # Method for visual representation of the transformation
+    def toString(self, logging=False) -> None:
+        if logging:
+            print(Fore.LIGHTCYAN_EX + "The affine transformation is:" + Style.RESET_ALL)
+        self.matrix.toString()
+
+    # Method to test equality between 2 transformations
+    def __eq__(self, t):
+        if not isinstance(t, AffineTransform):
+            return False
+        return self.matrix == t.matrix
+
+    # Function which returns a hash value for the transformation object
+    def __hash__(self):
+        return hash(self.matrix)
+
+    # Detailed representation of the transformation object for debugging
+    def __repr__(self):
+        return f"AffineTransform(matrix={self.matrix.values!r})"
+
+# Function to compose a chain of transformations into a single transformation, the first transformation in the chain is applied first
+def compose_all(transforms) -> AffineTransform:
+    result = AffineTransform()
+    for t in transforms:
+        result = t.compose(result)
+    return result
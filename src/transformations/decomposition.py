@@ -0,0 +1,97 @@
+import warnings
+import numpy as np
+from colorama import Fore, Style
+
+# Ratio between the smallest and largest pivot below which a matrix is reported as ill-conditioned
+ILL_CONDITIONED_TOLERANCE = 1e-12
+
+"""Class containing the LU factorisation (with partial pivoting) of a square matrix, in the form: PA = LU"""
+class LUDecomposition:
+
+    # Constructor which factorises a square array in O(n^3), the factors are packed into a single array with L below the diagonal (unit diagonal implied) and U on and above it
+    def __init__(self, values: np.ndarray) -> None:
+        lu = np.array(values, dtype=float)
+        if lu.ndim != 2 or lu.shape[0] != lu.shape[1]:
+            raise ValueError(Fore.RED + "Invalid square matrix" + Style.RESET_ALL)
+
+        n = lu.shape[0]
+        piv = np.arange(n)
+        sign = 1
+        # Pivots smaller than this are treated as 0, scaled to the size of the entries in the matrix
+        tolerance = n * np.finfo(float).eps * (np.abs(lu).max() if lu.size else 0.0)
+        singular = False
+
+        for k in range(n):
+            p = k + int(np.argmax(np.abs(lu[k:, k])))
+            if p != k:
+                lu[[k, p]] = lu[[p, k]]
+                piv[[k, p]] = piv[[p, k]]
+                sign = -sign
+
+            pivot = lu[k, k]
+            if abs(pivot) <= tolerance:
+                singular = True  # Nothing left to eliminate in this column
+                continue
+
+            lu[k+1:, k] /= pivot
+            lu[k+1:, k+1:] -= np.outer(lu[k+1:, k], lu[k, k+1:])
+
+        self.n = n
+        self.lu = lu
+        self.piv = piv
+        self.sign = sign
+        self.singular = singular
+
+    # Method to return the unit lower triangular factor L
+    def lower(self):
+        from .matrix import Matrix
+        return Matrix._from_array(np.tril(self.lu, -1) + np.eye(self.n))
+
+    # Method to return the upper triangular factor U
+    def upper(self):
+        from .matrix import Matrix
+        return Matrix._from_array(np.triu(self.lu))
+
+    # Method to return the permutation matrix P which reorders the rows of the original matrix
+    def permutation(self):
+        from .matrix import Matrix
+        return Matrix._from_array(np.eye(self.n)[self.piv])
+
+    # Method to compute the determinant from the factors: det(A) = sign(P) * product of the diagonal of U
+    def determinant(self) -> float:
+        if self.singular:
+            return 0.0
+        return float(self.sign * np.prod(np.diag(self.lu)))
+
+    # Method to estimate how well conditioned the matrix is, as the ratio between its smallest and largest pivot (0 for a singular matrix, 1 at best)
+    def pivotRatio(self) -> float:
+        if self.singular:
+            return 0.0
+        pivots = np.abs(np.diag(self.lu))
+        return float(pivots.min() / pivots.max())
+
+    # Method to solve Ax = b for x without forming the inverse of A, b can be a single right hand side of shape (n,) or several of shape (n, k)
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        if self.singular:
+            raise ValueError(Fore.RED + "Singular matrix, the system has no unique solution" + Style.RESET_ALL)
+        if self.pivotRatio() < ILL_CONDITIONED_TOLERANCE:
+            warnings.warn("Matrix is ill-conditioned, the solution may be inaccurate", RuntimeWarning, stacklevel=2)
+
+        b = np.asarray(b, dtype=float)
+        if b.shape[0] != self.n:
+            raise ValueError(Fore.RED + "Right hand side should have the same number of rows as the matrix" + Style.RESET_ALL)
+
+        x = b[self.piv].copy()
+        # Forward substitution with the unit lower triangular factor
+        for i in range(1, self.n):
+            x[i] -= self.lu[i, :i] @ x[:i]
+        # Back substitution with the upper triangular factor
+        for i in range(self.n - 1, -1, -1):
+            x[i] = (x[i] - self.lu[i, i+1:] @ x[i+1:]) / self.lu[i, i]
+        return x
+
+    # Method to compute the inverse by solving against every column of the identity
+    def inverse(self) -> np.ndarray:
+        if self.singular:
+            raise ValueError(Fore.RED + "Singular matrix cannot be inverted" + Style.RESET_ALL)
+        return self.solve(np.eye(self.n))
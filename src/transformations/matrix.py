@@ -2,25 +2,73 @@ import math
 import numpy as np
 from colorama import Fore, Style
 from .vector import Vector
+from .vector_array import VectorArray
+from .decomposition import LUDecomposition
+from .value_list import ValueList
 from src.custom import custom_round
 
 """Class containing all methods to perform matrix operations"""
 class Matrix:
+    __slots__ = ("d", "_data", "_frozen", "_hash")
     
     # Constructor for a matrix 
-    def __init__(self, values: list[list[float]]) -> None:
+    def __init__(self, values: list[list[float]], frozen=False) -> None:
         self.__dimensionCheck(values)
-        d0, d1 = len(values), len(values[0])
-        self.d = (d0, d1)
-        self.values = values
+        data = np.array(values, dtype=float)
+        self.d = data.shape
+        self._data = data # content of the matrix, stored as a contiguous float64 array
+        self._frozen = False
+        self._hash = None
+        if frozen:
+            self.__freeze()
+
+    # Creates a matrix directly from a 2D float array without copying or validating it, used internally by operations which already guarantee a valid result
+    @classmethod
+    def _from_array(cls, data: np.ndarray):
+        m = object.__new__(cls)
+        m.d = data.shape
+        m._data = data
+        m._frozen = False
+        m._hash = None
+        return m
+
+    # Content of the matrix as a list of rows, assigning to its elements or rows changes the matrix
+    @property
+    def values(self) -> list[list[float]]:
+        return ValueList(self, self._data)
+
+    @values.setter
+    def values(self, values: list[list[float]]) -> None:
+        if self._frozen:
+            raise AttributeError(Fore.RED + "A frozen matrix cannot be modified" + Style.RESET_ALL)
+        self.__init__(values)
+
+    # Whether the matrix is frozen (immutable with a cached hash)
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    # Method to return a frozen copy of the matrix, which rejects mutation and only computes its hash once
+    def freeze(self):
+        if self._frozen:
+            return self
+        m = Matrix._from_array(self._data.copy())
+        m.__freeze()
+        return m
+
+    # Helper method to make the storage of a matrix read-only and cache its hash, only used on matrices which own their storage
+    def __freeze(self) -> None:
+        self._data.flags.writeable = False
+        self._frozen = True
+        self._hash = hash(tuple(tuple(row) for row in self._data.tolist()))
+
+    # Method to return a view of the content of the matrix without copying it
+    def as_array(self) -> np.ndarray:
+        return self._data.view()
     
     # Method to scale a matrix by some scalar k
     def scale(self, k: float):
-        values = []
-        for i in range(self.d[0]):
-            values.append(list(map(lambda x:k*x, self.values[i])))
-        
-        return Matrix(values)
+        return Matrix._from_array(k * self._data)
     
     # Method to add 2 matrices together
     def add(self, m):
@@ -28,40 +76,53 @@ class Matrix:
         if (self.d != m.d):
             raise ValueError(Fore.RED + "Both matrices should have the same dimensions" + Style.RESET_ALL)
         
-        values = []
-        for i in range(self.d[0]):
-            values.append([self.values[i][j] + m.values[i][j] for j in range(self.d[1])])
-        
-        return Matrix(values)
+        return Matrix._from_array(self._data + m._data)
     
-    # Method to multiply 2 matrices together
+    # Method to multiply a matrix by another matrix, by a vector (giving a vector) or by N column vectors at once, given as a vector array or a (d, N) array (giving the same type back)
     def multiply(self, m, logging=False):
-        self.__typeCheckMatrix(m)
-        if (self.d[1] != m.d[0]):
-            raise ValueError(Fore.RED + "Column's of first matrix should be the same as row's of second matrix" + Style.RESET_ALL)
-        
-        values, temp = [], []
-        vecArrA = [Vector(self.values[i]) for i in range(self.d[0])]
-        vecArrB = [Vector([row[i] for row in m.values]) for i in range(m.d[1])]
-            
-        for i in range(self.d[0]):
-            for j in range(m.d[1]):
-                temp.append(vecArrA[i].dotProduct(vecArrB[j]))
-            values.append(temp[:])
-            temp.clear()
+        if isinstance(m, VectorArray):
+            if (self.d[1] != m.d):
+                raise ValueError(Fore.RED + "Column's of the matrix should be the same as the dimensions of the vectors" + Style.RESET_ALL)
+            columns = self._data @ m.as_array()
+            result = VectorArray._from_array(columns)
+        elif isinstance(m, Vector):
+            if (self.d[1] != m.d):
+                raise ValueError(Fore.RED + "Column's of the matrix should be the same as the dimensions of the vector" + Style.RESET_ALL)
+            result = Vector._from_array(self._data @ m._data)
+        elif isinstance(m, np.ndarray):
+            if (m.ndim != 2 or self.d[1] != m.shape[0]):
+                raise ValueError(Fore.RED + "Column's of the matrix should be the same as the row's of the array" + Style.RESET_ALL)
+            columns = result = self._data @ m
+        else:
+            self.__typeCheckMatrix(m)
+            if (self.d[1] != m.d[0]):
+                raise ValueError(Fore.RED + "Column's of first matrix should be the same as row's of second matrix" + Style.RESET_ALL)
+            result = Matrix._from_array(self._data @ m._data)
 
-        result = Matrix(values)
         if logging:
             print(Fore.LIGHTCYAN_EX + "Result of multiplying both matrices is:" + Style.RESET_ALL)
-            result.toString()
+            if isinstance(m, (VectorArray, np.ndarray)):
+                Matrix._from_array(columns).toString() # The columns are shown as a matrix, as arrays of vectors have no representation of their own
+            else:
+                result.toString()
         
         return result
     
-    # Computes a matrix to some power k
+    # Computes a matrix to some power k using exponentiation by squaring, negative powers are taken of the inverse
     def power(self, k: int, logging=False):
-        result = self
-        for i in range(k - 1):
-            result = result.multiply(self)
+        if (self.d[0] != self.d[1]):
+            raise ValueError(Fore.RED + "Invalid square matrix" + Style.RESET_ALL)
+
+        base = self.inverse().as_array() if k < 0 else self._data
+        result = np.eye(self.d[0])
+        n = abs(k)
+        while n > 0:
+            if n & 1:
+                result = result @ base
+            n >>= 1
+            if n > 0:
+                base = base @ base
+        result = Matrix._from_array(result)
         
         if logging:
             print(Fore.LIGHTCYAN_EX + f"Result of the matrix raised to power {k} is:" + Style.RESET_ALL)
@@ -70,81 +131,95 @@ class Matrix:
         return result
 
 
-    # Method to compute the determinant of a square matrix
-    def determinant(self, first_call=True, logging=False) -> float:
+    # Method to compute the determinant of a square matrix, using the LU factorisation by default or cofactor expansion (method="cofactor") as an exact reference
+    def determinant(self, first_call=True, logging=False, method="lu") -> float:
         if (self.d[0] != self.d[1]):
             raise ValueError(Fore.RED + "Invalid square matrix" + Style.RESET_ALL)
+
+        match method:
+            case "lu":
+                determinant = self.lu().determinant()
+            case "cofactor":
+                determinant = self.__cofactorDeterminant()
+            case _:
+                raise ValueError(Fore.RED + f"Unknown determinant method: {method}" + Style.RESET_ALL)
         
+        if first_call and logging:
+            print(Fore.LIGHTCYAN_EX + f"The determinant of the matrix is:" + Style.RESET_ALL + f" {custom_round(determinant, 6)}")
+
+        return determinant
+
+    # Method to compute the determinant by recursive cofactor expansion along the first row, this is O(n!) so only suitable for small matrices
+    def __cofactorDeterminant(self) -> float:
+        if (self.d[0] == 1):
+            return float(self._data[0, 0])
+
         if (self.d[0] == 2 and self.d[1] == 2):
-            return (self.values[0][0] * self.values[1][1]) - (self.values[0][1] * self.values[1][0])
+            return float((self._data[0, 0] * self._data[1, 1]) - (self._data[0, 1] * self._data[1, 0]))
         
         determinant = 0
         for i in range(self.d[1]):
-            determinant += math.pow(-1, i) * self.values[0][i] * (self.minorMatrix(0,i).determinant(first_call=False))
-        
-        if first_call and logging:
-            print(Fore.LIGHTCYAN_EX + f"The determinant of the matrix is:" + Style.RESET_ALL + f" {custom_round(determinant, 6)}")
+            determinant += math.pow(-1, i) * self._data[0, i] * (self.minorMatrix(0,i).__cofactorDeterminant())
+        return float(determinant)
 
-        return determinant
+    # Method to compute the LU factorisation (with partial pivoting) of a square matrix, which can be reused for determinants, inverses and solving
+    def lu(self) -> LUDecomposition:
+        if (self.d[0] != self.d[1]):
+            raise ValueError(Fore.RED + "Invalid square matrix" + Style.RESET_ALL)
+        return LUDecomposition(self._data)
         
     # Method to determine the cofactor matrix when given the zero-based position of the first row
     def minorMatrix(self, p1: int, p2: int, logging=True):
-        values, temp = [], []
-    
-        for i in range(self.d[0]):
-            for j in range(self.d[1]):
-                if (i != p1) and (j != p2):
-                    temp.append(self.values[i][j])
-            if (len(temp) > 0):
-                values.append(temp[:])
-                temp.clear()
-            
-        result = Matrix(values)
-        return result
+        values = np.delete(np.delete(self._data, p1, axis=0), p2, axis=1)
+        if values.size == 0:
+            raise ValueError(Fore.RED + "Make sure your matrix has atleast 1 row" + Style.RESET_ALL)
+        return Matrix._from_array(values)
     
     # Method to transpose a matrix
     def transpose(self, logging=False):
-        values = [[row[j] for row in self.values] for j in range(self.d[1])]
-        result = Matrix(values)
+        result = Matrix._from_array(self._data.T.copy())
         if logging:
             print(Fore.LIGHTCYAN_EX + "The transpose of the matrix is:" + Style.RESET_ALL)
             result.toString()
         return result
     
-    # Method to compute the inverse of a square matrix using formula: A^-1 = 1/det(A) * Adj(A)
+    # Method to compute the inverse of a square matrix by pivoted elimination (LU factorisation) in O(n^3)
     def inverse(self, logging=False):
-        if (self.d[0] != self.d[1]):
-            raise ValueError(Fore.RED + "Invalid square matrix" + Style.RESET_ALL)
-        
-        determinant = self.determinant()
-        if (determinant == 0):
-            raise ValueError(Fore.RED + "Singular matrix cannot be inverted" + Style.RESET_ALL)
-        
-        cofactorArr = [[] for _ in range(self.d[0])]
-        for i in range(self.d[0]):
-            for j in range(self.d[1]):
-                posValue = (math.pow(-1, i+j) * self.minorMatrix(i,j).determinant())
-                cofactorArr[i].append(posValue)
-        
-        cofactorMatrix = Matrix(cofactorArr)
-        transposedMatrix = cofactorMatrix.transpose()
-        result = transposedMatrix.scale(1/determinant)
+        result = Matrix._from_array(self.lu().inverse())
         if logging:
             print(Fore.LIGHTCYAN_EX + f"The inverse of the matrix is:" + Style.RESET_ALL)
             result.toString()
 
         return result
+
+    # Method to solve the linear system Ax = b without forming the inverse, b can be a vector or a matrix with one right hand side per column
+    def solve(self, b, logging=False):
+        if isinstance(b, Vector):
+            result = Vector._from_array(self.lu().solve(b._data))
+        else:
+            self.__typeCheckMatrix(b)
+            result = Matrix._from_array(self.lu().solve(b._data))
+
+        if logging:
+            print(Fore.LIGHTCYAN_EX + f"The solution of the system is:" + Style.RESET_ALL)
+            result.toString()
+
+        return result
     
     # Method to turn a matrix into a vector if correct form is met
     def toVector(self):
         if self.d[1] != 1:
             raise ValueError(Fore.RED + "This matrix cannot be turned into a vector" + Style.RESET_ALL)
         
-        values = [row[0] for row in self.values]
-        return Vector(values)
+        return Vector._from_array(self._data[:, 0].copy())
     
     # Method containing all dimension checking for a matrix
     def __dimensionCheck(self, values: list[list[float]]) -> None:
+        if isinstance(values, np.ndarray):
+            if values.ndim != 2 or 0 in values.shape:
+                raise ValueError(Fore.RED + "Make sure your matrix has atleast 1 row and 1 column" + Style.RESET_ALL)
+            return
+
         d0 = len(values)
         if (d0 == 0):
             raise ValueError(Fore.RED + "Make sure your matrix has atleast 1 row" + Style.RESET_ALL)
@@ -153,8 +228,6 @@ class Matrix:
         if (d1 == 0):
             raise ValueError(Fore.RED + "Make sure your matrix has atleast 1 column" + Style.RESET_ALL)
         
-        d = (d0, d1)
-
         if not (isinstance(values, list) and all(isinstance(row, list) for row in values)):
             raise TypeError(Fore.RED + "Matrix inputted in the incorrect format" + Style.RESET_ALL)
         
@@ -168,7 +241,7 @@ class Matrix:
     
     # Method for visual representation of a matrix
     def toString(self, logging=False) -> None:
-        stringVal = [list(map(lambda x:str(custom_round(x, 6)), self.values[i])) for i in range(self.d[0])]
+        stringVal = [list(map(lambda x:str(custom_round(x, 6)), row)) for row in self.values]
         joinedStringVal = [" ".join(row) for row in stringVal]
         maxLen = len(sorted(joinedStringVal, key=len, reverse=False)[-1])
 
@@ -179,28 +252,26 @@ class Matrix:
             print(f"| {joinedStringVal[i]}" + (" " * (maxLen - len(joinedStringVal[i]))) + " |")
         print("") 
 
-         # Method to test equality between 2 matrices
+    # Method to test equality between 2 matrices
     def __eq__(self, m):
         try:
             self.__typeCheckMatrix(m)
-            if (self.d == m.d) and (np.allclose(self.values, m.values)):
-                return True
-            return False
+            return (self.d == m.d) and bool(np.allclose(self._data, m._data))
         except TypeError:
             return False
         
     #Function which returns a hash value for the matrix object
     def __hash__(self):
-        return hash(tuple(tuple(row) for row in self.values))
+        if self._hash is not None:
+            return self._hash
+        return hash(tuple(tuple(row) for row in self._data.tolist()))
      
     # Detailed representation of the matrix object for debugging
     def __repr__(self):
         return f"Matrix(dimensions={self.d!r}, values={self.values!r})"
 
 def identity_matrix(size: int) -> Matrix:
-    content = [[1 if i == j else 0 for j in range(size)] for i in range(size)]  
-    return Matrix(content)
-    print(content)
+    return Matrix._from_array(np.eye(size))
 
 def matrix_main():
     matA = Matrix([[2,1,3,0],[1,2,1,3],[3,1,2,2],[5,2,7,3]])
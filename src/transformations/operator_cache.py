@@ -0,0 +1,67 @@
+from collections import OrderedDict, namedtuple
+from .vector import Vector
+from .affine import AffineTransform
+
+"""Cache of ready built transformation operators, keyed by the kind of transformation and its parameters rather than by the points being transformed"""
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Maps each kind of transformation onto the constructor which builds its operator
+OPERATOR_BUILDERS = {
+    "translation": AffineTransform.translation,
+    "projection": AffineTransform.projection,
+    "shearing": AffineTransform.shearing,
+    "scaling": AffineTransform.scaling,
+    "reflection": AffineTransform.reflection,
+    "rotation": AffineTransform.rotation,
+}
+
+# Helper function to turn the parameters of a transformation into a hashable key
+def _param_key(param):
+    if isinstance(param, Vector):
+        return tuple(float(value) for value in param.values)
+    return float(param)
+
+"""Class containing a bounded least recently used cache of transformation operators"""
+class OperatorCache:
+
+    # Constructor for the cache, a maxsize of None means the cache is unbounded
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("Cache size should be atleast 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__operators = OrderedDict()
+
+    # Method to retrieve the operator for a kind of transformation with the given parameters, building it if it isn't cached yet
+    def get(self, kind: str, *params) -> AffineTransform:
+        key = (kind, *(_param_key(param) for param in params))
+        operator = self.__operators.get(key)
+        if operator is not None:
+            self.hits += 1
+            self.__operators.move_to_end(key)
+            return operator
+
+        builder = OPERATOR_BUILDERS.get(kind)
+        if builder is None:
+            raise ValueError(f"Unknown transformation: {kind}")
+        self.misses += 1
+        operator = builder(*params)
+        self.__operators[key] = operator
+        if self.maxsize is not None and len(self.__operators) > self.maxsize:
+            self.__operators.popitem(last=False)  # Evict the least recently used operator
+        return operator
+
+    # Method to return statistics about the cache in the same form as functools.lru_cache
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.__operators))
+
+    # Method to empty the cache and reset its statistics
+    def cache_clear(self) -> None:
+        self.__operators.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__operators)
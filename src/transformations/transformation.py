@@ -1,68 +1,91 @@
-from functools import lru_cache
 import numpy as np
 from .vector import Vector
-from .matrix import Matrix
+from .vector_array import VectorArray
+from .affine import AffineTransform
+from .operator_cache import OperatorCache
 
 # Store PI as a constant
 PI = np.pi
 CACHE_SIZE = 1024
 
-@lru_cache(maxsize=CACHE_SIZE)
+# Cache of the operators built for each transformation, shared by every point being transformed
+OPERATOR_CACHE = OperatorCache(maxsize=CACHE_SIZE)
+
+# Helper function to apply an operator to a single vector, or to every point of a vector array at once
+def _apply(operator: AffineTransform, v):
+    if isinstance(v, VectorArray):
+        return operator.applyVectorArray(v)
+    return operator.applyVector(v)
+
+# Helper function to check if every vector is 2D, only 2D vectors have cached operators. Translation, projection and reflection work on vectors of any dimensions directly
+def _is2D(*vectors) -> bool:
+    return all(v.d == 2 for v in vectors)
+
+# Helper function to project a vector (v) of any dimensions onto another vector (u), or every point of a vector array at once
+def _project(v, u: Vector):
+    k = v.dotProduct(u)/u.dotProduct(u)
+    if isinstance(v, VectorArray):
+        return VectorArray._from_array(np.outer(u.as_array(), k))
+    return u.scale(k)
+
 # Function to translate a vector (v) by another vector (u)
-def translation(v: Vector, u: Vector) -> Vector:
-    return v.add(u)
+def translation(v: Vector | VectorArray, u: Vector) -> Vector | VectorArray:
+    if not _is2D(v, u):
+        return v.add(u)
+    return _apply(OPERATOR_CACHE.get("translation", u), v)
 
-@lru_cache(maxsize=CACHE_SIZE)
 # Function to project a vector (v) onto another vector (u)
-def projection(v: Vector, u: Vector) -> Vector:
-    u_Matrix = u.toMatrix()
-    v_Matrix = v.toMatrix()
-    projection_Matrix = u_Matrix.multiply(u_Matrix.transpose()).scale(1/u.dotProduct(u))
-    projected_Vector = projection_Matrix.multiply(v_Matrix).toVector()
-    return projected_Vector
+def projection(v: Vector | VectorArray, u: Vector) -> Vector | VectorArray:
+    if not _is2D(v, u):
+        return _project(v, u)
+    return _apply(OPERATOR_CACHE.get("projection", u), v)
 
-@lru_cache(maxsize=CACHE_SIZE)
 # Function to shear a vector by some scale factors kx and ky
-def shearing(v: Vector, kx: float, ky:float) -> Vector:
-    shearing_Matrix = Matrix([[1, kx]
-                             ,[ky, 1]])
-    v_Matrix = v.toMatrix()
-    sheared_Vector = shearing_Matrix.multiply(v_Matrix).toVector()
-    return sheared_Vector
+def shearing(v: Vector | VectorArray, kx: float, ky:float) -> Vector | VectorArray:
+    return _apply(OPERATOR_CACHE.get("shearing", kx, ky), v)
 
-@lru_cache(maxsize=CACHE_SIZE)
 # Function to scale a vector by some scale factors kx and ky
-def scaling(v: Vector, kx: float, ky: float) -> Vector:
-    scaling_Matrix = Matrix([[kx, 0]
-                            ,[0, ky]])
-    v_Matrix = v.toMatrix()
-    scaled_Vector = scaling_Matrix.multiply(v_Matrix).toVector()
-    return scaled_Vector
+def scaling(v: Vector | VectorArray, kx: float, ky: float) -> Vector | VectorArray:
+    return _apply(OPERATOR_CACHE.get("scaling", kx, ky), v)
 
-@lru_cache(maxsize=CACHE_SIZE)
 # Function to reflect a vector in a given direction (u)
-def reflection(v: Vector, u: Vector) -> Vector:
-    projected_vector = u.scale(v.dotProduct(u)/u.dotProduct(u))
-    reflected_Vector = projected_vector.scale(2).add(v.scale(-1))
-    return reflected_Vector
+def reflection(v: Vector | VectorArray, u: Vector) -> Vector | VectorArray:
+    if not _is2D(v, u):
+        return _project(v, u).scale(2).add(v.scale(-1))
+    return _apply(OPERATOR_CACHE.get("reflection", u), v)
 
-@lru_cache(maxsize=CACHE_SIZE)
 # Function to rotate a vector about a given point (u) by an angle (θ)
-def rotation(v: Vector, u: Vector, angle: float) -> Vector:
-    θ = angle * PI/180
-    rotation_Matrix = Matrix([[np.cos(θ), np.sin(θ)]
-                             ,[-np.sin(θ), np.cos(θ)]])
-    transformed_v = v.add(u.scale(-1))
-    transformed_v_Matrix = transformed_v.toMatrix()
-    rotated_Vector = rotation_Matrix.multiply(transformed_v_Matrix).toVector().add(u)
-    return rotated_Vector
+def rotation(v: Vector | VectorArray, u: Vector, angle: float) -> Vector | VectorArray:
+    return _apply(OPERATOR_CACHE.get("rotation", u, angle), v)
+
+# Maps each transformation onto the kind of operator it is built from
+TRANSFORMATION_KINDS = {
+    translation: "translation",
+    projection: "projection",
+    shearing: "shearing",
+    scaling: "scaling",
+    reflection: "reflection",
+    rotation: "rotation",
+}
+
+# Function to retrieve the affine transformation equivalent to a transformation with the given parameters from the operator cache
+def affine_transform(t, *args) -> AffineTransform:
+    kind = TRANSFORMATION_KINDS.get(t)
+    if kind is None:
+        raise ValueError("Transformation has no equivalent affine transformation")
+    return OPERATOR_CACHE.get(kind, *args)
+
+# Helper function to transform whole arrays of x and y values at once through the equivalent affine transformation, falls back to transforming point by point for transformations without one
+def transform_values(x, y, t, *args) -> tuple[np.ndarray, np.ndarray]:
+    if t in TRANSFORMATION_KINDS:
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if x.shape != y.shape:
+            raise ValueError("x and y values should have the same shape")
+        return affine_transform(t, *args).apply(x, y)
 
-# Helper function to transform_function to help perform transformations depending on the type of transformation
-def transform_values(x, y, t, *args):
     x_transformed, y_transformed = [], []
     for xi, yi in zip(x, y):
         v_projected = t(Vector([xi, yi]), *args)
         x_transformed.append(v_projected.values[0])
         y_transformed.append(v_projected.values[1])
-    return x_transformed, y_transformed
-
+    return np.array(x_transformed, dtype=float), np.array(y_transformed, dtype=float)
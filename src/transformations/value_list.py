@@ -0,0 +1,37 @@
+import numpy as np
+from colorama import Fore, Style
+
+"""List of the values of a vector or matrix which writes element assignments back to the array it was read from, so v.values[i] = k and m.values[i][j] = k keep
+changing the object they were read from. Operations which would change the number of values are rejected since the object couldn't follow them"""
+class ValueList(list):
+    __slots__ = ("_owner", "_array")
+
+    # Constructor for the values of an array owned by a vector or matrix, rows of a 2D array are value lists themselves
+    def __init__(self, owner, array: np.ndarray) -> None:
+        super().__init__(self.__items(owner, array))
+        self._owner = owner
+        self._array = array
+
+    # Helper method to get the items of the list for an array
+    @staticmethod
+    def __items(owner, array: np.ndarray) -> list:
+        if array.ndim > 1:
+            return [ValueList(owner, row) for row in array]
+        return array.tolist()
+
+    # Method to write an assignment to one or more values back to the array
+    def __setitem__(self, index, value) -> None:
+        if self._owner.frozen:
+            raise AttributeError(Fore.RED + f"A frozen {type(self._owner).__name__.lower()} cannot be modified" + Style.RESET_ALL)
+        self._array[index] = value
+        super().__setitem__(slice(None), self.__items(self._owner, self._array))
+
+    # Copies and pickles of the values are plain lists, detached from the array
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    # Helper method for list operations which can't be written back to the array
+    def __resize(self, *args, **kwargs):
+        raise TypeError(Fore.RED + f"The values of a {type(self._owner).__name__.lower()} can only be changed by assigning to them" + Style.RESET_ALL)
+
+    __delitem__ = append = extend = insert = pop = remove = clear = sort = reverse = __iadd__ = __imul__ = __resize
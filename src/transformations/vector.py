@@ -2,21 +2,72 @@ import math
 import numpy as np
 from colorama import Fore, Style
 from src.custom import custom_round
+from .value_list import ValueList
 
 """Class containing all methods to perform vector operations"""
 class Vector:
-    
+    __slots__ = ("d", "_data", "_frozen", "_hash")
+
     # Constructor for vector object
-    def __init__(self, values: list[float]) -> None:
-        if len(values) < 1:
+    def __init__(self, values: list[float], frozen=False) -> None:
+        data = np.array(values, dtype=float)
+        if data.ndim != 1 or len(data) < 1:
             raise ValueError(Fore.RED + "Vector cannot have 0 dimensions" + Style.RESET_ALL)
 
-        self.d = len(values) # dimensions of the vector
-        self.values = values # content of the vector
+        self.d = len(data) # dimensions of the vector
+        self._data = data # content of the vector, stored as a contiguous float64 array
+        self._frozen = False
+        self._hash = None
+        if frozen:
+            self.__freeze()
+
+    # Creates a vector directly from a 1D float array without copying or validating it, used internally by operations which already guarantee a valid result
+    @classmethod
+    def _from_array(cls, data: np.ndarray):
+        v = object.__new__(cls)
+        v.d = len(data)
+        v._data = data
+        v._frozen = False
+        v._hash = None
+        return v
+
+    # Content of the vector as a list of floats, assigning to its elements changes the vector
+    @property
+    def values(self) -> list[float]:
+        return ValueList(self, self._data)
+
+    @values.setter
+    def values(self, values: list[float]) -> None:
+        if self._frozen:
+            raise AttributeError(Fore.RED + "A frozen vector cannot be modified" + Style.RESET_ALL)
+        self.__init__(values)
+
+    # Whether the vector is frozen (immutable with a cached hash)
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    # Method to return a frozen copy of the vector, which rejects mutation and only computes its hash once
+    def freeze(self):
+        if self._frozen:
+            return self
+        v = Vector._from_array(self._data.copy())
+        v.__freeze()
+        return v
+
+    # Helper method to make the storage of a vector read-only and cache its hash, only used on vectors which own their storage
+    def __freeze(self) -> None:
+        self._data.flags.writeable = False
+        self._frozen = True
+        self._hash = hash(tuple(self._data.tolist()))
+
+    # Method to return a view of the content of the vector without copying it
+    def as_array(self) -> np.ndarray:
+        return self._data.view()
 
     # Method for scaling a vector by some scalar k
     def scale(self, k: float, logging=False):
-        result = Vector(list(map(lambda x: k*x, self.values)))
+        result = Vector._from_array(k * self._data)
         if logging:
             print(Fore.LIGHTCYAN_EX + f"The vector scaled by scale factor {k} is:" + Style.RESET_ALL)
             result.toString(logging=False)
@@ -25,8 +76,7 @@ class Vector:
     # Method to add 2 vectors together
     def add(self, v, logging=False):
         self.__constraintCheck(v)
-        values = [self.values[i] + v.values[i] for i in range(self.d)]
-        result = Vector(values)
+        result = Vector._from_array(self._data + v._data)
         if logging:
             print(Fore.LIGHTCYAN_EX + "The addition of the 2 vectors is:" + Style.RESET_ALL)
             result.toString(logging=False)
@@ -34,8 +84,7 @@ class Vector:
     
     # Method to find the size of a vector
     def magnitude(self, logging=False) -> float:
-        squares = list(map(lambda x: x*x, self.values))
-        result = math.sqrt(sum(squares))
+        result = math.sqrt(float(self._data @ self._data))
         if logging:
             print(Fore.LIGHTCYAN_EX + f"The magnitude of the vector is:" + Style.RESET_ALL + f" {custom_round(result, 6)}")
         return result
@@ -51,11 +100,9 @@ class Vector:
     # Method to compute the dot product of 2 vectors
     def dotProduct(self, v, logging=False) -> float:
         self.__constraintCheck(v)
-        result = 0
-        for i in range(self.d):
-            result += self.values[i] * v.values[i]
+        result = float(self._data @ v._data)
         if logging:
-            print(Fore.LIGHTCYAN_EX + f"The dot product of the 2 vectors is:" + Style.RESET_ALL + + f" {custom_round(result, 6)}")
+            print(Fore.LIGHTCYAN_EX + f"The dot product of the 2 vectors is:" + Style.RESET_ALL + f" {custom_round(result, 6)}")
         return result
     
     # Method to compute the angle between 2 vectors in degrees
@@ -69,8 +116,7 @@ class Vector:
     # Method to represent a vector as a matrix 
     def toMatrix(self):
         from .matrix import Matrix
-        values = [[row] for row in self.values]
-        return Matrix(values)
+        return Matrix._from_array(self._data.reshape(self.d, 1).copy())
     
     # Constraint checks on 
     def __constraintCheck(self, v):
@@ -94,15 +140,15 @@ class Vector:
     def __eq__(self, v):
         try:
             self.__constraintCheck(v)
-            if (self.d == v.d) and (np.allclose(self.values, v.values)):
-                return True
-            return False
-        except ValueError or TypeError:
+            return bool(np.allclose(self._data, v._data))
+        except (ValueError, TypeError):
             return False
 
     # Function which returns a hash value for the vector object 
     def __hash__(self):
-        return hash(tuple(self.values))
+        if self._hash is not None:
+            return self._hash
+        return hash(tuple(self._data.tolist()))
 
     # Detailed representation of the vector object for debugging
     def __repr__(self):
@@ -0,0 +1,118 @@
+import numpy as np
+from colorama import Fore, Style
+from .vector import Vector
+
+"""Class containing vectorised vector operations on N points at once, stored as a single (d, N) array with one column per point"""
+class VectorArray:
+    __slots__ = ("d", "n", "_data")
+
+    # Constructor for a vector array from a (d, N) array like of values
+    def __init__(self, values) -> None:
+        data = np.array(values, dtype=float)
+        if data.ndim != 2 or data.shape[0] < 1:
+            raise ValueError(Fore.RED + "Vector array should be a (d, N) array with atleast 1 dimension" + Style.RESET_ALL)
+
+        self.d, self.n = data.shape # dimensions of each vector and number of vectors
+        self._data = data
+
+    # Creates a vector array directly from a (d, N) float array without copying or validating it
+    @classmethod
+    def _from_array(cls, data: np.ndarray):
+        va = object.__new__(cls)
+        va.d, va.n = data.shape
+        va._data = data
+        return va
+
+    # Creates a 2D vector array from separate arrays of x and y values
+    @classmethod
+    def fromXY(cls, x, y):
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError(Fore.RED + "x and y values should be 1D arrays of the same length" + Style.RESET_ALL)
+        return cls._from_array(np.vstack((x, y)))
+
+    # Creates a vector array from a list of vectors
+    @classmethod
+    def fromVectors(cls, vectors: list[Vector]):
+        if len(vectors) == 0 or any(v.d != vectors[0].d for v in vectors):
+            raise ValueError(Fore.RED + "Vectors should all have the same dimensions" + Style.RESET_ALL)
+        return cls._from_array(np.column_stack([v.as_array() for v in vectors]))
+
+    # Content of the vector array as a new list of rows, one row per dimension (changing it leaves the vector array unchanged, write through as_array instead)
+    @property
+    def values(self) -> list[list[float]]:
+        return self._data.tolist()
+
+    # Method to return a view of the (d, N) content without copying it
+    def as_array(self) -> np.ndarray:
+        return self._data.view()
+
+    # Method to return the x and y components of a 2D vector array
+    def xy(self) -> tuple[np.ndarray, np.ndarray]:
+        if self.d != 2:
+            raise ValueError(Fore.RED + "Only 2D vector arrays have x and y components" + Style.RESET_ALL)
+        return self._data[0], self._data[1]
+
+    # Method for scaling every vector by some scalar k, or by one scalar per vector when k is an array of length N
+    def scale(self, k):
+        return VectorArray._from_array(self._data * np.asarray(k, dtype=float))
+
+    # Method to add another vector array (point by point) or a single vector (to every point)
+    def add(self, v):
+        return VectorArray._from_array(self._data + self.__operand(v))
+
+    # Method to compute the dot product of every vector with the matching vector of another vector array, or with a single vector
+    def dotProduct(self, v) -> np.ndarray:
+        return np.einsum("ij,ij->j", self._data, np.broadcast_to(self.__operand(v), self._data.shape))
+
+    # Method to find the size of every vector
+    def magnitude(self) -> np.ndarray:
+        return np.sqrt(np.einsum("ij,ij->j", self._data, self._data))
+
+    # Method to return every vector normalized
+    def normalize(self):
+        magnitude = self.magnitude()
+        if np.any(magnitude == 0):
+            raise ZeroDivisionError(Fore.RED + "Cannot normalize a zero vector" + Style.RESET_ALL)
+        return VectorArray._from_array(self._data / magnitude)
+
+    # Method to compute the angle in degrees between every vector and the matching vector of another vector array, or a single vector
+    def angle(self, v) -> np.ndarray:
+        other = VectorArray._from_array(np.broadcast_to(self.__operand(v), self._data.shape))
+        cosine = self.dotProduct(other) / (self.magnitude() * other.magnitude())
+        return np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+
+    # Method to apply a (d x d) matrix to every vector
+    def transform(self, m):
+        return m.multiply(self)
+
+    # Helper method to turn the other operand into an array which broadcasts against the content of this vector array
+    def __operand(self, v) -> np.ndarray:
+        if isinstance(v, VectorArray):
+            if v._data.shape != self._data.shape:
+                raise ValueError(Fore.RED + "Vector arrays don't have the same shape." + Style.RESET_ALL)
+            return v._data
+        if isinstance(v, Vector):
+            if v.d != self.d:
+                raise ValueError(Fore.RED + "Vectors don't have the same dimensions." + Style.RESET_ALL)
+            return v.as_array()[:, np.newaxis]
+        raise TypeError(Fore.RED + "You must input a vector or a vector array." + Style.RESET_ALL)
+
+    def __len__(self):
+        return self.n
+
+    # Returns the vector at a given position
+    def __getitem__(self, i: int) -> Vector:
+        return Vector._from_array(self._data[:, i].copy())
+
+    # Method to test equality between 2 vector arrays
+    def __eq__(self, v):
+        if not isinstance(v, VectorArray):
+            return False
+        return self._data.shape == v._data.shape and bool(np.allclose(self._data, v._data))
+
+    __hash__ = None
+
+    # Detailed representation of the vector array object for debugging
+    def __repr__(self):
+        return f"VectorArray(dimensions={self.d!r}, size={self.n!r})"
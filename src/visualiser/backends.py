@@ -0,0 +1,153 @@
+import time
+import functools
+import numpy as np
+from collections import namedtuple
+
+"""Registry of the backends compiled user functions can be evaluated with, and the micro-benchmark used to pick the fastest one for each expression"""
+
+CHUNK_SIZE = 4096 # Number of points the chunked backend evaluates at a time, small enough for the temporaries of an expression to stay in cache
+BENCHMARK_POINTS = 8192 # Size of the sample array each backend is timed on
+BENCHMARK_RANGE = 100
+BENCHMARK_REPEATS = 3
+SOURCE_HEADER = "def _lambdifygenerated(x):"
+
+# Result of benchmarking the backends for an expression, timings maps each backend name to its best time in seconds (None if it failed or gave different values)
+BackendInfo = namedtuple("BackendInfo", ["expression", "backend", "timings"])
+
+# Imports, defaults and name translations sympy.lambdify uses for each module, mirrored here so generated source can be rebuilt without sympy
+MODULE_NAMESPACES = {
+    "numpy": ("import numpy; from numpy import *; from numpy.linalg import *", {"I": 1j}, {"Heaviside": "heaviside"}),
+    "math": ("from math import *", {}, {"ceiling": "ceil", "E": "e", "ln": "log"}),
+}
+
+# Function returning the namespace sympy.lambdify executes its generated source in, for a given module
+@functools.cache
+def module_namespace(module: str = "numpy") -> dict:
+    imports, defaults, translations = MODULE_NAMESPACES[module]
+    namespace = dict(defaults)
+    exec(imports, namespace)
+    for sympy_name, module_name in translations.items():
+        namespace[sympy_name] = namespace[module_name]
+    return namespace
+
+# Function to turn generated source back into a callable without going through sympy
+def build_function(source: str, module: str = "numpy"):
+    if not source.startswith(SOURCE_HEADER):
+        raise ValueError("Source was not generated by sympy.lambdify")
+    namespace = dict(module_namespace(module))
+    exec(source, namespace)
+    return namespace["_lambdifygenerated"]
+
+"""Backend evaluating the numpy source of an expression on the whole array at once"""
+class NumpyBackend:
+    name = "numpy"
+    module = "numpy" # Module sympy.lambdify generates the source for
+    max_points = None # Largest input the backend is benchmarked on, None for any size
+
+    # Method to build a function taking an array of x values from the generated source
+    def build(self, source: str):
+        return build_function(source, self.module)
+
+"""Backend evaluating the numpy source in fixed size chunks written into a single preallocated output array, so temporaries stay small"""
+class ChunkedBackend(NumpyBackend):
+    name = "chunked"
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def build(self, source: str):
+        func = super().build(source)
+        chunk_size = self.chunk_size
+
+        def chunked(x, out=None):
+            x = np.asarray(x, dtype=float)
+            if x.ndim != 1 or x.size <= chunk_size:
+                return func(x)
+            if out is None:
+                out = np.empty(x.shape)
+            for start in range(0, x.size, chunk_size):
+                out[start:start+chunk_size] = func(x[start:start+chunk_size])
+            return out
+        return chunked
+
+"""Backend evaluating the math module source one scalar at a time, which avoids numpy's per call overhead for very small inputs"""
+class MathBackend:
+    name = "math"
+    module = "math"
+    max_points = 1024 # Past this many points the scalar loop can't beat numpy, so its source isn't generated to benchmark it
+
+    def build(self, source: str):
+        func = build_function(source, self.module)
+
+        def scalar(value: float) -> float:
+            try:
+                return func(value)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                return np.nan # Outside of the domain of the function, as numpy would give
+
+        def elementwise(x):
+            x = np.asarray(x, dtype=float)
+            return np.fromiter((scalar(value) for value in x.ravel().tolist()), dtype=float, count=x.size).reshape(x.shape)
+        return elementwise
+
+BACKENDS = {}
+
+# Function to add a backend to the registry, replacing any backend with the same name
+def register_backend(backend) -> None:
+    BACKENDS[backend.name] = backend
+
+register_backend(NumpyBackend())
+register_backend(ChunkedBackend())
+register_backend(MathBackend())
+
+# Function returning the modules sympy.lambdify needs to generate source for, to build every registered backend
+def backend_modules() -> list[str]:
+    return list(dict.fromkeys(backend.module for backend in BACKENDS.values()))
+
+# Function returning the array of x values the backends are benchmarked on
+def benchmark_sample(points: int = BENCHMARK_POINTS) -> np.ndarray:
+    return np.linspace(-BENCHMARK_RANGE, BENCHMARK_RANGE, points)
+
+# Helper function to check if two arrays of y values agree, NaN and infinite values only need to be in the same places
+def _agrees(y: np.ndarray, reference: np.ndarray) -> bool:
+    finite = np.isfinite(reference)
+    return np.array_equal(finite, np.isfinite(y)) and np.allclose(y[finite], reference[finite])
+
+# Function to time every registered backend that can be built from the sources (keyed by module) and return (name, function, timings) of the fastest.
+# Sources missing for a module are only generated (by generate, which takes the module and returns its source, and are added to sources) when a backend of that module is benchmarked.
+# Backends which fail, give different values to the first backend that succeeds or aren't benchmarked on samples of this size are not chosen
+def select_backend(sources: dict, sample: np.ndarray = None, repeats: int = BENCHMARK_REPEATS, generate=None) -> tuple:
+    if sample is None:
+        sample = benchmark_sample()
+    timings, functions = {}, {}
+    reference = None
+    for name, backend in BACKENDS.items():
+        timings[name] = None
+        if backend.max_points is not None and sample.size > backend.max_points:
+            continue
+        try:
+            if backend.module not in sources:
+                if generate is None:
+                    continue
+                sources[backend.module] = generate(backend.module)
+            func = backend.build(sources[backend.module])
+            with np.errstate(all="ignore"):
+                y = np.broadcast_to(np.asarray(func(sample), dtype=float), sample.shape)
+                best = float("inf")
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    func(sample)
+                    best = min(best, time.perf_counter() - start)
+        except Exception:
+            continue
+        if reference is None:
+            reference = y
+        elif not _agrees(y, reference):
+            continue
+        timings[name] = best
+        functions[name] = func
+
+    if not functions:
+        raise ValueError("No backend could evaluate the function")
+    name = min(functions, key=timings.get)
+    return name, functions[name], timings
@@ -0,0 +1,47 @@
+"""Script to redraw only the artists which change while a slider is dragged, by restoring a cached image of everything else and drawing the animated artists over it"""
+
+"""Class which keeps a cached background of the figure and blits a set of animated artists over it. The background is captured again on every full draw of the figure"""
+class BlitManager:
+
+    # Constructor, the artists (lines, markers or whole axes) are marked as animated so full draws of the figure leave them out of the background
+    def __init__(self, canvas, animated_artists=()) -> None:
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.background = None
+        self.artists = []
+        for artist in animated_artists:
+            self.add_artist(artist)
+        self.cid = canvas.mpl_connect("draw_event", self.on_draw)
+
+    # Method to add an artist which is redrawn on every update
+    def add_artist(self, artist) -> None:
+        if artist.figure is not self.figure:
+            raise ValueError("Artist must belong to the figure being blitted")
+        artist.set_animated(True)
+        self.artists.append(artist)
+
+    # Callback for every full draw of the figure, which captures the new background and draws the animated artists over it
+    def on_draw(self, event) -> None:
+        if event is not None and event.canvas is not self.canvas:
+            raise RuntimeError("Draw event from a different canvas")
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.__draw_animated()
+
+    # Method to throw away the cached background when something in it changes (resizing, zooming or toggling a function) and redraw the whole figure
+    def invalidate(self, _=None) -> None:
+        self.background = None
+        self.canvas.draw_idle()
+
+    # Method to show the current state of the animated artists, only the animated artists are drawn unless there is no background yet
+    def update(self) -> None:
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.__draw_animated()
+        self.canvas.blit(self.figure.bbox)
+        self.canvas.flush_events()
+
+    def __draw_animated(self) -> None:
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
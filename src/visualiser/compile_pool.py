@@ -0,0 +1,132 @@
+import os
+import time
+import pickle
+import threading
+import multiprocessing
+import multiprocessing.forkserver
+from multiprocessing.connection import wait
+from .expression_cache import compile_expression, compile_fused
+
+"""Script to compile user inputted expressions in worker processes, so that all of them compile concurrently and an expression which never finishes can be killed"""
+
+COMPILE_TIMEOUT = 5.0 # Seconds each expression is given to compile before its worker is killed
+MAX_WORKERS = os.cpu_count() or 1
+POLL_INTERVAL = 20 # Milliseconds between the GUI thread checking on the workers
+
+# Error returned for an expression which didn't finish compiling within the timeout
+class CompileTimeoutError(TimeoutError):
+    pass
+
+# Function returning the multiprocessing context used for the workers. Where available a fork server with sympy already imported is used, so starting a worker doesn't pay for importing sympy again
+def _context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["sympy", "numpy"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+# Function to start the fork server on a background thread, so the first worker started from the GUI thread doesn't wait for the server to import sympy
+def warm_up() -> None:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        _context() # Sets what the server preloads
+        threading.Thread(target=multiprocessing.forkserver.ensure_running, name="forkserver-warm-up", daemon=True).start()
+
+# Function run in each worker process, sends back either the result of compile (the compiled expression by default) or the error raised by it
+def _compile_worker(user_input, connection, compile=compile_expression) -> None:
+    try:
+        connection.send(compile(user_input))
+    except Exception as e:
+        connection.send(e if _picklable(e) else ValueError(repr(e)))
+    finally:
+        connection.close()
+
+# Helper function to check if an error can be sent back to the main process
+def _picklable(e: Exception) -> bool:
+    try:
+        pickle.loads(pickle.dumps(e))
+        return True
+    except Exception:
+        return False
+
+"""Class compiling several expressions concurrently without blocking, giving for each one either its (expression, source) (or whatever compile returns) or the error it failed with.
+Nothing waits for the workers: poll is called (such as from a Tk after callback) to collect finished results, kill workers which ran out of time and start waiting ones"""
+class CompileJob:
+
+    # Constructor which starts the first workers straight away, each is given timeout seconds once it starts
+    def __init__(self, user_inputs: list, timeout: float = COMPILE_TIMEOUT, max_workers: int = MAX_WORKERS, compile=compile_expression) -> None:
+        self.user_inputs = list(user_inputs)
+        self.compile = compile # Module level function run on each input in a worker
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.results = [None] * len(self.user_inputs)
+        self.__context = _context()
+        self.__pending = list(enumerate(self.user_inputs))
+        self.__running = {} # Maps the receiving end of each worker's pipe to (index, process, deadline)
+        self.__start_workers()
+
+    # Method to check if every expression has a result
+    def done(self) -> bool:
+        return not self.__pending and not self.__running
+
+    # Method to collect the results of finished workers, waiting at most wait_time seconds for one, and to kill every worker which has run out of time.
+    # Returns whether every expression has a result
+    def poll(self, wait_time: float = 0.0) -> bool:
+        if self.done():
+            return True
+        for receiver in wait(list(self.__running), timeout=wait_time):
+            index, process, _ = self.__running.pop(receiver)
+            try:
+                self.results[index] = receiver.recv()
+            except EOFError:
+                self.results[index] = RuntimeError("Worker exited without compiling the expression")
+            receiver.close()
+            process.join()
+
+        now = time.monotonic()
+        for receiver, (index, process, deadline) in list(self.__running.items()):
+            if now >= deadline:
+                self.__stop(receiver, process)
+                self.results[index] = CompileTimeoutError(f"Compiling {self.user_inputs[index]!r} took longer than {self.timeout} seconds")
+        self.__start_workers()
+        return self.done()
+
+    # Method to block until every expression has a result, returns the results
+    def wait(self) -> list:
+        while not self.done():
+            self.poll(max(0.0, min(deadline for _, _, deadline in self.__running.values()) - time.monotonic())) # Wait until a worker finishes or the earliest deadline passes
+        return self.results
+
+    # Method to kill every worker and drop the expressions which haven't started, such as when the window is closed or another plot is requested
+    def cancel(self) -> None:
+        for receiver, (_, process, _) in list(self.__running.items()):
+            self.__stop(receiver, process)
+        self.__running.clear()
+        self.__pending.clear()
+
+    # Method to start new workers while there is a free slot
+    def __start_workers(self) -> None:
+        while self.__pending and len(self.__running) < self.max_workers:
+            index, user_input = self.__pending.pop(0)
+            receiver, sender = self.__context.Pipe(duplex=False)
+            process = self.__context.Process(target=_compile_worker, args=(user_input, sender, self.compile), daemon=True)
+            process.start()
+            sender.close()
+            self.__running[receiver] = (index, process, time.monotonic() + self.timeout)
+
+    def __stop(self, receiver, process) -> None:
+        process.kill()
+        process.join()
+        receiver.close()
+        self.__running.pop(receiver, None)
+
+# Function to compile several expressions concurrently, blocking until each one has either its (expression, source) or the error it failed with
+def compile_expressions(user_inputs: list[str], timeout: float = COMPILE_TIMEOUT, max_workers: int = MAX_WORKERS) -> list:
+    return CompileJob(user_inputs, timeout, max_workers).wait()
+
+# Function to compile the source of a fused evaluator for several expressions in a worker process, so it can be killed like any other compilation.
+# The error it failed with is raised, a CompileTimeoutError if it took longer than timeout seconds
+def compile_fused_expressions(expressions: tuple[str], timeout: float = COMPILE_TIMEOUT) -> str:
+    result = CompileJob([tuple(expressions)], timeout, compile=compile_fused).wait()[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
@@ -0,0 +1,181 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+
+"""Script to draw many curves with two artists, one LineCollection for the curves and one for their previews, instead of two Line2D artists per curve.
+Every curve is a view into one contiguous buffer of points, so changing a curve without changing its number of points is a copy into the buffer"""
+
+BASE, PREVIEW = 0, 1 # Layers of the collection
+PREVIEW_ALPHA = 0.3
+
+"""Class for the LineCollection of one layer, which brings the buffer up to date before it is drawn"""
+class _CurveLineCollection(LineCollection):
+
+    # Constructor for an empty collection belonging to owner
+    def __init__(self, owner, **kwargs) -> None:
+        super().__init__([], **kwargs)
+        self._owner = owner
+
+    # Method to draw the collection once any pending changes to its curves are applied
+    def draw(self, renderer) -> None:
+        self._owner.sync()
+        super().draw(renderer)
+
+"""Class standing in for the Line2D of one curve in one layer, with the parts of its interface the visualiser uses"""
+class CurveView:
+
+    __slots__ = ("collection", "layer", "id")
+
+    # Constructor for the view of curve id in a layer of the collection
+    def __init__(self, collection, layer: int, id: int) -> None:
+        self.collection = collection
+        self.layer = layer
+        self.id = id
+
+    def set_data(self, x, y) -> None:
+        self.collection.set_data(self.layer, self.id, x, y)
+
+    def get_data(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.collection.get_data(self.layer, self.id)
+
+    def get_xdata(self) -> np.ndarray:
+        return self.get_data()[0]
+
+    def get_ydata(self) -> np.ndarray:
+        return self.get_data()[1]
+
+    def set_alpha(self, alpha: float) -> None:
+        self.collection.set_style(self.layer, self.id, alpha=alpha)
+
+    def get_alpha(self) -> float:
+        return float(self.collection.alphas[self.layer][self.id])
+
+    def set_visible(self, visible: bool) -> None:
+        self.collection.set_style(self.layer, self.id, visible=visible)
+
+    def get_visible(self) -> bool:
+        return bool(self.collection.visible[self.layer][self.id])
+
+"""Class packing the curves and their previews into two LineCollections over one contiguous (n, 2) buffer of points, each curve keeping its own colour, alpha and visibility.
+Drawing and transforming then scale with the number of points rather than the number of curves"""
+class CurveCollection:
+
+    # Constructor which adds the (initially empty) collections to the axes, previews are drawn with preview_alpha
+    def __init__(self, ax, preview_alpha: float = PREVIEW_ALPHA) -> None:
+        self.ax = ax
+        self.preview_alpha = preview_alpha
+        self.buffer = np.empty((0, 2)) # Points of every curve of the base layer followed by every curve of the preview layer
+        self.colors = np.empty((0, 4))
+        self.alphas = (np.empty(0), np.empty(0))
+        self.visible = (np.empty(0, dtype=bool), np.empty(0, dtype=bool))
+        self.layouts = 0 # Number of times the buffer was laid out again
+        self.__views = ([], []) # (n, 2) view of the buffer for each curve of each layer
+        self.__pending = {} # Maps (layer, id) to the (x, y) of curves whose number of points changed
+        self.__layout_stale = False
+        self.__style_stale = False
+        self.artists = (_CurveLineCollection(self), _CurveLineCollection(self))
+        for artist in self.artists:
+            ax.add_collection(artist, autolim=False)
+
+    # Method to add a curve with a colour, the preview starts as a hidden copy of the curve. Returns the (curve, preview) views
+    def add(self, x, y, color) -> tuple[CurveView, CurveView]:
+        id = len(self.colors)
+        self.colors = np.vstack((self.colors, to_rgba(color)))
+        self.alphas = (np.append(self.alphas[BASE], 1.0), np.append(self.alphas[PREVIEW], self.preview_alpha))
+        self.visible = (np.append(self.visible[BASE], True), np.append(self.visible[PREVIEW], False))
+        self.__views[BASE].append(None)
+        self.__views[PREVIEW].append(None)
+        for layer in (BASE, PREVIEW):
+            self.__pending[(layer, id)] = self.__as_points(x, y)
+        self.__layout_stale = True
+        self.__mark_stale()
+        return CurveView(self, BASE, id), CurveView(self, PREVIEW, id)
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    # Method to replace the points of a curve, they are copied straight into the buffer when the number of points is unchanged
+    def set_data(self, layer: int, id: int, x, y) -> None:
+        points = self.__as_points(x, y)
+        view = self.__views[layer][id]
+        if not self.__layout_stale and view is not None and len(view) == len(points):
+            view[...] = points
+        else:
+            self.__pending[(layer, id)] = points
+            self.__layout_stale = True
+        self.artists[layer].stale = True
+
+    # Method returning the (x, y) points of a curve
+    def get_data(self, layer: int, id: int) -> tuple[np.ndarray, np.ndarray]:
+        points = self.__pending.get((layer, id))
+        if points is None:
+            points = self.__views[layer][id]
+        return points[:, 0], points[:, 1]
+
+    # Method to change the alpha or visibility of a curve
+    def set_style(self, layer: int, id: int, alpha: float = None, visible: bool = None) -> None:
+        if alpha is not None:
+            self.alphas[layer][id] = alpha
+        if visible is not None:
+            self.visible[layer][id] = visible
+        self.__style_stale = True
+        self.artists[layer].stale = True
+
+    # Method to apply pending changes to the buffer and the collections, called before they are drawn
+    def sync(self) -> None:
+        if self.__layout_stale:
+            self.__layout()
+        if self.__style_stale:
+            for layer, artist in enumerate(self.artists):
+                shown = np.flatnonzero(self.visible[layer])
+                artist.set_segments([self.__views[layer][id] for id in shown]) # Views aren't copied, so later copies into the buffer are drawn
+                colors = self.colors[shown].copy()
+                colors[:, 3] *= self.alphas[layer][shown]
+                artist.set_color(colors)
+            self.__style_stale = False
+
+    # Method to lay out every curve contiguously in a new buffer, keeping the points of curves which didn't change
+    def __layout(self) -> None:
+        lengths = [[len(self.__pending.get((layer, id), view if view is not None else ())) for id, view in enumerate(self.__views[layer])] for layer in (BASE, PREVIEW)]
+        offsets = tuple(np.concatenate(([0], np.cumsum(layer_lengths, dtype=int))) for layer_lengths in lengths)
+        buffer = np.empty((offsets[BASE][-1] + offsets[PREVIEW][-1], 2))
+        views = ([], [])
+        for layer in (BASE, PREVIEW):
+            start = 0 if layer == BASE else offsets[BASE][-1]
+            for id, old in enumerate(self.__views[layer]):
+                view = buffer[start + offsets[layer][id]:start + offsets[layer][id+1]]
+                view[...] = self.__pending.get((layer, id), old)
+                views[layer].append(view)
+        self.buffer, self.__views = buffer, views
+        self.__pending.clear()
+        self.__layout_stale = False
+        self.__style_stale = True # The collections have to be given the new views
+        self.layouts += 1
+
+    def __mark_stale(self) -> None:
+        self.__style_stale = True
+        for artist in self.artists:
+            artist.stale = True
+
+    # Helper method to pack x and y values into (n, 2) points
+    @staticmethod
+    def __as_points(x, y) -> np.ndarray:
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("x and y must be one dimensional arrays of the same length")
+        return np.column_stack((x, y))
+
+# Function to apply a different affine transform to each of several curves in one pass over all of their points, where curves is a list of (transform, x, y).
+# Returns the transformed (x, y) of each curve, as views of two contiguous arrays
+def transform_curves(curves: list) -> list[tuple[np.ndarray, np.ndarray]]:
+    if not curves:
+        return []
+    lengths = [len(x) for _, x, _ in curves]
+    x = np.concatenate([np.asarray(x, dtype=float) for _, x, _ in curves])
+    y = np.concatenate([np.asarray(y, dtype=float) for _, _, y in curves])
+    matrices = np.array([transform.matrix.as_array() for transform, _, _ in curves])
+    index = np.repeat(np.arange(len(curves)), lengths) # Curve each point belongs to
+    (a, b, tx), (c, d, ty) = (matrices[:, row, :].T[:, index] for row in (0, 1))
+    x1, y1 = a*x + b*y + tx, c*x + d*y + ty
+    splits = np.cumsum(lengths)[:-1]
+    return list(zip(np.split(x1, splits), np.split(y1, splits)))
@@ -0,0 +1,274 @@
+import os
+import json
+import inspect
+import numpy as np
+import sympy as sp
+from collections import OrderedDict
+from typing import Optional
+from src.custom import custom_is_constant
+from .backends import BACKENDS, BackendInfo, build_function, select_backend
+
+"""Cache of compiled user functions, keyed by the normalised expression string so re-plotting unchanged functions skips sympy entirely.
+Functions can also be kept on disk, but generated source read back from a file isn't trusted: the disk store only saves validating and benchmarking a function,
+its source is still generated by sympy (for the chosen backend only) the first time it is plotted after a restart"""
+
+CACHE_SIZE = 128
+
+# Class wrapping a compiled user function together with the expression and sources it was generated from, and the backend chosen to evaluate it
+class CompiledFunction:
+    __slots__ = ("expression", "sources", "func", "backend", "timings")
+
+    def __init__(self, expression: str, sources: dict, func, backend: str = "numpy", timings: Optional[dict] = None) -> None:
+        self.expression = expression # Expression as printed by sympy, used for labels
+        self.sources = sources # Python source generated by sympy.lambdify, for each module
+        self.func = func
+        self.backend = backend # Name of the backend func evaluates with
+        self.timings = timings if timings is not None else {} # Benchmarked time of each backend, None for backends which couldn't be used
+
+    # Numpy source of the function
+    @property
+    def source(self) -> str:
+        return self.sources["numpy"]
+
+    # Method returning which backend was chosen for the function and how long each backend took, to see why a function is slow
+    def backend_info(self) -> BackendInfo:
+        return BackendInfo(self.expression, self.backend, dict(self.timings))
+
+    def __call__(self, x):
+        return self.func(x)
+
+    def __repr__(self):
+        return f"CompiledFunction(expression={self.expression!r}, backend={self.backend!r})"
+
+# Class wrapping a single function which evaluates several expressions in one pass, sharing their common subexpressions
+class FusedEvaluator:
+    __slots__ = ("expressions", "source", "func")
+
+    def __init__(self, expressions: tuple[str], source: str, func) -> None:
+        self.expressions = expressions
+        self.source = source
+        self.func = func
+
+    # Evaluates every expression, returning one array of y values per expression (constant expressions are broadcast to the shape of x)
+    def __call__(self, x) -> list[np.ndarray]:
+        x = np.asarray(x, dtype=float)
+        return [np.broadcast_to(np.asarray(y, dtype=float), x.shape) for y in self.func(x)]
+
+    def __repr__(self):
+        return f"FusedEvaluator(expressions={self.expressions!r})"
+
+# Function to normalise user input so trivially different spellings of the same expression share a cache entry
+def normalise_expression(user_input: str) -> str:
+    return "".join(user_input.split())
+
+# Function to generate the source of a single numpy function which evaluates all the (already validated) expressions, with common subexpressions computed once
+def compile_fused(expressions: tuple[str]) -> str:
+    exprs = [sp.sympify(expression) for expression in expressions]
+    return inspect.getsource(sp.lambdify(sp.symbols("x"), exprs, 'numpy', cse=True))
+
+# Function to parse a user inputted expression, an error is raised for input which isn't an expression in x.
+# Whether the function can be evaluated is checked when it is plotted, as that check also finds the regions where it is undefined
+def parse_expression(user_input: str) -> sp.Expr:
+    expr = sp.sympify(user_input)
+    if (isinstance(expr, sp.Symbol) and user_input != "x") or custom_is_constant(user_input):
+        raise sp.SympifyError(user_input)
+    return expr
+
+# Function to generate the source of the function of an expression for a backend module
+def generate_source(expr: sp.Expr, module: str) -> str:
+    return inspect.getsource(sp.lambdify(sp.symbols("x"), expr, module))
+
+# Function to generate the source of the function of an expression for the numpy module and any other given modules.
+# The numpy source is always generated, other modules are left out when sympy can't print the expression for them. Sources for other modules are generated lazily,
+# when a backend using them is benchmarked or was chosen
+def generate_sources(expr: sp.Expr, modules: tuple = ()) -> dict:
+    sources = {"numpy": generate_source(expr, "numpy")}
+    for module in modules:
+        if module not in sources:
+            try:
+                sources[module] = generate_source(expr, module)
+            except Exception:
+                pass
+    return sources
+
+# Function to parse a user inputted expression and generate the numpy source of its function, an error is raised for invalid expressions
+def compile_expression(user_input: str) -> tuple[str, dict]:
+    expr = parse_expression(user_input)
+    return str(expr), generate_sources(expr)
+
+"""Class containing an in memory LRU cache of compiled functions, optionally backed by a json file which survives restarts.
+The file only holds the expression, chosen backend and timings of each function. Code is never read from it: functions are generated again from the user's own input,
+so a stored entry only saves validating and benchmarking the function"""
+class ExpressionCache:
+
+    # Constructor for the cache, no file is used when path is None
+    def __init__(self, maxsize: int = CACHE_SIZE, path: Optional[str] = None) -> None:
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.__functions = OrderedDict()
+        self.__fused = OrderedDict()
+        self.__stored = self.__load() # Expression, backend and timings of every function in the file, keyed by normalised input
+
+    # Method to retrieve the compiled function for a user inputted expression, an error is raised for invalid expressions
+    def get(self, user_input: str) -> CompiledFunction:
+        key = normalise_expression(user_input)
+        func = self.__functions.get(key)
+        if func is not None:
+            self.hits += 1
+            self.__functions.move_to_end(key)
+            return func
+
+        self.misses += 1
+        func = self.__from_file(key)
+        if func is None:
+            func = self.__add(key, *compile_expression(key))
+        self.__remember(key, func)
+        return func
+
+    # Method to retrieve the compiled functions for several expressions at once, giving either the function or the error it failed with for each one.
+    # Expressions which aren't cached are compiled together by compiler, which takes a list of expressions and returns an (expression, source) or error for each
+    def get_many(self, user_inputs: list[str], compiler=None) -> list:
+        results, missing = self.lookup_many(user_inputs)
+        if missing:
+            compiled = compiler(list(missing)) if compiler is not None else [self.__try_compile(key) for key in missing]
+            self.add_many(results, missing, compiled)
+        return results
+
+    # Method to look up several expressions, returning a list with the function of each cached one (None for the rest)
+    # and a dictionary mapping each normalised expression which still needs compiling to its positions in the list
+    def lookup_many(self, user_inputs: list[str]) -> tuple[list, dict]:
+        keys = [normalise_expression(user_input) for user_input in user_inputs]
+        results = [None] * len(keys)
+        missing = {}
+        for i, key in enumerate(keys):
+            func = self.__functions.get(key)
+            if func is not None:
+                self.hits += 1
+                self.__functions.move_to_end(key)
+            else:
+                self.misses += 1
+                func = self.__from_file(key)
+            if func is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                self.__remember(key, func)
+                results[i] = func
+        return results, missing
+
+    # Method to add the (expression, source) or error compiled for each missing expression of lookup_many, filling in its results. Returns the results
+    def add_many(self, results: list, missing: dict, compiled: list) -> list:
+        for key, result in zip(missing, compiled):
+            if not isinstance(result, Exception):
+                result = self.__add(key, *result)
+                self.__remember(key, result)
+            for i in missing[key]:
+                results[i] = result
+        return results
+
+    # Method to retrieve a single evaluator for all of the given compiled functions, which computes subexpressions shared between them only once
+    # The source is generated by compiler, which takes the tuple of expressions and returns the source or raises an error
+    def get_fused(self, functions: list[CompiledFunction], compiler=compile_fused) -> FusedEvaluator:
+        evaluator = self.find_fused(functions)
+        if evaluator is None:
+            expressions = tuple(func.expression for func in functions)
+            evaluator = self.add_fused(expressions, compiler(expressions))
+        return evaluator
+
+    # Method returning the fused evaluator for the given compiled functions if one is cached, otherwise None
+    def find_fused(self, functions: list[CompiledFunction]) -> Optional[FusedEvaluator]:
+        key = "\n".join(func.expression for func in functions)
+        evaluator = self.__fused.get(key)
+        if evaluator is not None:
+            self.__fused.move_to_end(key)
+        return evaluator
+
+    # Method to add a fused evaluator built from the source compiled for a tuple of expressions, returns the evaluator
+    def add_fused(self, expressions: tuple[str], source: str) -> FusedEvaluator:
+        evaluator = FusedEvaluator(expressions, source, build_function(source)) # Only kept in memory, as stored source would have to be generated again to be trusted
+        self.__fused["\n".join(expressions)] = evaluator
+        if len(self.__fused) > self.maxsize:
+            self.__fused.popitem(last=False)
+        return evaluator
+
+    # Method to rebuild a function stored in the file with the backend chosen when it was compiled, generating its sources again from the key (the user's own input).
+    # None is returned when it isn't stored, or its entry is corrupted or doesn't match the expression the key parses to
+    def __from_file(self, key: str) -> Optional[CompiledFunction]:
+        stored = self.__stored.get(key)
+        if stored is None:
+            return None
+        try:
+            expr = parse_expression(key)
+            expression = str(expr)
+            if expression != stored["expression"]:
+                return None
+            backend = BACKENDS.get(stored["backend"])
+            sources = generate_sources(expr, () if backend is None else (backend.module,))
+            if backend is None or backend.module not in sources:
+                return self.__add(key, expression, sources) # The chosen backend is no longer available, so benchmark the others again
+            return CompiledFunction(expression, sources, backend.build(sources[backend.module]), backend.name, dict(stored["timings"]))
+        except Exception:
+            return None # Ignore corrupted entries and compile the expression again
+
+    # Method to build a newly compiled function with the fastest backend and store it in the file
+    def __add(self, key: str, expression: str, sources: dict) -> CompiledFunction:
+        backend, func, timings = select_backend(sources, generate=lambda module: generate_source(sp.sympify(expression), module))
+        func = CompiledFunction(expression, sources, func, backend, timings)
+        self.__store(key, {"expression": expression, "backend": backend, "timings": timings})
+        return func
+
+    # Method to add a function to the in memory cache
+    def __remember(self, key: str, func: CompiledFunction) -> None:
+        self.__functions[key] = func
+        if len(self.__functions) > self.maxsize:
+            self.__functions.popitem(last=False) # Evict the least recently used function
+
+    # Helper method to compile an expression, returning the error instead of raising it
+    @staticmethod
+    def __try_compile(key: str):
+        try:
+            return compile_expression(key)
+        except Exception as e:
+            return e
+
+    # Method to empty the in memory cache, the file is left untouched
+    def clear(self) -> None:
+        self.__functions.clear()
+        self.__fused.clear()
+        self.hits = 0
+        self.misses = 0
+
+    # Method returning the chosen backend and timings of every function in the in memory cache
+    def backend_info(self) -> list[BackendInfo]:
+        return [func.backend_info() for func in self.__functions.values()]
+
+    def __len__(self):
+        return len(self.__functions)
+
+    # Method to read the stored entries from the file
+    def __load(self) -> dict:
+        if self.path is None or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as file:
+                stored = json.load(file)
+            return stored if isinstance(stored, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    # Method to add the entry of a newly compiled function to the file, keeping at most maxsize entries
+    def __store(self, key: str, entry: dict) -> None:
+        if self.path is None:
+            return
+        self.__stored[key] = entry
+        while len(self.__stored) > self.maxsize:
+            del self.__stored[next(iter(self.__stored))]
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'w') as file:
+                json.dump(self.__stored, file)
+            os.replace(temp_path, self.path) # Replace in one step so a crash never leaves a half written file
+        except OSError:
+            pass # The file is only an optimisation, failing to write it must not stop plotting
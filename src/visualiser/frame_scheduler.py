@@ -0,0 +1,66 @@
+"""Script to coalesce events which arrive faster than they can be drawn (such as slider drags), so only the newest parameters of each kind of event are computed once per frame"""
+
+FRAME_RATE = 60 # Frames per second the scheduler aims for
+
+"""Class which keeps the latest parameters submitted under each key and runs their handlers on the next tick of a frame timer, older parameters for the same key are dropped.
+The timer only runs while there is pending work"""
+class FrameScheduler:
+
+    # Constructor, when a canvas is given its timer ticks at fps frames per second. Without one every submission is run straight away
+    def __init__(self, canvas=None, fps: float = FRAME_RATE) -> None:
+        if fps <= 0:
+            raise ValueError("Frame rate must be positive")
+        self.fps = fps
+        self.submitted = 0 # Parameters submitted
+        self.run = 0 # Parameters whose handler was run
+        self.frames = 0 # Ticks which had work to do
+        self.__pending = {} # Maps each key to its (handler, params), in the order of their latest submission
+        self.__timer = None
+        self.__running = False
+        if canvas is not None:
+            self.__timer = canvas.new_timer(interval=max(1, int(round(1000 / fps))))
+            self.__timer.add_callback(self.__tick)
+
+    # Method to schedule handler(*params) for the next frame, replacing anything still pending under the same key
+    def submit(self, key, handler, *params) -> None:
+        self.submitted += 1
+        self.__pending.pop(key, None)
+        self.__pending[key] = (handler, params)
+        if self.__timer is None:
+            self.__tick()
+        elif not self.__running:
+            self.__running = True
+            self.__timer.start()
+
+    # Method to check if anything is waiting for the next frame
+    def pending(self) -> bool:
+        return bool(self.__pending)
+
+    # Method returning the number of submissions which weren't run, because newer ones replaced them (or they are still pending)
+    def coalesced(self) -> int:
+        return self.submitted - self.run
+
+    # Method to run everything pending straight away, such as before a transformation is performed
+    def flush(self) -> None:
+        if self.__pending:
+            self.__tick()
+
+    # Method to drop everything pending without running it
+    def cancel(self) -> None:
+        self.__pending.clear()
+        self.__stop()
+
+    def __tick(self) -> None:
+        if not self.__pending:
+            self.__stop() # Nothing arrived since the last frame, so stop waking up
+            return
+        pending, self.__pending = self.__pending, {}
+        self.frames += 1
+        for handler, params in pending.values():
+            self.run += 1
+            handler(*params)
+
+    def __stop(self) -> None:
+        if self.__timer is not None and self.__running:
+            self.__timer.stop()
+        self.__running = False
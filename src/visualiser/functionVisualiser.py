@@ -1,20 +1,26 @@
-import warnings
 import matplotlib.pyplot as plt
 import numpy as np
 import functools
-from matplotlib.widgets import Slider, CheckButtons, RadioButtons, Button
+from matplotlib.widgets import Slider, RadioButtons, Button
+from matplotlib.lines import Line2D
 from src.transformations import transformation as tr
 from src.transformations.vector import Vector
+from src.transformations.affine import AffineTransform
 from src.custom import custom_get_random_color
-from .input_handler import get_functions, get_axis_lim
-from .widget_visibility_control import show_widgets, hide_widgets, transformation_line_visibility
-
-warnings.filterwarnings("ignore", category=RuntimeWarning) # Supress division by 0 warnings when computing gradient for vertical line, and also warnings due to domain being out of function bound
+from .input_handler import get_functions, get_axis_lim, get_evaluator
+from .sampling import adaptive_sample_all
+from .level_of_detail import LevelOfDetail, parameter_range
+from .blitting import BlitManager
+from .frame_scheduler import FrameScheduler, FRAME_RATE
+from .preview_worker import PreviewWorker, compute_preview, compute_preview_batched
+from .curve_collection import CurveCollection, PREVIEW
+from .line_registry import LineRegistry
+from .function_selector import FunctionSelector
+from .widget_visibility_control import show_widgets, hide_widgets
 
 # Constants that are used later within the script
 PI = np.pi
 RADIOBUTTON_LABELS = ["Rotation", "Shearing", "Scaling", "Reflection", "Translation"]
-RESOLUTION = 0.1
 TEXTBOX_TO_POINT_SCALE = 1/15
 POINT_INCH_SCALE = 1/72
 SLIDER_POS_1 = (0.1, 0.10, 0.65, 0.03)
@@ -23,6 +29,7 @@ SLIDER_POS_3 = (0.1, 0.20, 0.65, 0.03)
 TRANSFORMATION_SLIDER_POS = (0.85, 0.17, 0.1, 0.1)
 RESET_SLIDER_POS = (0.85, 0.05, 0.1, 0.1)
 HISTORY_SIZE = 5
+LINE_ARTIST_LIMIT = 8 # Above this many functions every curve is drawn by one LineCollection and every preview by another, rather than two Line2D artists each
 
 # decorator function to update history
 def update_history(f):
@@ -57,11 +64,9 @@ class FunctionVisualiserApp:
         self.ax = None
 
         # Storing all things to do with the line object and transformation themselves
-        self.lines = [] # Stores all functions/lines and their corresponding transformation line (where the line will be after a transformation)
-        self.selected_lines = [] # Stores all the functions selected for transformation and their corresponding transformation function (where the function will be after a tranformation)
+        self.line_registry = LineRegistry() # Stores each function with its line, its transformation line (where the line will be after a transformation), its samples and its transformations
+        self.curve_collection = None # Draws the lines and transformation lines when there are more functions than LINE_ARTIST_LIMIT
         self.current_widgets = [] # Stores all the current widgets needing to be displayed on the screen
-        self.initial_data = [] # Stores all the initial (x, y) state(s) of the graph, useful when resetting the graph
-        self.current_data = None # This stores the current (x, y) data state of all the functions at any given time
         self.points = [] # Stores all the drawn markers/points
         self.rotation_center_point = None # Mark for the center point of rotation
         self.reflection_line = None # Line of reflection
@@ -69,7 +74,11 @@ class FunctionVisualiserApp:
         # Storing functions that need to be plotted and the bound on the axes
         self.func_arr = None # Array storing all the functions
         self.func_labels = None # Array storing all the function labels
-        self.x = None # Initial set of x values 
+        self.func_regions = [] # Array storing the regions where each function is NaN or infinite
+        self.evaluator = None # Evaluates all the functions in one pass, returning the y values of each
+        self.x = None # Ends of the range of x values functions are sampled over
+        self.samples = None # Adaptively sampled (x, y) values of each function
+        self.level_of_detail = None # Resamples the functions over the visible part of the graph when it is zoomed or panned
         self.min_x = None # min value of x in the axes
         self.max_x = None # max value of x in the axes
         self.min_y = None # min value of y in the axes
@@ -91,11 +100,18 @@ class FunctionVisualiserApp:
         self.transform_button = None
         self.reset_button = None
 
-    def __setup_functions(self) -> None:
-        self.func_arr, self.func_labels = get_functions(self.window) # Retrieve all user inputted functions 
+        # Redraws only the preview artists while sliders are dragged
+        self.blit_manager = None
+        self.frame_scheduler = None # Keeps only the newest slider values of each transformation until the next frame
+        self.preview_worker = None # Applies the previewed transformations to the functions off the GUI thread
+
+    def __setup_functions(self, compiled=None) -> None:
         self.min_x, self.max_x, self.min_y, self.max_y = get_axis_lim(self.window) # Get the axis limits for the domain and range of the graph you want displayed 
+        self.func_arr, self.func_labels = get_functions(self.window, regions=self.func_regions, bounds=(self.min_x, self.max_x), compiled=compiled) # Retrieve all user inputted functions 
+        self.evaluator = get_evaluator(self.func_arr, window=self.window) # Shares the work of subexpressions common to several functions, once compiled in the background
         value = int(np.ceil(max(100+abs(self.max_x), 100+abs(self.min_x)))) # Ensures function is plotted out the visible view of the graph
-        self.x = np.linspace(-value, value, num=int(value/RESOLUTION)) # Initial range values for x
+        self.x = np.array([-value, value], dtype=float)
+        self.samples = adaptive_sample_all(self.evaluator, self.func_arr, -value, value, y_scale=self.max_y-self.min_y, view=(self.min_x, self.max_x), regions=self.func_regions) # More points where the curves bend or jump, fewer where they are straight
 
     # Method for the setup of the initial plot
     def __setup_plots(self, data=None) -> None:
@@ -105,15 +121,10 @@ class FunctionVisualiserApp:
              # The figure
             self.fig, self.ax = plt.subplots()
             # Plotting the initial functions
-            for index, f in enumerate(self.func_arr):
-                fx = f(self.x)
-                self.initial_data.append((self.x, fx))
-                color = custom_get_random_color() # Get a random colour for the plot
-                line, = self.ax.plot(self.x, fx, color=color, label=self.func_labels[index]) # Unpack a single item tuple using ','
-                transformation_line, = self.ax.plot(self.x, fx, color=color, alpha=0.30) # Transformation line to show the result of a transformation before it is actually done
-                transformation_line.set_visible(False) # Initially set off the transformation line as it will overlap with the normal line
-                self.lines.append((line, transformation_line))
-                self.selected_lines.append((line, transformation_line))
+            self.__setup_collection(len(self.samples))
+            for index, (x, fx) in enumerate(self.samples):
+                self.__add_line(self.func_labels[index], x, fx)
+            self.level_of_detail = LevelOfDetail(self.func_arr, self.fig.canvas, domain=(self.x[0], self.x[-1]), regions=self.func_regions)
 
         # Run it with loaded data
         else:
@@ -127,18 +138,12 @@ class FunctionVisualiserApp:
                 xData.append(datum["x"])
                 yData.append(datum["y"])
 
+            self.__setup_collection(len(func_labels))
             for index in range(len(func_labels)):
-                self.initial_data.append((xData[index], yData[index]))
-                color = custom_get_random_color()
-                line, = self.ax.plot(xData[index], yData[index], color=color, label=func_labels[index])
-                transformation_line, = self.ax.plot(xData[index], yData[index], color=color, alpha=0.30)
-                transformation_line.set_visible(False)
-                self.lines.append((line, transformation_line))
-                self.selected_lines.append((line, transformation_line))
+                self.__add_line(func_labels[index], xData[index], yData[index])
 
 
-        self.current_data = self.initial_data[:] # This stores the current (x, y) data state of all the functions at any given time
-        self.history[self.head] = {key:val for key, val in enumerate(self.initial_data)} # Add the initial data to the history
+        self.history[self.head] = {record.id: record.transform for record in self.line_registry} # Add the initial transformations to the history
         self.rotation_center_point, = self.ax.plot((self.min_x+self.max_x)/2, (self.min_y+self.max_y)/2, color="black", marker="x") # Mark for the center point of rotation
         self.reflection_line, = self.ax.plot(self.x, [0]*len(self.x), linestyle='--', color='grey', label='Line of reflection') # Line of reflection
         self.reflection_line.set_visible(False) # Initially set off the reflection line as the initial transformation will be rotation
@@ -155,12 +160,36 @@ class FunctionVisualiserApp:
         self.ax.axvline(0, color='black',linewidth=1.5)
         self.ax.set_title('Plot of functions')
         self.ax.grid(True)
-        self.ax.legend()
+        self.ax.legend(handles=self.__legend_handles())
         self.fig.text(0.10, 0.95, "Function transformer", fontsize=20, fontweight='bold', ha="center", va="center")
         self.fig.text(0.13, 0.90, "• Use Ctrl + LMB to mark points and Ctrl + RMB to remove marked points from the axes.", fontsize=8, ha="center", va="center") 
         self.fig.text(0.13, 0.88, "• Toggle the function(s) you want to transform and select a transformation below.", fontsize=8, ha="center", va="center")
         self.fig.text(0.13, 0.86, "• Use the sliders to vary the parameters of the specified transformation.", fontsize=8, ha="center", va="center")
 
+    # Method to draw the functions through a curve collection when there are too many of them for an artist each
+    def __setup_collection(self, function_number: int) -> None:
+        if function_number > LINE_ARTIST_LIMIT:
+            self.curve_collection = CurveCollection(self.ax)
+
+    # Method to plot a function with its transformation line and add it to the line registry
+    def __add_line(self, label: str, x, fx) -> None:
+        color = custom_get_random_color() # Get a random colour for the plot
+        if self.curve_collection is not None:
+            line, transformation_line = self.curve_collection.add(x, fx, color) # Views of the function in the collection, its transformation line starts off hidden
+        else:
+            line, = self.ax.plot(x, fx, color=color, label=label) # Unpack a single item tuple using ','
+            transformation_line, = self.ax.plot(x, fx, color=color, alpha=0.30) # Transformation line to show the result of a transformation before it is actually done
+            transformation_line.set_visible(False) # Initially set off the transformation line as it will overlap with the normal line
+        self.line_registry.add(label, line, transformation_line, (x, fx))
+
+    # Method returning the handles for the legend, curves in a collection have no artist of their own so a proxy line with the colour and label of each is made
+    def __legend_handles(self) -> list:
+        handles, _ = self.ax.get_legend_handles_labels()
+        if self.curve_collection is not None:
+            proxies = [Line2D([], [], color=self.curve_collection.colors[record.id], label=record.label) for record in self.line_registry]
+            handles = proxies + handles
+        return handles
+
     # Method to create all the widgets that are going to be displayed on the screen
     def __setup_widgets(self) -> None:
         # Creation of initial sliders for all the neccessary transformations on a function
@@ -209,7 +238,7 @@ class FunctionVisualiserApp:
 
         ax_function_selector = plt.axes((0.01, 0.6, 0.2, 0.2), facecolor='lightgoldenrodyellow')
         visibility = [True] * len(self.func_arr)
-        self.function_selector = CheckButtons(ax_function_selector, self.func_labels, visibility)
+        self.function_selector = FunctionSelector(ax_function_selector, self.func_labels, visibility) # Lists the functions a page at a time so their labels stay readable
         
         # Button for performing (confirming) transformation
         ax_transform_button = plt.axes(TRANSFORMATION_SLIDER_POS, facecolor='lightblue')
@@ -221,6 +250,11 @@ class FunctionVisualiserApp:
     
     # Method for setting up the event handlers for the widgets
     def __setup_event_handlers(self) -> None:
+        self.frame_scheduler = FrameScheduler(self.fig.canvas, fps=FRAME_RATE)
+        compute = compute_preview if self.curve_collection is None else compute_preview_batched # Many functions are transformed in one pass over all of their points
+        self.preview_worker = PreviewWorker(self.__show_preview, self.fig.canvas, compute=compute)
+        self.fig.canvas.mpl_connect('close_event', self.preview_worker.close)
+
         # Calls the handler functions when an event occurs 
         # Rotation handlers
         self.rotation_slider.on_changed(self.__update_rotation)
@@ -252,14 +286,37 @@ class FunctionVisualiserApp:
         self.fig.canvas.mpl_connect('key_press_event', self.__redo)
         self.ax.callbacks.connect('xlim_changed', self.__update_textbox_position)
         self.ax.callbacks.connect('ylim_changed', self.__update_textbox_position)
-
-     # Method to deal with change in the rotation sliders
-    def __update_rotation(self, _) -> None:    
+        self.ax.callbacks.connect('xlim_changed', self.__request_resample)
+        self.ax.callbacks.connect('ylim_changed', self.__request_resample)
+        self.__request_resample() # Replace the initial samples once the window is shown, as they can't resolve very wide bounds
+
+     # Method to set up blitting for slider drags, the transformation lines, the rotation centre, the line of reflection and the sliders are drawn over a cached background
+    def __setup_blitting(self) -> None:
+        sliders = [self.rotation_slider, self.rotation_center_x_slider, self.rotation_center_y_slider, self.shearing_kx_slider, self.shearing_ky_slider,
+                   self.scaling_kx_slider, self.scaling_ky_slider, self.reflection_slider, self.translation_x_slider, self.translation_y_slider]
+        for slider in sliders:
+            slider.drawon = False # Sliders would otherwise redraw the whole figure on every change
+        if self.curve_collection is None:
+            transformation_lines = [record.transformation_line for record in self.line_registry]
+        else:
+            transformation_lines = [self.curve_collection.artists[PREVIEW]]
+        animated = transformation_lines + [self.rotation_center_point, self.reflection_line] + [slider.ax for slider in sliders]
+        self.blit_manager = BlitManager(self.fig.canvas, animated)
+        self.fig.canvas.mpl_connect('resize_event', self.blit_manager.invalidate)
+        self.ax.callbacks.connect('xlim_changed', self.blit_manager.invalidate)
+        self.ax.callbacks.connect('ylim_changed', self.blit_manager.invalidate)
+
+     # Method to deal with change in the rotation sliders, the preview is computed on the next frame with the newest values
+    def __update_rotation(self, _) -> None:
         angle = self.rotation_slider.val
         center_x, center_y = self.rotation_center_x_slider.val, self.rotation_center_y_slider.val
+        self.frame_scheduler.submit("Rotation", self.__preview_rotation, angle, center_x, center_y)
+
+    # Method to preview a rotation
+    def __preview_rotation(self, angle: float, center_x: float, center_y: float) -> None:
         self.__update_rotation_center_point(center_x, center_y) # Update the position of the center point the axes
-        self.__transform_plot(tr.rotation, Vector([center_x, center_y]), angle)
-        self.fig.canvas.draw_idle()
+        self.__transform_plot(tr.affine_transform(tr.rotation, Vector([center_x, center_y]), angle))
+        self.blit_manager.update()
 
     # Method to deal with change in the rotation_center sliders
     def __update_rotation_center_point(self, center_x: float, center_y: float) -> None:
@@ -268,39 +325,67 @@ class FunctionVisualiserApp:
 
     # Method to deal with change in the shearing sliders
     def __update_shearing(self, _) -> None:
-        kx, ky = self.shearing_kx_slider.val, self.shearing_ky_slider.val
-        self.__transform_plot(tr.shearing, kx, ky)
-        self.fig.canvas.draw_idle()
+        self.frame_scheduler.submit("Shearing", self.__preview_shearing, self.shearing_kx_slider.val, self.shearing_ky_slider.val)
+
+    # Method to preview a shearing
+    def __preview_shearing(self, kx: float, ky: float) -> None:
+        self.__transform_plot(tr.affine_transform(tr.shearing, kx, ky))
+        self.blit_manager.update()
 
     # Method to deal with change in the scaling sliders
     def __update_scaling(self, _) -> None:
-        kx, ky = self.scaling_kx_slider.val, self.scaling_ky_slider.val
-        self.__transform_plot(tr.scaling, kx, ky)
-        self.fig.canvas.draw_idle()
-
-    # Method to update the line of reflection when the reflection sliders values are altered
-    def __update_reflection_line(self, _) -> None:     
-        x_component, y_component = np.cos(self.reflection_slider.val*PI/180), np.sin(self.reflection_slider.val*PI/180)
-        y = (lambda x: (y_component/x_component)*x)(self.x)
+        self.frame_scheduler.submit("Scaling", self.__preview_scaling, self.scaling_kx_slider.val, self.scaling_ky_slider.val)
+
+    # Method to preview a scaling
+    def __preview_scaling(self, kx: float, ky: float) -> None:
+        self.__transform_plot(tr.affine_transform(tr.scaling, kx, ky))
+        self.blit_manager.update()
+
+    # Method to deal with change in the reflection slider
+    def __update_reflection_line(self, _) -> None:
+        self.frame_scheduler.submit("Reflection", self.__preview_reflection, self.reflection_slider.val)
+
+    # Method to update the line of reflection and preview the reflection in it
+    def __preview_reflection(self, angle: float) -> None:
+        x_component, y_component = np.cos(angle*PI/180), np.sin(angle*PI/180)
+        with np.errstate(divide="ignore", invalid="ignore"): # The gradient of a vertical line is infinite
+            y = (lambda x: (y_component/x_component)*x)(self.x)
         self.reflection_line.set_ydata(y)
-        self.__transform_plot(tr.reflection, Vector([x_component, y_component]))
-        self.fig.canvas.draw_idle()
+        self.__transform_plot(tr.affine_transform(tr.reflection, Vector([x_component, y_component])))
+        self.blit_manager.update()
 
     # Method to deal with change in the translation sliders
     def __update_translation(self, _) -> None:
-        x_component, y_component = self.translation_x_slider.val, self.translation_y_slider.val
-        self.__transform_plot(tr.translation, Vector([x_component, y_component]))
-        self.fig.canvas.draw_idle()
-
-    # Method to transform line data based on a transformation and parameters
-    def __transform_plot(self, transformation, *args) -> None:
-        for line, transformation_line in self.selected_lines:
-            transformation_line_visibility(line, transformation_line)
-            index = self.lines.index((line, transformation_line))
-            x0, y0 = self.current_data[index]
-            x1, y1 = tr.transform_values(x0, y0, transformation, *args)
-            transformation_line.set_xdata(x1)
-            transformation_line.set_ydata(y1)
+        self.frame_scheduler.submit("Translation", self.__preview_translation, self.translation_x_slider.val, self.translation_y_slider.val)
+
+    # Method to preview a translation
+    def __preview_translation(self, x_component: float, y_component: float) -> None:
+        self.__transform_plot(tr.affine_transform(tr.translation, Vector([x_component, y_component])))
+        self.blit_manager.update()
+
+    # Method to transform line data based on an affine transformation, the transformation is composed onto the accumulated one straight away
+    # and the worker applies it to a snapshot of the initial data, the transformation lines are moved once the result comes back.
+    # Only functions whose previewed transformation changed are recomputed, and ones whose preview is the same as their line are hidden without computing anything
+    def __transform_plot(self, transform: AffineTransform) -> None:
+        items = []
+        for record in self.line_registry.selected():
+            if not record.set_preview(transform.compose(record.transform)):
+                continue
+            if record.previewing():
+                items.append((record.id, record.preview_transform, *record.initial_data))
+            else:
+                record.update_visibility()
+        if items:
+            self.preview_worker.submit(items)
+        self.__request_resample() # The transformation may bring parts of the functions which weren't sampled into view
+
+    # Method called on the GUI thread with the newest preview computed by the worker
+    def __show_preview(self, result: list) -> None:
+        for id, x1, y1 in result:
+            record = self.line_registry[id]
+            record.transformation_line.set_data(x1, y1)
+            record.update_visibility()
+        self.blit_manager.update()
 
     # Perform the transformation, making the transformed function the new starting point
     @update_history
@@ -308,13 +393,13 @@ class FunctionVisualiserApp:
         if data is None:
             data = {}
 
-        for index, (line, transformation_line) in enumerate(self.lines):
-            x_transformed = transformation_line.get_xdata()
-            y_transformed = transformation_line.get_ydata()
-            data[index] = (x_transformed, y_transformed)
-            line.set_xdata(x_transformed)
-            line.set_ydata(y_transformed)
-            self.current_data[index] = (x_transformed, y_transformed) # Set current line position as the current data
+        self.frame_scheduler.flush() # The newest slider values may not have been previewed yet
+        self.preview_worker.cancel() # The transformation lines are hidden, as they are now the same as the lines
+        for record in self.line_registry:
+            record.set_transform(record.preview_transform)
+            record.update_visibility()
+            data[record.id] = record.transform
+        self.line_registry.upload() # Only the functions which were previewed have moved
 
         self.__reset_widgets()
         self.fig.canvas.draw_idle()
@@ -347,20 +432,12 @@ class FunctionVisualiserApp:
             
     # Method to deal with changes to functions being selected 
     def __toggle_plot(self, label) -> None:
-        index = self.func_labels.index(label) # Finds the index of the label within func_labels
-        line, transformation_line = self.lines[index] # Finds the corresponding plot/line which matches the label
-
-        if (line, transformation_line) in self.selected_lines:
-            self.selected_lines.remove((line, transformation_line)) # Remove line as it is being toggled off
-            line.set_alpha(0.3) # Set non selected line to transparent
-            transformation_line.set_visible(False) # Turn the transformation line off
-
-        else:
-            self.selected_lines.append((line, transformation_line)) # Add line as it is being toggled on
-            line.set_alpha(1.0) # Set selected line to opaque
-            transformation_line.set_visible(True)
+        record = self.line_registry.find(label) # Finds the function which matches the label
+        record.selected = not record.selected
+        record.line.set_alpha(1.0 if record.selected else 0.3) # Set non selected lines to transparent
+        record.update_visibility()
 
-        self.fig.canvas.draw_idle()
+        self.blit_manager.invalidate() # The selected line is part of the cached background
 
     # Method to allow undoing a transformation on a plot
     def __undo(self, event) -> None:
@@ -378,15 +455,15 @@ class FunctionVisualiserApp:
 
     def set_data(self):
         data = self.history[self.read]
-        for i, (line, transformation_line) in enumerate(self.lines):
-            x0, y0 = data[i]
-            line.set_xdata(x0)
-            line.set_ydata(y0)
-            transformation_line.set_xdata(x0)
-            transformation_line.set_ydata(y0)
-            self.current_data[i] = (x0, y0)
+        self.frame_scheduler.cancel() # A preview still waiting for its frame (or being computed) would overwrite the restored transformations
+        self.preview_worker.cancel()
+        for record in self.line_registry:
+            record.set_transform(data[record.id])
+            record.update_visibility()
+        self.line_registry.upload() # Only the functions whose transformation is different in the history are recomputed
 
         self.__reset_widgets()
+        self.__request_resample()
         self.fig.canvas.draw_idle()
 
     # Function to place a point at a given position in the graph and display the coordinates of it
@@ -445,25 +522,52 @@ class FunctionVisualiserApp:
 
         self.fig.canvas.draw_idle()
 
+    # Method to resample the functions once the view (or a transformation) stops changing, only done for plotted functions rather than loaded data
+    def __request_resample(self, _=None) -> None:
+        if self.level_of_detail is not None:
+            self.level_of_detail.request(self.__resample)
+
+    # Method to replace the samples of each function with ones covering the visible part of the graph (before its transformations), at a density matched to the width of the axes
+    def __resample(self) -> None:
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        pixels = self.ax.get_window_extent().width
+        for record in self.line_registry:
+            t_range = parameter_range([record.transform, record.preview_transform], xlim, ylim)
+            if t_range is None:
+                continue # Every x value could be visible, so keep the current samples
+            record.set_samples(self.level_of_detail.sample(record.id, *t_range, pixels))
+        self.line_registry.upload()
+        # The transformation lines being previewed are moved by the worker, which also makes any preview of the old samples stale
+        items = [(record.id, record.preview_transform, *record.initial_data) for record in self.line_registry if record.previewing()]
+        if items:
+            self.preview_worker.submit(items)
+        else:
+            self.preview_worker.cancel()
+        self.fig.canvas.draw_idle()
+
     # Method to reset any changes to the plot and sliders
     @update_history
     def __reset_plot(self, _, data=None) -> None:
         if data is None:
             data = {}
 
-        for line, transformation_line in self.selected_lines:
-            index = self.lines.index((line, transformation_line))
-            self.current_data[index] = self.initial_data[index]
-            x0, y0 = self.initial_data[index][0], self.initial_data[index][1]
-            line.set_xdata(x0)
-            line.set_ydata(y0)
-            data[index] = (x0, y0)
-            transformation_line.set_xdata(self.initial_data[index][0])
-            transformation_line.set_ydata(self.initial_data[index][1])
+        self.frame_scheduler.cancel()
+        self.preview_worker.cancel()
+        for record in self.line_registry:
+            record.set_transform(AffineTransform() if record.selected else record.transform)
+            record.update_visibility()
+            data[record.id] = record.transform
+        self.line_registry.upload() # Only the selected functions which were transformed are recomputed
 
         self.__reset_widgets()
+        self.__request_resample()
         self.fig.canvas.draw_idle()
 
+    # Property returning the current (x, y) data of every function, in the order they were plotted
+    @property
+    def current_data(self) -> list[tuple]:
+        return [record.current_data for record in self.line_registry]
+
     # Method to check if the current figure is open or not
     def check_open_figure(self) -> bool:
         return not self.fig.canvas.manager is None
@@ -476,13 +580,14 @@ class FunctionVisualiserApp:
                 widget.reset()
 
 
-    # Method to run the app
-    def run(self, data=None):
+    # Method to run the app, compiled holds the results of compiling the functions beforehand (see input_handler.compile_functions)
+    def run(self, data=None, compiled=None):
         try: # Try except blocks to deal with any issues that may arise with user input 
-            self.__setup_functions() # set up the functions and the axes bounds
+            self.__setup_functions(compiled) # set up the functions and the axes bounds
             self.__setup_plots(data) # Making the plots
             self.__setup_widgets() # Making the widgets
             self.__setup_event_handlers() # Linking to event handlers
+            self.__setup_blitting() # Caching everything which doesn't change while sliders are dragged
             plt.show()
         except:
             print("Error!")
@@ -1,9 +1,12 @@
+import io
 import os
+import sys
 import csv
 import numpy as np
 from functools import wraps
 from colorama import Fore, Style
 from typing import Optional
+from .streaming import array_stream, write_values
 
 """
 Store data in the form:
@@ -37,38 +40,70 @@ class DataSaver:
         self.location = find_project_root(os.getcwd(), marker="main.py") + "/save/" # default to the save folder in the root of the project as the save location
         self.filePath = os.path.join(self.location, self.filename)
         self.header = ["function_label", "xdata", "ydata", "bounds"]
+        self.stream_header = ["function_label", "stream", "bounds"]
 
     # Method to ensure data being saved is inputted in a valid format
-    def __validate_data(self, data) -> None:
+    def __validate_data(self, data, keys) -> None:
         for row in data:
             # Ensures data is in the form of dictionary
             if not isinstance(row, dict):
                 raise ValueError("Data should be a list of dictionaries")
             # Ensures that data has been formatted correctly w.r.t the headers in the csv file
-            if not all(key in row for key in self.header):
-                raise ValueError(f"Each dictionary must have keys: {'|'.join(self.header)}")
+            if not all(key in row for key in keys):
+                raise ValueError(f"Each dictionary must have keys: {'|'.join(keys)}")
 
     # Method to save the data
     def save(self, data) -> None:
         try:
-            self.__validate_data(data)
-            with open(self.filePath, 'w', newline="") as file:
-                writer = csv.DictWriter(file, fieldnames=self.header, delimiter="|")
-                writer.writeheader()
-                for datum in data:
-                    # Converty numpy array into string representation
-                    xdata = np.array2string(datum["xdata"], separator=',')
-                    ydata = np.array2string(datum["ydata"], separator=',')
-                    bound = np.array2string(datum["bounds"], separator=',')
-                    writer.writerow({self.header[0]:datum["function_label"], self.header[1]:xdata, self.header[2]:ydata, self.header[3]:bound})
+            self.__validate_data(data, self.header)
+            self.__write([{**datum, "stream": array_stream(datum["xdata"], datum["ydata"])} for datum in data])
             print(Fore.LIGHTGREEN_EX + f"Data successfully saved in {self.filename}" + Style.RESET_ALL)
         except Exception as e:
             print(Fore.RED + f"Error when trying to save data to {self.filename}\n Error: {e}" + Style.RESET_ALL)
 
+    # Method to save curves given as streams rather than arrays, each row has a "stream" callable returning a new iterator of (x, y) chunks in place of xdata and ydata.
+    # Only one chunk of each curve is ever held in memory, so curves over huge domains can be exported
+    def save_stream(self, rows) -> None:
+        try:
+            self.__validate_data(rows, self.stream_header)
+            self.__write(rows)
+            print(Fore.LIGHTGREEN_EX + f"Data successfully saved in {self.filename}" + Style.RESET_ALL)
+        except Exception as e:
+            print(Fore.RED + f"Error when trying to save data to {self.filename}\n Error: {e}" + Style.RESET_ALL)
+
+    # Method to write rows to the file in the same format as csv.DictWriter, the x and y values of each curve are streamed into the file chunk by chunk.
+    # The label and bounds go through csv writers so they are quoted when needed, the values never need quoting as they only hold numbers, commas and brackets
+    def __write(self, rows) -> None:
+        with open(self.filePath, 'w', newline="") as file:
+            writer = csv.writer(file, delimiter="|")
+            writer.writerow(self.header)
+            for row in rows:
+                file.write(self.__format_field(row["function_label"]) + "|")
+                write_values(file, row["stream"](), 0)
+                file.write("|")
+                write_values(file, row["stream"](), 1)
+                file.write("|")
+                writer.writerow([self.__format_bounds(row["bounds"])])
+
+    # Helper method to quote a single field the way csv.writer does inside a row
+    @staticmethod
+    def __format_field(value) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter="|", lineterminator="\n").writerow([value])
+        return buffer.getvalue()[:-1]
+
+    # Helper method to convert the bounds into their string representation, bounds are only stored with the first function
+    @staticmethod
+    def __format_bounds(bounds) -> str:
+        if isinstance(bounds, str):
+            return bounds
+        return "[" + ",".join(map(repr, np.asarray(bounds, dtype=float).tolist())) + "]"
+
     # Method to read data from a file
     def read(self) -> list[dict]:
         try:
             data = []
+            csv.field_size_limit(min(sys.maxsize, 2**31 - 1)) # Each field holds every x or y value of a function
             with open(self.filePath, 'r', newline="") as file:
                 reader = csv.DictReader(file, delimiter="|")
                 for row in reader:
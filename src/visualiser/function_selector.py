@@ -0,0 +1,61 @@
+import math
+from matplotlib.widgets import CheckButtons, Button
+
+"""Check boxes for selecting functions, shown a page at a time so every label stays readable however many functions are plotted"""
+
+PAGE_SIZE = 8 # Functions listed on each page of the selector
+PAGE_BUTTON_HEIGHT = 0.04 # Height of the buttons for changing page, in figure coordinates
+
+class FunctionSelector:
+
+    # Constructor for a selector of the labels drawn in the given axes, buttons for changing page are added under it when the labels don't fit on one page
+    def __init__(self, ax, labels: list[str], actives: list[bool] = None, page_size: int = PAGE_SIZE) -> None:
+        self.ax = ax
+        self.facecolor = ax.get_facecolor()
+        self.labels = list(labels)
+        self.actives = [True] * len(self.labels) if actives is None else list(actives)
+        self.page_size = page_size
+        self.pages = max(1, math.ceil(len(self.labels) / page_size))
+        self.page = 0
+        self.check_buttons = None
+        self.observers = []
+
+        self.previous_button = None
+        self.next_button = None
+        if self.pages > 1:
+            left, bottom, width, _ = ax.get_position().bounds
+            self.previous_button = Button(ax.figure.add_axes((left, bottom - PAGE_BUTTON_HEIGHT, width / 2, PAGE_BUTTON_HEIGHT)), "<", hovercolor='dodgerblue')
+            self.next_button = Button(ax.figure.add_axes((left + width / 2, bottom - PAGE_BUTTON_HEIGHT, width / 2, PAGE_BUTTON_HEIGHT)), ">", hovercolor='dodgerblue')
+            self.previous_button.on_clicked(lambda event: self.show_page(self.page - 1))
+            self.next_button.on_clicked(lambda event: self.show_page(self.page + 1))
+        self.show_page(0)
+
+    # Method to show the check boxes of a page of labels, going past the last page wraps around to the first
+    def show_page(self, page: int) -> None:
+        self.page = page % self.pages
+        first = self.page * self.page_size
+        last = min(first + self.page_size, len(self.labels))
+        if self.check_buttons is not None:
+            self.check_buttons.disconnect_events()
+        self.ax.clear()
+        self.ax.set_facecolor(self.facecolor)
+        self.check_buttons = CheckButtons(self.ax, self.labels[first:last], self.actives[first:last])
+        self.check_buttons.on_clicked(self.__clicked)
+        if self.pages > 1:
+            self.ax.set_title(f"{first + 1}-{last} of {len(self.labels)}", fontsize='small')
+        self.ax.figure.canvas.draw_idle()
+
+    # Method to connect a callback which is called with the label of a function whenever its check box is clicked
+    def on_clicked(self, func) -> None:
+        self.observers.append(func)
+
+    # Method to get whether each function is selected, including those on other pages
+    def get_status(self) -> list[bool]:
+        return list(self.actives)
+
+    # Helper method to remember the state of a clicked check box and pass its label on
+    def __clicked(self, label: str) -> None:
+        index = self.labels.index(label, self.page * self.page_size)
+        self.actives[index] = not self.actives[index]
+        for func in self.observers:
+            func(label)
@@ -1,37 +1,133 @@
-import sympy as sp
+import os
+import numpy as np
 from .error_handler import handle_error, reset_error_box
-from src.custom import custom_is_constant, custom_test_valid_function, custom_get_random_color
+from .expression_cache import ExpressionCache, compile_fused
+from .backends import BACKENDS
+from .compile_pool import CompileJob, compile_expressions, compile_fused_expressions, CompileTimeoutError, POLL_INTERVAL
+from .function_save import find_project_root
+from src.custom import custom_test_valid_function
 from typing import Optional
 
-# Method to retrieve function from user input. Constant k for k functions. Colors are chosen randomly. Labels are returned for visual information
-def get_functions(window, labels=None) -> Optional[tuple]:
+MAX_FUNCTIONS = 256 # Past 8 functions they are drawn through line collections, so the number of functions is limited by the points drawn rather than the artists
+
+# Compiled functions are kept between plots, and their expression, chosen backend and timings are stored in the cache folder in the root of the project so they survive restarts
+PROJECT_ROOT = find_project_root(os.getcwd(), marker="main.py")
+EXPRESSION_CACHE = ExpressionCache(path=None if PROJECT_ROOT is None else os.path.join(PROJECT_ROOT, "cache", "expressions.json"))
+FUSED_STARTED = set() # Expressions of every set of functions whose fused evaluator was compiled in the background, so a set which fails isn't compiled again
+
+# Method to start compiling the user inputted functions in worker processes without blocking the window. The window polls the workers with after callbacks,
+# and once every function has a result on_compiled is called with them. Returns the running job (None if nothing needed compiling or there are no functions)
+def compile_functions(window, on_compiled) -> Optional[CompileJob]:
+    if len(window.function_entries) == 0:
+        handle_error(window, f'Please select between 1-{MAX_FUNCTIONS} functions before trying to plot!')
+        return
+    results, missing = EXPRESSION_CACHE.lookup_many([entry.get() for entry in window.function_entries])
+    if not missing:
+        on_compiled(results)
+        return
+    job = CompileJob(list(missing))
+
+    def poll():
+        if not job.done() and not job.poll():
+            window.after(POLL_INTERVAL, poll)
+        elif None not in job.results: # A cancelled job is never handed over
+            on_compiled(EXPRESSION_CACHE.add_many(results, missing, job.results))
+
+    window.after(POLL_INTERVAL, poll)
+    return job
+
+# Method to retrieve function from user input. Constant k for k functions. Colors are chosen randomly. Labels are returned for visual information.
+# The functions are compiled here (blocking) unless the results of compile_functions are given as compiled, timeouts and invalid functions are reported through the error box.
+# The regions (near the bounds of the graph when given) where each function is NaN or infinite are appended to regions
+def get_functions(window, labels=None, regions=None, bounds=None, compiled=None) -> Optional[tuple]:
     if labels is None:
         labels = []
+    if regions is None:
+        regions = []
     funcs = []
-    function_number = len(window.function_entries)
-    try:
-        if function_number == 0:    
-            raise ValueError
-    except ValueError:
-        handle_error(window, 'Please select between 1-8 functions before trying to plot!')
+    if compiled is None:
+        function_number = len(window.function_entries)
+        try:
+            if function_number == 0:
+                raise ValueError
+        except ValueError:
+            handle_error(window, f'Please select between 1-{MAX_FUNCTIONS} functions before trying to plot!')
+            return
+        user_inputs = [entry.get() for entry in window.function_entries]
+        compiled = EXPRESSION_CACHE.get_many(user_inputs, compiler=compile_expressions) # Uncached functions are compiled concurrently in worker processes
+    timed_out = [f"f{i+1}" for i, func in enumerate(compiled) if isinstance(func, CompileTimeoutError)]
+    if timed_out:
+        handle_error(window, f'{", ".join(timed_out)} took too long to compile, try simplifying the function(s)...')
         return
-    for i in range(function_number):
-        user_input = window.function_entries[i].get()
+    for i, func in enumerate(compiled):
         try:
-            expr = sp.sympify(user_input)
-            if (isinstance(expr, sp.Symbol) and user_input != "x") or custom_is_constant(user_input):
-                raise sp.SympifyError
-            x = sp.symbols("x")
-            func = sp.lambdify(x, expr, 'numpy')
-            custom_test_valid_function(func)
+            if isinstance(func, Exception):
+                raise func
+            regions.append(custom_test_valid_function(func, bounds))
             funcs.append(func)
-            labels.append(f"f{i}: {str(expr)}")
+            labels.append(f"f{i}: {func.expression}")
         except:
             handle_error(window, 'Invalid form of function, make sure function is valid and all variables are denoted with the letter "x". Ensure no only constant input! Try again...')
             return
     reset_error_box(window)
     return funcs, labels
 
+# Method to check if a compiled function can be part of a fused evaluator, which is the case when its backend runs the numpy source.
+# Backends running the same source only win the benchmark by noise, so whether functions are fused doesn't depend on timing jitter
+def fusable(func) -> bool:
+    backend = BACKENDS.get(func.backend)
+    return backend is not None and backend.module == "numpy"
+
+# Method to compile the fused evaluator of funcs in a worker process without blocking the window, which polls it with after callbacks.
+# The evaluator is added to the cache once it arrives, so it is used from the next plot of the same functions. Returns the running job
+def compile_fused_later(window, funcs) -> CompileJob:
+    expressions = tuple(func.expression for func in funcs)
+    FUSED_STARTED.add(expressions)
+    job = CompileJob([expressions], compile=compile_fused)
+
+    def poll():
+        if not job.poll():
+            window.after(POLL_INTERVAL, poll)
+        elif isinstance(job.results[0], str):
+            EXPRESSION_CACHE.add_fused(expressions, job.results[0])
+
+    window.after(POLL_INTERVAL, poll)
+    return job
+
+# Method to retrieve a single evaluator for all the functions being plotted, which returns the y values of every function for an array of x values.
+# When fused, common subexpressions across the functions whose backend runs the numpy source (such as numpy and chunked) are only computed once. Functions for which a backend
+# with other source was chosen are left out of the fused evaluator (it is numpy source) and evaluated with their own backend, as is every function when fusing fails.
+# When a window is given a fused evaluator which isn't cached is compiled in the background (see compile_fused_later) and the functions are evaluated separately until it arrives,
+# otherwise it is compiled straight away in a worker process
+def get_evaluator(funcs, fused=True, window=None):
+    separate = lambda x: [np.broadcast_to(np.asarray(f(x), dtype=float), np.shape(x)) for f in funcs]
+    fused_indices = [i for i, f in enumerate(funcs) if fusable(f)]
+    if not fused or len(fused_indices) < 2:
+        return separate
+    fused_funcs = [funcs[i] for i in fused_indices]
+    evaluator = EXPRESSION_CACHE.find_fused(fused_funcs)
+    if evaluator is None and window is not None:
+        if tuple(func.expression for func in fused_funcs) not in FUSED_STARTED:
+            compile_fused_later(window, fused_funcs)
+        return separate
+    if evaluator is None:
+        try:
+            evaluator = EXPRESSION_CACHE.get_fused(fused_funcs, compiler=compile_fused_expressions) # Compiled in a worker process, so it is killed if it takes too long
+        except Exception:
+            return separate
+    if len(fused_indices) == len(funcs):
+        return evaluator
+    other_indices = [i for i, f in enumerate(funcs) if not fusable(f)]
+
+    def evaluate(x):
+        ys = [None] * len(funcs)
+        for i, y in zip(fused_indices, evaluator(x)):
+            ys[i] = y
+        for i in other_indices:
+            ys[i] = np.broadcast_to(np.asarray(funcs[i](x), dtype=float), np.shape(x))
+        return ys
+    return evaluate
+
 # Method to take the visual bounds of the graph from the user
 def get_axis_lim(window) -> Optional[tuple]:
     user_input = [window.min_x_bound.get(), window.max_x_bound.get(), window.min_y_bound.get(), window.max_y_bound.get()]
@@ -5,6 +5,8 @@ from colorama import Fore, Style
 from PIL import Image
 from .functionVisualiser import FunctionVisualiserApp
 from .error_handler import handle_error, reset_error_box
+from .input_handler import compile_functions, MAX_FUNCTIONS
+from .compile_pool import warm_up
 from typing import Optional
 
 warnings.filterwarnings("ignore", category=UserWarning) # Ignore any warnings about CTkImages when using "" to hide an image icon
@@ -30,6 +32,8 @@ class InputGUI(ctk.CTk):
         self.columnconfigure(1, weight=20)
 
         self.functionVisualiser = None
+        self.compile_job = None # Functions being compiled in worker processes for the next plot
+        warm_up() # Start the process functions are compiled in while the menu is filled in
         self.title("Function Visualiser")
         self.geometry("x".join([SCREEN_WIDTH, SCREEN_HEIGHT]))
         self.resizable(False, False)
@@ -40,7 +44,7 @@ class InputGUI(ctk.CTk):
         self.number_function_label = ctk.CTkLabel(self, text="Number of functions", text_color=LIGHT_GREEN, font=(None, 20, "bold"), width=300)
         self.number_function_label.grid(row=0, column=0, padx=5, pady=5)
 
-        self.function_number_entry = ctk.CTkEntry(self, placeholder_text="Enter between 1 to 8 functions:", text_color=DARK_GREY, font= (None, 15), width=300, height=50)
+        self.function_number_entry = ctk.CTkEntry(self, placeholder_text=f"Enter between 1 to {MAX_FUNCTIONS} functions:", text_color=DARK_GREY, font= (None, 15), width=300, height=50)
         self.function_number_entry.grid(row=1, column=0, padx=5, pady=(0, 5))
         self.function_number_entry.bind("<Return>", self.update_function_number)
 
@@ -56,9 +60,8 @@ class InputGUI(ctk.CTk):
         self.function_info_button.bind("<Enter>", self.button_hover_function_info_button)
         self.function_info_button.bind("<Leave>", self.off_button_hover_function_info_button)
 
-        self.function_frame = ctk.CTkFrame(self, width=290, height=384) 
+        self.function_frame = ctk.CTkScrollableFrame(self, width=270, height=374) # Scrolls once there are more function entries than fit
         self.function_frame.grid(row=4, column=0, padx=5, pady=5)
-        self.function_frame.grid_propagate(False)
 
         # Function bound elements
         self.bound_label = ctk.CTkLabel(self, text="Graph bounds", text_color=LIGHT_GREEN, font=(None, 20, "bold"), width=300)
@@ -113,16 +116,16 @@ class InputGUI(ctk.CTk):
         self.function_number_entry.delete(0, ctk.END) # Remove the entire entry from the function box
         try:            
             content = int(user_input)
-            if (content < 1) or (content > 8):
+            if (content < 1) or (content > MAX_FUNCTIONS):
                 raise ValueError
             
         except ValueError:
-                self.error_label.configure(text="Make sure you input a whole number between 1 to 8!", image=self.error_icon)
+                self.error_label.configure(text=f"Make sure you input a whole number between 1 to {MAX_FUNCTIONS}!", image=self.error_icon)
                 return
 
         self.error_label.configure(text="", image="") # If not errors are raised then remove the content in the error_label
         for i in range(content):
-            entry = ctk.CTkEntry(self.function_frame, placeholder_text=f"f{i+1}:", text_color=DARK_GREY, font=(None, 12, "bold"), width=280)
+            entry = ctk.CTkEntry(self.function_frame, placeholder_text=f"f{i+1}:", text_color=DARK_GREY, font=(None, 12, "bold"), width=255)
             entry.grid(row=i, column=0, padx=5, pady=10, sticky="w")
             self.function_entries.append(entry)
     
@@ -137,7 +140,7 @@ class InputGUI(ctk.CTk):
             function_info_frame.grid(row=0, column=0, padx=5, pady=5)
             function_info_title_label = ctk.CTkLabel(function_info_frame, text="How to use:", text_color=LIGHT_GREEN, font=(None, 25, "bold"), width=380, anchor="center", justify="center")
             function_info_title_label.pack(padx=5, pady=5, fill="x")
-            function_info_label = ctk.CTkLabel(function_info_frame, text="• For general operations: (*) Times, (/) division, (-) subtraction, (+) addition , (**) exponentiation\n\n• Ensure to use exp(x) instead of writing e**x\n\n• Enter in between 1 to 8 valid functions\n\n• Enter in valid graph bounds at the bottom", text_color=DARK_GREY, font=(None, 15, "bold"), width=380, height=250, wraplength=370, anchor="nw", justify="left")
+            function_info_label = ctk.CTkLabel(function_info_frame, text=f"• For general operations: (*) Times, (/) division, (-) subtraction, (+) addition , (**) exponentiation\n\n• Ensure to use exp(x) instead of writing e**x\n\n• Enter in between 1 to {MAX_FUNCTIONS} valid functions\n\n• Enter in valid graph bounds at the bottom", text_color=DARK_GREY, font=(None, 15, "bold"), width=380, height=250, wraplength=370, anchor="nw", justify="left")
             function_info_label.pack(padx=5, pady=10, fill="x")
             self.function_info_window.grid_rowconfigure(0, weight=1, minsize=1)
             self.function_info_window.grid_columnconfigure(0, weight=1, minsize=1)
@@ -148,10 +151,20 @@ class InputGUI(ctk.CTk):
         self.function_info_window.destroy()
         self.function_info_window = None
 
-    # Method to process all inputted parameters and plot an interactive plot of all the transformations
+    # Method to process all inputted parameters and plot an interactive plot of all the transformations, once the functions are compiled without blocking the window
     def plot_functions(self) -> None:
+        self.__compile_then(lambda compiled: self.__plot(compiled))
+
+    def __plot(self, compiled, data=None) -> None:
+        self.compile_job = None
         self.functionVisualiser = FunctionVisualiserApp(self)
-        self.functionVisualiser.run()
+        self.functionVisualiser.run(data, compiled)
+
+    # Method to compile the functions in the background and call on_compiled with them, replacing any compilation still running for an earlier plot
+    def __compile_then(self, on_compiled) -> None:
+        if self.compile_job is not None:
+            self.compile_job.cancel()
+        self.compile_job = compile_functions(self, on_compiled)
 
     def button_hover_function_info_button(self, event) -> None:
         self.function_info_button.configure(border_color=LIGHT_GREEN)
@@ -191,12 +204,13 @@ class InputGUI(ctk.CTk):
 
     # Run the plot with data
     def load_data(self, data) -> None:
-        self.functionVisualiser = FunctionVisualiserApp(self)
-        self.functionVisualiser.run(data)
+        self.__compile_then(lambda compiled: self.__plot(compiled, data))
 
     # Method to deal with closing the window properly 
     def on_quit(self):
         plt.close("all")
+        if self.compile_job is not None:
+            self.compile_job.cancel() # Kill any workers still compiling
         for after_id in self.tk.eval('after info').split():
             self.after_cancel(after_id) # Cancel any after callbacks by their ids
         self.destroy()
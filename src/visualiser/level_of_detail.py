@@ -0,0 +1,140 @@
+import math
+import numpy as np
+from collections import OrderedDict
+from typing import Optional
+from src.transformations.operator_cache import CacheInfo
+from .sampling import adaptive_sample
+from .pyramid import MinMaxPyramid, MAX_BUCKETS
+
+"""Script to resample functions over the visible part of the graph whenever it is zoomed or panned, at a density matched to the width of the axes in pixels"""
+
+TILE_PIXELS = 256 # Width of a tile in pixels, at the zoom level it belongs to
+OVERSAMPLE = 2 # Uniformly spaced points per pixel each tile starts from
+TILE_BUDGET = 4 * TILE_PIXELS * OVERSAMPLE # Point budget of a tile, once refined where the curve bends or jumps
+PIXEL_TOLERANCE = 0.25 # Largest distance in pixels between a curve and the straight lines drawn through its points
+MARGIN = 0.5 # Fraction of the visible width sampled on either side, so small pans and transformations don't reveal the ends of the curve
+DEBOUNCE_DELAY = 150 # Milliseconds without any change to the view before resampling
+TILE_CACHE_SIZE = 512
+ENVELOPE_BUCKETS = 8 # Finest pyramid buckets per pixel before the envelope is drawn instead of tiles, so only really wide views lose the breaks the tiles mark
+
+# Function returning the (min, max) x values whose points can be visible within xlim and ylim after any of the transforms, by undoing each transform on the corners of the view.
+# None is returned when a transform can't be undone (such as a projection), as then any x value could be visible
+def parameter_range(transforms: list, xlim: tuple, ylim: tuple) -> Optional[tuple]:
+    corners_x, corners_y = np.array([xlim[0], xlim[1], xlim[0], xlim[1]]), np.array([ylim[0], ylim[0], ylim[1], ylim[1]])
+    t_min, t_max = np.inf, -np.inf
+    for transform in transforms:
+        try:
+            x, _ = transform.inverse().apply(corners_x, corners_y)
+        except Exception:
+            return None
+        t_min, t_max = min(t_min, x.min()), max(t_max, x.max())
+    if not (np.isfinite(t_min) and np.isfinite(t_max)) or t_max <= t_min:
+        return None
+    return float(t_min), float(t_max)
+
+"""Class which samples functions in tiles of x values for each zoom level, keeping recently used tiles so going back to a previous view doesn't evaluate anything.
+When zoomed out far enough, the min/max envelope from a pyramid over the domain is drawn instead"""
+class LevelOfDetail:
+
+    # Constructor, when a canvas is given requests are debounced with one of its timers. A pyramid of each function is built over the (min, max) domain the first time it is needed.
+    # Regions holds the regions where each function was found to be NaN or infinite, whose edges tiles refine towards
+    def __init__(self, funcs: list, canvas=None, delay: int = DEBOUNCE_DELAY, cache_size: int = TILE_CACHE_SIZE, domain: tuple = None, regions: list = None) -> None:
+        self.funcs = funcs
+        self.domain = domain
+        self.regions = regions
+        self.cache_size = cache_size
+        self.__pyramids = {}
+        self.hits = 0
+        self.misses = 0
+        self.__tiles = OrderedDict() # Maps (function index, zoom level, tile index) to the (x, y) samples of the tile
+        self.__pending = None
+        self.__timer = None
+        if canvas is not None:
+            self.__timer = canvas.new_timer(interval=delay)
+            self.__timer.single_shot = True
+            self.__timer.add_callback(self.__fire)
+
+    # Method to run update once the view has stopped changing for the delay, every request restarts the wait and only the latest update is run
+    def request(self, update) -> None:
+        self.__pending = update
+        if self.__timer is None:
+            self.__fire()
+            return
+        self.__timer.stop()
+        self.__timer.start()
+
+    # Method to run the pending update straight away, if there is one
+    def flush(self) -> None:
+        if self.__pending is not None:
+            if self.__timer is not None:
+                self.__timer.stop()
+            self.__fire()
+
+    def __fire(self) -> None:
+        update, self.__pending = self.__pending, None
+        if update is not None:
+            update()
+
+    # Method to sample function index between t_min and t_max for axes which are pixels wide, padded by the margin on either side. Returns the sorted (x, y)
+    def sample(self, index: int, t_min: float, t_max: float, pixels: float) -> tuple[np.ndarray, np.ndarray]:
+        if t_max <= t_min or pixels <= 0:
+            raise ValueError("Sampled range and width in pixels must be positive")
+        units_per_pixel = (t_max - t_min) / pixels
+        margin = (t_max - t_min) * MARGIN
+        if self.domain is not None and (self.domain[1] - self.domain[0]) / MAX_BUCKETS * ENVELOPE_BUCKETS <= units_per_pixel: # Checked before the pyramid is built
+            pyramid = self.pyramid(index)
+            if pyramid.covers(t_min, t_max): # The margins are cut off at the ends of the domain
+                return pyramid.envelope(t_min - margin, t_max + margin, pixels * (1 + 2*MARGIN))
+
+        level = math.floor(math.log2(units_per_pixel))
+        tile_width = TILE_PIXELS * 2.0**level
+        first, last = math.floor((t_min - margin) / tile_width), math.floor((t_max + margin) / tile_width)
+
+        xs, ys = [], []
+        for k in range(first, last + 1):
+            x, y = self.__tile(index, level, k, tile_width)
+            start = 1 if xs else 0 # Neighbouring tiles share the point where they meet
+            xs.append(x[start:])
+            ys.append(y[start:])
+        return np.concatenate(xs), np.concatenate(ys)
+
+    # Method returning the min/max pyramid of function index over the domain, building it the first time
+    def pyramid(self, index: int) -> MinMaxPyramid:
+        pyramid = self.__pyramids.get(index)
+        if pyramid is None:
+            pyramid = self.__pyramids[index] = MinMaxPyramid(self.funcs[index], *self.domain)
+        return pyramid
+
+    # Method to retrieve the samples of one tile, sampling it if it isn't cached
+    def __tile(self, index: int, level: int, k: int, tile_width: float) -> tuple[np.ndarray, np.ndarray]:
+        key = (index, level, k)
+        tile = self.__tiles.get(key)
+        if tile is not None:
+            self.hits += 1
+            self.__tiles.move_to_end(key)
+            return tile
+
+        self.misses += 1
+        start, end = k * tile_width, (k + 1) * tile_width
+        x = np.linspace(start, end, TILE_PIXELS * OVERSAMPLE + 1)
+        units_per_pixel = tile_width / TILE_PIXELS
+        tile = adaptive_sample(self.funcs[index], start, end, y_scale=units_per_pixel, budget=TILE_BUDGET, tolerance=PIXEL_TOLERANCE, x=x,
+                               regions=self.regions[index] if self.regions else None)
+        if len(tile[0]) >= TILE_BUDGET: # The curve changes faster than the pixels can show, so draw its min/max envelope instead
+            tile = MinMaxPyramid(self.funcs[index], start, end, buckets=TILE_PIXELS).envelope(start, end, TILE_PIXELS)
+        for array in tile:
+            array.flags.writeable = False # Tiles are shared between every view they are part of
+        self.__tiles[key] = tile
+        if len(self.__tiles) > self.cache_size:
+            self.__tiles.popitem(last=False) # Evict the least recently used tile
+        return tile
+
+    # Method returning the hits, misses, maximum size and current size of the tile cache
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.cache_size, len(self.__tiles))
+
+    # Method to empty the tile cache
+    def cache_clear(self) -> None:
+        self.__tiles.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,108 @@
+import numpy as np
+from matplotlib.lines import Line2D
+from src.transformations.affine import AffineTransform
+
+"""Script to keep track of every plotted function along with its lines, samples and transformations, so each one is found without searching
+and only the lines whose samples or transformation changed are recomputed"""
+
+# Function to check if two transformations have exactly the same matrix. AffineTransform equality allows for rounding error,
+# which would let small but real changes (such as a translation of 0.009) go unnoticed and leave a line out of date
+def same_transform(t1: AffineTransform, t2: AffineTransform) -> bool:
+    return t1 is t2 or np.array_equal(t1.matrix.as_array(), t2.matrix.as_array())
+
+"""Class holding one plotted function: its line, the transformation line previewing it (Line2D artists, or views of a curve collection), its samples before any transformation and its transformations.
+The line is dirty when its samples or transformation changed since its data was last uploaded to it"""
+class LineRecord:
+
+    __slots__ = ("id", "label", "line", "transformation_line", "initial_data", "current_data", "transform", "preview_transform", "selected", "dirty")
+
+    # Constructor, records start selected with the identity transformation
+    def __init__(self, id: int, label: str, line: Line2D, transformation_line: Line2D, data: tuple) -> None:
+        self.id = id
+        self.label = label
+        self.line = line
+        self.transformation_line = transformation_line
+        self.initial_data = data # (x, y) samples before any transformation
+        self.current_data = data # (x, y) data of the line
+        self.transform = AffineTransform() # Accumulated transformation, relative to the initial data
+        self.preview_transform = self.transform # Transformation shown by the transformation line
+        self.selected = True
+        self.dirty = False
+
+    # Method to check if the transformation line shows something other than the line, by comparing the transformations rather than their points
+    def previewing(self) -> bool:
+        return not same_transform(self.preview_transform, self.transform)
+
+    # Method to change the previewed transformation, returns whether it changed
+    def set_preview(self, transform: AffineTransform) -> bool:
+        changed = not same_transform(transform, self.preview_transform)
+        self.preview_transform = transform
+        return changed
+
+    # Method to change the accumulated transformation, which also stops any preview
+    def set_transform(self, transform: AffineTransform) -> None:
+        if not same_transform(transform, self.transform):
+            self.dirty = True
+        self.transform = self.preview_transform = transform
+
+    # Method to replace the samples of the function
+    def set_samples(self, data: tuple) -> None:
+        self.initial_data = data
+        self.dirty = True
+
+    # Method to recompute the data of the line and upload it to the line if it is dirty, returns whether it was
+    def upload(self) -> bool:
+        if not self.dirty:
+            return False
+        self.current_data = self.transform.apply(*self.initial_data)
+        self.line.set_data(*self.current_data)
+        self.dirty = False
+        return True
+
+    # Method to show or hide the transformation line, it is only shown for selected functions with a preview
+    def update_visibility(self) -> None:
+        self.transformation_line.set_visible(self.selected and self.previewing())
+
+"""Class holding a record for each plotted function, which can be looked up by its id (the order it was added in) or its label"""
+class LineRegistry:
+
+    # Constructor for an empty registry
+    def __init__(self) -> None:
+        self.__records = []
+        self.__labels = {} # Maps each label to the id of the first function with it
+
+    # Method to add a function with its line and transformation line, returns its record
+    def add(self, label: str, line: Line2D, transformation_line: Line2D, data: tuple) -> LineRecord:
+        record = LineRecord(len(self.__records), label, line, transformation_line, data)
+        self.__records.append(record)
+        self.__labels.setdefault(label, record.id)
+        return record
+
+    # Method returning the record with an id
+    def __getitem__(self, id: int) -> LineRecord:
+        return self.__records[id]
+
+    # Method returning the record of the first function with a label
+    def find(self, label: str) -> LineRecord:
+        try:
+            return self.__records[self.__labels[label]]
+        except KeyError:
+            raise ValueError(f"No function is labelled {label!r}") from None
+
+    def __iter__(self):
+        return iter(self.__records)
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    # Method returning the records of the selected functions
+    def selected(self) -> list[LineRecord]:
+        return [record for record in self.__records if record.selected]
+
+    # Method returning the records whose line needs its data uploaded
+    def dirty(self) -> list[LineRecord]:
+        return [record for record in self.__records if record.dirty]
+
+    # Method to upload the data of every dirty line, returns the number of lines uploaded
+    def upload(self) -> int:
+        return sum(record.upload() for record in self.__records)
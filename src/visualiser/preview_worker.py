@@ -0,0 +1,132 @@
+import queue
+import threading
+from collections import namedtuple
+import numpy as np
+from .curve_collection import transform_curves
+
+"""Script to compute transformation previews on a background thread, so dense functions don't block mouse and keyboard handling on the GUI thread while a slider is dragged.
+Each preview is given a generation number and only results from the newest generation are shown, anything older is discarded"""
+
+POLL_INTERVAL = 10 # Milliseconds between the GUI thread checking for finished previews
+
+# Work sent to the worker: the generation it belongs to and a tuple of (index, transform, x, y) for each previewed function, where x and y are read only
+PreviewJob = namedtuple("PreviewJob", ["generation", "items"])
+
+# Function returning read only views of arrays, so the worker never sees them change
+def freeze(*arrays) -> tuple[np.ndarray, ...]:
+    views = tuple(np.asarray(array).view() for array in arrays)
+    for view in views:
+        view.flags.writeable = False
+    return views
+
+# Function computing a preview, returning a list of (index, x, y) with each function's points after its transform
+def compute_preview(job: PreviewJob) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    return [(index, *transform.apply(x, y)) for index, transform, x, y in job.items]
+
+# Function computing a preview with one pass over the points of every function, rather than one pass per function, for when there are many functions
+def compute_preview_batched(job: PreviewJob) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    curves = transform_curves([(transform, x, y) for _, transform, x, y in job.items])
+    return [(index, x, y) for (index, *_), (x, y) in zip(job.items, curves)]
+
+"""Class which runs previews on a single worker thread and hands the newest result back to the GUI thread. Only the newest job waiting to start is kept.
+When a canvas is given its timer polls for results, otherwise poll or wait has to be called"""
+class PreviewWorker:
+
+    # Constructor, on_result is called on the GUI thread with the result of the newest preview
+    def __init__(self, on_result, canvas=None, compute=compute_preview, interval: int = POLL_INTERVAL) -> None:
+        self.on_result = on_result
+        self.compute = compute
+        self.generation = 0 # Generation of the newest job, results of any other generation are stale
+        self.delivered = 0 # Generation of the last result handed to on_result
+        self.discarded = 0 # Results dropped because a newer job was submitted (or the previews were cancelled) before they arrived
+        self.__job = None # The newest job which hasn't been started
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__results = queue.SimpleQueue() # (generation, result or error) posted by the worker
+        self.__timer = None
+        if canvas is not None:
+            self.__timer = canvas.new_timer(interval=interval)
+            self.__timer.add_callback(self.poll)
+        self.__thread = threading.Thread(target=self.__work, name="preview-worker", daemon=True)
+        self.__thread.start()
+
+    # Method to submit a preview of the (index, transform, x, y) items, replacing any job which hasn't started yet. Returns the generation of the job
+    def submit(self, items) -> int:
+        if self.__closed:
+            raise RuntimeError("Preview worker is closed")
+        with self.__condition:
+            self.generation += 1
+            self.__job = PreviewJob(self.generation, tuple((index, transform, *freeze(x, y)) for index, transform, x, y in items))
+            self.__condition.notify()
+        if self.__timer is not None:
+            self.__timer.start()
+        return self.generation
+
+    # Method to check if the newest preview hasn't been shown yet
+    def pending(self) -> bool:
+        return self.delivered != self.generation
+
+    # Method to make every preview submitted so far stale, such as when the transformations are changed directly by undo or reset
+    def cancel(self) -> None:
+        with self.__condition:
+            self.generation += 1
+            self.__job = None
+        self.delivered = self.generation
+
+    # Method run on the GUI thread which hands the newest finished result to on_result, discarding stale ones. Errors raised computing the newest preview are raised here.
+    # Returns True if a result was handed over
+    def poll(self) -> bool:
+        newest = None
+        while True:
+            try:
+                generation, result = self.__results.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self.generation:
+                newest = result
+            else:
+                self.discarded += 1
+        if not self.pending() and self.__timer is not None:
+            self.__timer.stop() # Nothing is outstanding, so stop polling
+        if newest is None:
+            return False
+        self.delivered = self.generation
+        if isinstance(newest, Exception):
+            raise newest
+        self.on_result(newest)
+        return True
+
+    # Method to block until the newest preview is finished and hand it over, returns False if it didn't finish within the timeout (in seconds)
+    def wait(self, timeout: float = None) -> bool:
+        while self.pending():
+            try:
+                generation, result = self.__results.get(timeout=timeout)
+            except queue.Empty:
+                return False
+            self.__results.put((generation, result)) # Put back so poll discards or delivers it with anything else queued
+            self.poll()
+        return True
+
+    # Method to stop the worker thread once it finishes its current job
+    def close(self, _=None) -> None:
+        with self.__condition:
+            self.__closed = True
+            self.__job = None
+            self.__condition.notify()
+        if self.__timer is not None:
+            self.__timer.stop()
+        self.__thread.join()
+
+    def __work(self) -> None:
+        while True:
+            with self.__condition:
+                while self.__job is None and not self.__closed:
+                    self.__condition.wait()
+                if self.__closed:
+                    return
+                job, self.__job = self.__job, None
+            try:
+                result = self.compute(job)
+            except Exception as e:
+                result = e
+            self.__results.put((job.generation, result))
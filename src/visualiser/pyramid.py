@@ -0,0 +1,96 @@
+import math
+import numpy as np
+
+"""Script to decimate curves over very wide ranges, keeping the minimum and maximum of each bucket of x values at several resolutions"""
+
+MAX_BUCKETS = 2**14 # Buckets at the finest level, whatever the width of the range, so memory doesn't grow with it
+SAMPLES_PER_BUCKET = 16 # Points each finest bucket is evaluated at
+CHUNK_BUCKETS = 512 # Buckets evaluated at a time, so evaluating never holds more than CHUNK_BUCKETS*SAMPLES_PER_BUCKET points
+JUMP_SHARE = 0.4 # A bucket jumps when a single step between its samples is more than this share of all of its steps, a continuous (or too quickly oscillating) curve spreads them out
+
+"""Class holding a multi-resolution pyramid of the per bucket minimum and maximum of a function, where each level has half the buckets of the one below it.
+The x value of each minimum and maximum is kept so they are drawn in order, and buckets where the function jumps or isn't finite are marked as breaks"""
+class MinMaxPyramid:
+
+    # Constructor which evaluates f between start and end in chunks. NaN and infinite values are ignored unless a whole bucket is NaN or infinite, but they make the bucket a break
+    def __init__(self, f, start: float, end: float, buckets: int = MAX_BUCKETS, samples: int = SAMPLES_PER_BUCKET, chunk_buckets: int = CHUNK_BUCKETS) -> None:
+        if end <= start:
+            raise ValueError("end must be larger than start")
+        if buckets < 1 or samples < 2:
+            raise ValueError("A pyramid needs at least one bucket and two samples per bucket")
+        self.start = float(start)
+        self.end = float(end)
+        self.resolution = (self.end - self.start) / buckets # Width of the finest buckets
+
+        mins, maxs = np.empty(buckets), np.empty(buckets)
+        min_x, max_x = np.empty(buckets), np.empty(buckets)
+        breaks = np.empty(buckets, dtype=bool)
+        offsets = np.linspace(0, 1, samples)
+        for first in range(0, buckets, chunk_buckets):
+            indices = np.arange(first, min(first + chunk_buckets, buckets))
+            rows = np.arange(len(indices))
+            x = self.start + (indices[:, None] + offsets) * self.resolution
+            with np.errstate(all="ignore"):
+                y = np.array(np.broadcast_to(np.asarray(f(x), dtype=float), x.shape))
+            non_finite = ~np.isfinite(y)
+            y[non_finite] = np.nan
+            lowest, highest = np.where(non_finite, np.inf, y).argmin(axis=1), np.where(non_finite, -np.inf, y).argmax(axis=1)
+            mins[indices], maxs[indices] = y[rows, lowest], y[rows, highest] # NaN only when the whole bucket is
+            min_x[indices], max_x[indices] = x[rows, lowest], x[rows, highest]
+            with np.errstate(all="ignore"):
+                steps = np.abs(np.diff(y, axis=1))
+                breaks[indices] = non_finite.any(axis=1) | (np.fmax.reduce(steps, axis=1) > JUMP_SHARE * np.nansum(steps, axis=1))
+
+        # Each coarser level merges pairs of buckets from the level below it
+        self.levels = [(mins, maxs)]
+        self.positions = [(min_x, max_x)] # x values of the minimum and maximum of each bucket
+        self.breaks = [breaks]
+        while len(mins) > 1:
+            if len(mins) % 2:
+                mins, maxs, min_x, max_x, breaks = (np.append(array, array[-1]) for array in (mins, maxs, min_x, max_x, breaks))
+            left_min = ~(mins[1::2] < mins[0::2]) # NaN buckets never win
+            left_max = ~(maxs[1::2] > maxs[0::2])
+            min_x = np.where(left_min, min_x[0::2], min_x[1::2])
+            max_x = np.where(left_max, max_x[0::2], max_x[1::2])
+            mins = np.fmin(mins[0::2], mins[1::2])
+            maxs = np.fmax(maxs[0::2], maxs[1::2])
+            breaks = breaks[0::2] | breaks[1::2]
+            self.levels.append((mins, maxs))
+            self.positions.append((min_x, max_x))
+            self.breaks.append(breaks)
+
+    # Method to check if the pyramid contains every x value between t_min and t_max
+    def covers(self, t_min: float, t_max: float) -> bool:
+        return self.start <= t_min and t_max <= self.end
+
+    # Method returning the width of the buckets at a level
+    def bucketWidth(self, level: int) -> float:
+        return self.resolution * 2**level
+
+    # Method returning the (x, y) envelope of the curve between t_min and t_max with at most about pixels buckets, using the finest level that allows.
+    # Each bucket gives its minimum and maximum at the x values they were found at, in order, so no more than about 2*pixels points are drawn.
+    # A NaN point is put between the two points of buckets which are breaks, so no line is drawn across a jump or where the function isn't finite
+    def envelope(self, t_min: float, t_max: float, pixels: float) -> tuple[np.ndarray, np.ndarray]:
+        t_min, t_max = max(t_min, self.start), min(t_max, self.end)
+        if t_max <= t_min or pixels < 1:
+            raise ValueError("Envelope range and width in pixels must be positive")
+        level = max(0, math.ceil(math.log2((t_max - t_min) / self.resolution / pixels)))
+        level = min(level, len(self.levels) - 1)
+        width = self.bucketWidth(level)
+        first = max(0, math.floor((t_min - self.start) / width))
+        last = min(len(self.levels[level][0]), math.ceil((t_max - self.start) / width))
+        mins, maxs = (array[first:last] for array in self.levels[level])
+        min_x, max_x = (array[first:last] for array in self.positions[level])
+        breaks = self.breaks[level][first:last]
+        min_first = min_x <= max_x
+        x1, x2 = np.where(min_first, min_x, max_x), np.where(min_first, max_x, min_x)
+        y1, y2 = np.where(min_first, mins, maxs), np.where(min_first, maxs, mins)
+        defined = ~np.isnan(mins) # Buckets where the function is never finite are a single NaN point
+        keep = np.column_stack((defined, breaks, defined)).ravel()
+        x = np.column_stack((x1, (x1 + x2) / 2, x2)).ravel()[keep]
+        y = np.column_stack((y1, np.full(len(y1), np.nan), y2)).ravel()[keep]
+        return x, y
+
+    # Method returning the number of bytes held by the pyramid
+    def nbytes(self) -> int:
+        return sum(array.nbytes for arrays in (*self.levels, *self.positions) for array in arrays) + sum(breaks.nbytes for breaks in self.breaks)
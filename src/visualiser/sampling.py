@@ -0,0 +1,145 @@
+import numpy as np
+
+"""Script to adaptively sample functions, refining only the intervals where the curve bends or jumps instead of sampling everything uniformly.
+Discontinuities and the parts of the domain where a function is undefined are marked with a single NaN point, which matplotlib draws as a break in the line"""
+
+INITIAL_POINTS = 257 # Uniformly spaced points every function starts from
+MAX_POINTS = 4096 # Point budget of each function
+TOLERANCE = 2.5e-4 # Largest distance between the curve and its straight line approximation, as a fraction of the height of the graph
+OFF_VIEW_TOLERANCE = 4 # Outside of the view curves are only brought into sight by transformations, so the tolerance there is this many times larger
+MIN_INTERVAL = 1e-9 # Intervals are never refined below this width, as a fraction of the sampled range, so jumps stop refining
+JUMP_FACTOR = 40 # Neighbouring points whose y values differ by more than this many times the tolerance are checked for a discontinuity
+BREAK_ITERATIONS = 40 # Number of times an interval is halved towards a suspected discontinuity
+
+# Helper function to evaluate a function on an array of x values, broadcasting constant results and ignoring domain warnings
+def _evaluate(f, x: np.ndarray) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+
+# Function returning the sorted edges of the (start, end) regions which lie strictly between min_x and max_x
+def region_edges(regions: list, min_x: float, max_x: float) -> np.ndarray:
+    edges = np.unique(np.ravel(regions)) if regions else np.empty(0)
+    return edges[(edges > min_x) & (edges < max_x)]
+
+# Function to find the discontinuities between neighbouring finite points, where y changes by more than jump. Each suspected interval is halved towards the side with the larger change:
+# the change shrinks with the interval for a continuous function, but stays large across a jump or asymptote (or the function stops being finite inside it).
+# Returns the indices of the intervals containing a discontinuity and the x value of each discontinuity
+def find_breaks(f, x: np.ndarray, y: np.ndarray, jump: float, iterations: int = BREAK_ITERATIONS) -> tuple[np.ndarray, np.ndarray]:
+    with np.errstate(all="ignore"):
+        changes = np.abs(np.diff(y))
+    candidates = np.flatnonzero(np.isfinite(y[:-1]) & np.isfinite(y[1:]) & (changes > jump))
+    a, b, y_a, y_b = x[candidates], x[candidates+1], y[candidates], y[candidates+1]
+    initial = changes[candidates]
+    broken = np.zeros(candidates.size, dtype=bool)
+
+    for _ in range(iterations):
+        if not candidates.size:
+            break
+        m = (a + b) / 2
+        y_m = _evaluate(f, m)
+        broken |= ~np.isfinite(y_m)
+        left = np.abs(y_m - y_a) >= np.abs(y_b - y_m)
+        searching = ~broken
+        b, y_b = np.where(searching & left, m, b), np.where(searching & left, y_m, y_b)
+        a, y_a = np.where(searching & ~left, m, a), np.where(searching & ~left, y_m, y_a)
+
+    with np.errstate(all="ignore"):
+        broken |= np.abs(y_b - y_a) > initial * 2.0**(-iterations / 2) # A continuous function would have shrunk by about 2**-iterations
+    return candidates[broken], ((a + b) / 2)[broken]
+
+# Function to insert a NaN point at each break, after the interval (indexed by its left point) containing it
+def insert_breaks(x: np.ndarray, y: np.ndarray, intervals: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return np.insert(x, intervals + 1, positions), np.insert(y, intervals + 1, np.nan)
+
+# Function to replace every run of NaN or infinite points with a single NaN point, so points which aren't drawn aren't transformed either
+def compact_non_finite(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    non_finite = ~np.isfinite(y)
+    keep = ~non_finite
+    keep[1:] |= non_finite[1:] & ~non_finite[:-1] # Keep the first point of each run
+    keep[0] |= non_finite[0]
+    x, y = x[keep], y[keep]
+    y[~np.isfinite(y)] = np.nan
+    return x, y
+
+# Function to work out how far the midpoint of each interval is from the straight line between its ends, relative to y_scale.
+# Intervals where only some of the three points are NaN or infinite are given an infinite error, as the function leaves its domain or jumps inside them
+def interval_errors(y_left: np.ndarray, y_mid: np.ndarray, y_right: np.ndarray, y_scale: float) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        errors = np.abs(y_mid - (y_left + y_right) / 2) / y_scale
+    finite = np.isfinite(y_left) & np.isfinite(y_mid) & np.isfinite(y_right)
+    non_finite = ~np.isfinite(y_left) & ~np.isfinite(y_mid) & ~np.isfinite(y_right)
+    errors[~finite] = np.inf
+    errors[non_finite] = 0.0
+    return errors
+
+# Function to adaptively sample f between min_x and max_x, starting from a uniform grid (or the given x values, with their y values) and repeatedly halving the intervals
+# whose midpoint is further than tolerance*y_scale from the straight line between their ends, until none are or the point budget is used up. Returns the sorted (x, y).
+# When the visible (min, max) x range is given as view, intervals outside of it are only refined once the visible part of the curve is done, so the budget is spent where the curve is seen.
+# The edges of the regions where the function was found to be NaN or infinite (on a coarser grid) are added to the starting points, so the intervals where it leaves its domain are refined.
+# Regions are only hints, every point is still evaluated. When breaks is True discontinuities are marked and undefined runs are compacted to a single NaN point
+def adaptive_sample(f, min_x: float, max_x: float, y_scale: float = 1.0, budget: int = MAX_POINTS, tolerance: float = TOLERANCE,
+                    x: np.ndarray = None, y: np.ndarray = None, view: tuple = None, regions: list = None, breaks: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    if max_x <= min_x:
+        raise ValueError("max_x must be larger than min_x")
+    if x is None:
+        x = np.linspace(min_x, max_x, INITIAL_POINTS)
+    if y is None:
+        y = _evaluate(f, x)
+    x, y = np.asarray(x, dtype=float), np.array(y, dtype=float)
+    edges = np.setdiff1d(region_edges(regions, min_x, max_x), x)
+    if edges.size:
+        positions = np.searchsorted(x, edges)
+        x, y = np.insert(x, positions, edges), np.insert(y, positions, _evaluate(f, edges))
+    jump = JUMP_FACTOR * tolerance * y_scale
+    min_width = (max_x - min_x) * MIN_INTERVAL
+    max_view_width = None if view is None else (view[1] - view[0]) / (INITIAL_POINTS - 1)
+    active = np.arange(len(x) - 1) # Intervals (indexed by their left point) which haven't been checked yet
+    deferred = np.arange(0) # Intervals outside of the view, checked once there are no active intervals left
+
+    while len(x) < budget:
+        if view is not None:
+            outside = (x[active+1] < view[0]) | (x[active] > view[1])
+            deferred = np.union1d(deferred, active[outside])
+            active = active[~outside]
+        if not active.size:
+            if not deferred.size:
+                break
+            active, deferred, view = deferred, deferred[:0], None # The visible part of the curve is done, move on to the rest
+            tolerance *= OFF_VIEW_TOLERANCE
+
+        x_mid = (x[active] + x[active+1]) / 2
+        y_mid = _evaluate(f, x_mid)
+        errors = interval_errors(y[active], y_mid, y[active+1], y_scale)
+        widths = x[active+1] - x[active]
+        if view is not None:
+            errors[widths > max_view_width] = np.inf # The view is always sampled at least as densely as the starting grid, so fast oscillations can't hide between its points
+        chosen = np.flatnonzero((errors > tolerance) & (widths > min_width))
+
+        # When the budget doesn't allow every interval to be refined, the ones furthest from being straight go first
+        remaining = budget - len(x)
+        if chosen.size > remaining:
+            chosen = chosen[np.argpartition(-errors[chosen], remaining - 1)[:remaining]]
+            chosen.sort()
+
+        # Insert the midpoints, each refined interval becomes two new intervals to check
+        left = active[chosen]
+        x = np.insert(x, left + 1, x_mid[chosen])
+        y = np.insert(y, left + 1, y_mid[chosen])
+        deferred = deferred + np.searchsorted(left, deferred) # Deferred intervals move along by the number of midpoints inserted before them
+        shifted = left + np.arange(left.size) # Position of each refined interval after the midpoints before it are inserted
+        active = np.concatenate((shifted, shifted + 1))
+        active.sort()
+
+    if breaks:
+        x, y = compact_non_finite(*insert_breaks(x, y, *find_breaks(f, x, y, jump)))
+    return x, y
+
+# Function to adaptively sample several functions, the shared starting grid is evaluated for all of them at once by evaluator (which returns the y values of every function)
+# Regions is a list with the regions where each function was found to be NaN or infinite, used as hints for where to refine
+def adaptive_sample_all(evaluator, funcs: list, min_x: float, max_x: float, y_scale: float = 1.0, budget: int = MAX_POINTS,
+                        tolerance: float = TOLERANCE, view: tuple = None, regions: list = None) -> list[tuple[np.ndarray, np.ndarray]]:
+    x = np.linspace(min_x, max_x, INITIAL_POINTS)
+    with np.errstate(all="ignore"):
+        ys = evaluator(x)
+    regions = regions or [None] * len(funcs)
+    return [adaptive_sample(f, min_x, max_x, y_scale, budget, tolerance, x, y, view, func_regions) for f, y, func_regions in zip(funcs, ys, regions)]
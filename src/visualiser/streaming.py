@@ -0,0 +1,63 @@
+import numpy as np
+
+"""Script to evaluate, transform and write curves in fixed size chunks through generators, so exporting a curve over a huge domain runs in constant memory"""
+
+CHUNK_SIZE = 2**16 # Points held in memory at a time
+
+# Generator yielding (x, y) chunks of num evenly spaced points of f between start and end (inclusive), only one chunk of x values exists at a time
+def evaluate_chunks(f, start: float, end: float, num: int, chunk_size: int = CHUNK_SIZE):
+    if num < 2:
+        raise ValueError("At least two points are needed to evaluate a curve")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+    step = (end - start) / (num - 1)
+    for first in range(0, num, chunk_size):
+        x = start + np.arange(first, min(first + chunk_size, num)) * step
+        if first + chunk_size >= num:
+            x[-1] = end # Avoid rounding error in the last point, as np.linspace does
+        with np.errstate(all="ignore"):
+            y = np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+        yield x, y
+
+# Generator yielding (x, y) chunks which are views of existing arrays
+def array_chunks(x: np.ndarray, y: np.ndarray, chunk_size: int = CHUNK_SIZE):
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same shape")
+    for first in range(0, len(x), chunk_size):
+        yield x[first:first + chunk_size], y[first:first + chunk_size]
+
+# Generator applying an affine transformation to each (x, y) chunk, points outside of the domain of the function stay NaN
+def transform_chunks(chunks, transform):
+    for x, y in chunks:
+        with np.errstate(invalid="ignore"):
+            transformed = transform.apply(x, y)
+        yield transformed
+
+# Function returning a callable which starts a new stream of (x, y) chunks of f each time it is called, transformed when a transform is given.
+# A callable is used rather than a generator because writing a curve goes over its points more than once
+def curve_stream(f, start: float, end: float, num: int, transform=None, chunk_size: int = CHUNK_SIZE):
+    def stream():
+        chunks = evaluate_chunks(f, start, end, num, chunk_size)
+        return chunks if transform is None else transform_chunks(chunks, transform)
+    return stream
+
+# Function returning a callable which starts a new stream of (x, y) chunks over existing arrays each time it is called
+def array_stream(x: np.ndarray, y: np.ndarray, chunk_size: int = CHUNK_SIZE):
+    return lambda: array_chunks(x, y, chunk_size)
+
+# Function to write the values of one coordinate (0 for x, 1 for y) of a stream to a text file as a bracketed comma separated list, one chunk at a time.
+# Values are written with the shortest representation which reads back to exactly the same float
+def write_values(file, chunks, coordinate: int) -> int:
+    count = 0
+    file.write("[")
+    for chunk in chunks:
+        values = chunk[coordinate]
+        if len(values) == 0:
+            continue
+        if count:
+            file.write(",")
+        file.write(",".join(map(repr, values.tolist())))
+        count += len(values)
+    file.write("]")
+    return count
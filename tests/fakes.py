@@ -0,0 +1,56 @@
+# Fake GUI objects shared by the tests, standing in for matplotlib canvases and the custom tkinter window so event driven code can be stepped through by hand
+import time
+
+class FakeTimer:
+    def __init__(self, interval):
+        self.interval = interval
+        self.single_shot = False
+        self.callbacks = []
+        self.running = False
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+    def start(self):
+        self.running = True
+    def stop(self):
+        self.running = False
+    def fire(self):
+        if self.single_shot:
+            self.running = False
+        for callback in self.callbacks:
+            callback()
+
+class FakeCanvas:
+    def new_timer(self, interval):
+        self.timer = FakeTimer(interval)
+        return self.timer
+
+class FakeEntry:
+    def __init__(self, value):
+        self.value = value
+    def get(self):
+        return self.value
+
+class FakeLabel:
+    def __init__(self):
+        self.text = ""
+    def configure(self, text, image):
+        self.text = text
+
+class FakeWindow:
+    def __init__(self, functions, bounds=("-10", "10", "-10", "10")):
+        self.function_entries = [FakeEntry(function) for function in functions]
+        self.min_x_bound, self.max_x_bound, self.min_y_bound, self.max_y_bound = map(FakeEntry, bounds)
+        self.error_label = FakeLabel()
+        self.error_icon = None
+        self.pending = [] # Callbacks scheduled with after, run by run_pending
+    def after(self, ms, callback):
+        self.pending.append(callback)
+    # Runs the callbacks scheduled so far (and any they schedule) until none are left or the timeout passes, returning how many were run
+    def run_pending(self, timeout=30, interval=0.01):
+        deadline = time.monotonic() + timeout
+        count = 0
+        while self.pending and time.monotonic() < deadline:
+            self.pending.pop(0)()
+            count += 1
+            time.sleep(interval)
+        return count
@@ -0,0 +1,73 @@
+# Tests for the affine transformation module
+import unittest
+import numpy as np
+from src.transformations.vector import Vector
+from src.transformations.matrix import Matrix
+from src.transformations.affine import AffineTransform, compose_all
+from src.transformations.transformation import translation, projection, shearing, scaling, reflection, rotation, affine_transform
+
+# Tests that affine transformations agree with the standard transformations and compose correctly
+class TestAffineTransform(unittest.TestCase):
+    # Setup vectors for the affine transformation tests
+    def setUp(self):
+        self.v1 = Vector([1, 2])
+        self.u = Vector([3, -2])
+        self.direction = Vector([np.cos(0.7), np.sin(0.7)])
+
+    # Tests each affine transformation against its standard transformation
+    def test_matches_transformations(self):
+        cases = [(translation, (self.u,)), (projection, (self.u,)), (shearing, (2, 3)), (scaling, (-1, 4)), (reflection, (self.direction,)), (rotation, (self.u, 75))]
+        for t, args in cases:
+            self.assertEqual(affine_transform(t, *args).applyVector(self.v1), t(self.v1, *args))
+
+    # Tests that the identity transformation leaves points unchanged
+    def test_identity(self):
+        identity = AffineTransform()
+        self.assertTrue(identity.isIdentity())
+        self.assertEqual(identity.applyVector(self.v1), self.v1)
+        self.assertFalse(AffineTransform.scaling(2, 1).isIdentity())
+
+    # Tests that composing transformations is the same as applying them one after the other
+    def test_compose(self):
+        first = AffineTransform.rotation(self.u, 30)
+        second = AffineTransform.shearing(0.5, -1)
+        composed = second.compose(first)
+        self.assertEqual(composed.applyVector(self.v1), second.applyVector(first.applyVector(self.v1)))
+
+    # Tests that a chain of transformations collapses into a single transformation
+    def test_compose_all(self):
+        chain = [AffineTransform.translation(self.u), AffineTransform.scaling(2, 3), AffineTransform.rotation(self.u, -45)]
+        v = self.v1
+        for t in chain:
+            v = t.applyVector(v)
+        self.assertEqual(compose_all(chain).applyVector(self.v1), v)
+        self.assertTrue(compose_all([]).isIdentity())
+
+    # Tests that many small rotations compose to a single large rotation
+    def test_compose_repeated_rotation(self):
+        step = AffineTransform.rotation(self.u, 1)
+        self.assertEqual(compose_all([step] * 90), AffineTransform.rotation(self.u, 90))
+
+    # Tests that the inverse undoes the transformation
+    def test_inverse(self):
+        t = AffineTransform.rotation(self.u, 40).compose(AffineTransform.scaling(2, 5))
+        self.assertTrue(t.compose(t.inverse()).isIdentity())
+
+    # Tests applying a transformation to whole arrays of values
+    def test_apply_arrays(self):
+        x = np.linspace(-5, 5, 11)
+        y = x**2
+        xt, yt = AffineTransform.translation(self.u).apply(x, y)
+        self.assertTrue(np.allclose(xt, x + 3))
+        self.assertTrue(np.allclose(yt, y - 2))
+
+    # Tests that invalid matrices are rejected
+    def test_invalid_matrix(self):
+        with self.assertRaises(ValueError):
+            AffineTransform(Matrix([[1, 0], [0, 1]]))
+        with self.assertRaises(TypeError):
+            AffineTransform([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
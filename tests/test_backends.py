@@ -0,0 +1,80 @@
+# Tests for the evaluation backends of compiled functions
+import unittest
+import numpy as np
+from src.visualiser import backends
+import sympy as sp
+from src.visualiser.backends import BACKENDS, ChunkedBackend, backend_modules, select_backend
+from src.visualiser.expression_cache import generate_source, generate_sources
+
+class BackendsTest(unittest.TestCase):
+
+    # Sets up the sources of an expression for every backend module
+    def setUp(self):
+        self.sources = generate_sources(sp.sympify("sqrt(x)*sin(x) + 1/x"), backend_modules())
+        self.x = np.linspace(-10, 10, 1001)
+
+    # Tests that every registered backend gives the same values, with NaN and infinity where numpy gives them
+    def test_backends_agree(self):
+        with np.errstate(all="ignore"):
+            expected = np.sqrt(self.x)*np.sin(self.x) + 1/self.x
+            for name, backend in BACKENDS.items():
+                y = backend.build(self.sources[backend.module])(self.x)
+                finite = np.isfinite(expected)
+                self.assertTrue(np.array_equal(np.isfinite(y), finite), name)
+                self.assertTrue(np.allclose(y[finite], expected[finite]), name)
+
+    # Tests that the chunked backend writes into the given output array, including a final partial chunk
+    def test_chunked(self):
+        func = ChunkedBackend(chunk_size=100).build(self.sources["numpy"])
+        out = np.empty(self.x.shape)
+        with np.errstate(all="ignore"):
+            self.assertIs(func(self.x, out=out), out)
+            self.assertTrue(np.allclose(out[self.x > 0], (np.sqrt(self.x)*np.sin(self.x) + 1/self.x)[self.x > 0]))
+
+    # Tests that the fastest backend is chosen and every backend is timed
+    def test_select_backend(self):
+        name, func, timings = select_backend(self.sources, self.x)
+        self.assertEqual(set(timings), set(BACKENDS))
+        self.assertEqual(timings[name], min(t for t in timings.values() if t is not None))
+        with np.errstate(all="ignore"):
+            self.assertEqual(func(self.x).shape, self.x.shape)
+
+    # Tests that the source of a module is only generated when one of its backends is benchmarked, which the math backend isn't on large samples
+    def test_lazy_sources(self):
+        expr = sp.sympify("sin(x)**2")
+        generated = []
+        def generate(module):
+            generated.append(module)
+            return generate_source(expr, module)
+        sources = generate_sources(expr)
+        _, _, timings = select_backend(sources, np.linspace(-10, 10, 4096), generate=generate)
+        self.assertEqual((generated, set(sources)), ([], {"numpy"}))
+        self.assertIsNone(timings["math"])
+        _, _, timings = select_backend(sources, np.linspace(-10, 10, 64), generate=generate)
+        self.assertEqual(generated, ["math"])
+        self.assertIn("math", sources)
+        self.assertIsNotNone(timings["math"])
+
+    # Tests that a backend which can't be built from the sources or gives different values is never chosen
+    def test_select_backend_invalid(self):
+        name, _, timings = select_backend({"numpy": self.sources["numpy"]}, self.x)
+        self.assertEqual(timings["math"], None)
+        self.assertNotEqual(name, "math")
+
+        class WrongBackend(ChunkedBackend):
+            name = "wrong"
+            def build(self, source):
+                return lambda x: np.zeros_like(x)
+        backends.register_backend(WrongBackend())
+        try:
+            name, _, timings = select_backend(self.sources, self.x)
+            self.assertEqual(timings["wrong"], None)
+            self.assertNotEqual(name, "wrong")
+        finally:
+            del BACKENDS["wrong"]
+        with self.assertRaises(ValueError):
+            select_backend({}, self.x)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# Tests for transforming whole arrays of points at once
+import unittest
+import numpy as np
+from src.transformations.vector import Vector
+from src.transformations.transformation import translation, projection, shearing, scaling, reflection, rotation, transform_values
+
+# Tests that transforming arrays of points agrees with the point by point transformations
+class TestBatchTransformations(unittest.TestCase):
+    # Setup the points being transformed
+    def setUp(self):
+        self.x = np.linspace(-10, 10, 41)
+        self.y = np.sin(self.x) * 5
+        self.u = Vector([3, -2])
+        self.direction = Vector([np.cos(0.4), np.sin(0.4)])
+
+    # Helper method which transforms every point individually using the scalar transformation
+    def scalar_transform(self, t, *args):
+        points = [t(Vector([xi, yi]), *args) for xi, yi in zip(self.x, self.y)]
+        return np.array([p.values[0] for p in points]), np.array([p.values[1] for p in points])
+
+    # Helper method to assert that the array and scalar results match
+    def assertMatchesScalar(self, t, *args):
+        x1, y1 = transform_values(self.x, self.y, t, *args)
+        x2, y2 = self.scalar_transform(t, *args)
+        self.assertTrue(np.allclose(x1, x2))
+        self.assertTrue(np.allclose(y1, y2))
+
+    def test_translation_values(self):
+        self.assertMatchesScalar(translation, self.u)
+
+    def test_projection_values(self):
+        self.assertMatchesScalar(projection, self.u)
+
+    def test_shearing_values(self):
+        self.assertMatchesScalar(shearing, 2, -0.5)
+
+    def test_scaling_values(self):
+        self.assertMatchesScalar(scaling, -3, 0.25)
+
+    def test_reflection_values(self):
+        self.assertMatchesScalar(reflection, self.direction)
+
+    def test_rotation_values(self):
+        self.assertMatchesScalar(rotation, self.u, 37.5)
+
+    # Tests that transform_values returns arrays of the same shape as the points
+    def test_transform_values_returns_arrays(self):
+        x1, y1 = transform_values(self.x, self.y, rotation, self.u, 90)
+        self.assertIsInstance(x1, np.ndarray)
+        self.assertIsInstance(y1, np.ndarray)
+        self.assertEqual(x1.shape, self.x.shape)
+        x2, y2 = self.scalar_transform(rotation, self.u, 90)
+        self.assertTrue(np.allclose(x1, x2))
+        self.assertTrue(np.allclose(y1, y2))
+
+    # Tests the point by point fallback for transformations without an equivalent affine transformation
+    def test_transform_values_fallback(self):
+        x1, y1 = transform_values(self.x, self.y, lambda v: v.scale(2))
+        self.assertIsInstance(x1, np.ndarray)
+        self.assertTrue(np.allclose(x1, 2*self.x))
+        self.assertTrue(np.allclose(y1, 2*self.y))
+
+    # Tests that mismatched x and y values are rejected
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            transform_values(self.x, self.y[:1], scaling, 1, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
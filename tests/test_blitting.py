@@ -0,0 +1,62 @@
+# Tests for blitting animated artists over a cached background
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from src.visualiser.blitting import BlitManager
+
+class BlitManagerTest(unittest.TestCase):
+
+    # Sets up a figure with a static line and an animated line, counting the full draws of the figure
+    def setUp(self):
+        self.fig = Figure()
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.ax.plot([0, 1], [0, 1])
+        self.line, = self.ax.plot([0, 1], [1, 0], color="red")
+        self.manager = BlitManager(self.canvas, [self.line])
+        self.draws = []
+        self.canvas.mpl_connect("draw_event", lambda _: self.draws.append(1))
+
+    # Helper method returning the number of red pixels on the canvas
+    def red_pixels(self):
+        image = np.asarray(self.canvas.buffer_rgba())
+        return np.count_nonzero((image[..., 0] > 200) & (image[..., 1] < 50) & (image[..., 2] < 50))
+
+    # Tests that animated artists are left out of the background but drawn over it
+    def test_background(self):
+        self.assertTrue(self.line.get_animated())
+        self.canvas.draw()
+        self.assertIsNotNone(self.manager.background)
+        self.assertGreater(self.red_pixels(), 0)
+        self.canvas.restore_region(self.manager.background)
+        self.assertEqual(self.red_pixels(), 0)
+
+    # Tests that updates only redraw the animated artists once there is a background
+    def test_update(self):
+        self.manager.update() # No background yet, so the whole figure is drawn
+        self.assertEqual(len(self.draws), 1)
+        self.line.set_visible(False)
+        self.manager.update()
+        self.assertEqual(len(self.draws), 1)
+        self.assertEqual(self.red_pixels(), 0)
+        self.line.set_visible(True)
+        self.manager.update()
+        self.assertGreater(self.red_pixels(), 0)
+
+    # Tests that invalidating the background redraws the whole figure
+    def test_invalidate(self):
+        self.canvas.draw()
+        self.manager.invalidate()
+        self.assertEqual(len(self.draws), 2)
+        self.assertIsNotNone(self.manager.background)
+
+    # Tests that artists from other figures can't be added
+    def test_add_artist(self):
+        other = Figure().add_subplot().plot([0, 1])[0]
+        with self.assertRaises(ValueError):
+            self.manager.add_artist(other)
+
+
+if __name__ == '__main__':
+    unittest.main()
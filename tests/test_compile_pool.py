@@ -0,0 +1,67 @@
+# Tests for compiling expressions in worker processes
+import time
+import unittest
+from src.visualiser.compile_pool import CompileJob, compile_expressions, compile_fused_expressions, CompileTimeoutError
+from src.visualiser.expression_cache import ExpressionCache
+
+class CompilePoolTest(unittest.TestCase):
+
+    # Tests that valid and invalid expressions are compiled together, each giving its own result
+    def test_compile_expressions(self):
+        results = compile_expressions(["x**2", "x +* 2", "y"], timeout=30)
+        self.assertEqual(results[0][0], "x**2")
+        self.assertTrue(results[0][1]["numpy"].startswith("def _lambdifygenerated(x):"))
+        self.assertIsInstance(results[1], Exception)
+        self.assertIsInstance(results[2], Exception)
+
+    # Tests that an expression which doesn't finish in time is killed and reported without losing the others
+    def test_timeout(self):
+        results = compile_expressions(["factorial(factorial(50))*x", "sin(x)"], timeout=2)
+        self.assertIsInstance(results[0], CompileTimeoutError)
+        self.assertEqual(results[1][0], "sin(x)")
+
+    # Tests that polling a job never waits for its workers, and that it gives the same results once they finish
+    def test_job_poll(self):
+        job = CompileJob(["factorial(factorial(50))*x", "x**3"], timeout=2)
+        start = time.monotonic()
+        self.assertFalse(job.poll())
+        self.assertLess(time.monotonic() - start, 0.5)
+        while not job.poll():
+            time.sleep(0.02)
+        self.assertIsInstance(job.results[0], CompileTimeoutError)
+        self.assertEqual(job.results[1][0], "x**3")
+
+    # Tests that cancelling a job stops its workers without giving any results
+    def test_job_cancel(self):
+        job = CompileJob(["factorial(factorial(50))*x"], timeout=30)
+        job.cancel()
+        self.assertTrue(job.done())
+        self.assertEqual(job.results, [None])
+
+    # Tests that fused evaluators are compiled in a worker process, which is killed if it takes too long
+    def test_compile_fused(self):
+        cache = ExpressionCache()
+        funcs = [cache.get(e) for e in ["sin(x)", "sin(x)**2"]]
+        evaluator = cache.get_fused(funcs, compiler=lambda expressions: compile_fused_expressions(expressions, timeout=30))
+        self.assertEqual(evaluator.source.count("sin(x)"), 1)
+        with self.assertRaises(CompileTimeoutError):
+            compile_fused_expressions(("factorial(factorial(50))*x", "x"), timeout=2)
+
+    # Tests that the cache compiles only the missing expressions, once each, through the given compiler
+    def test_get_many(self):
+        cache = ExpressionCache()
+        cache.get("x**2")
+        compiled = []
+        def compiler(keys):
+            compiled.append(keys)
+            return compile_expressions(keys, timeout=30)
+        results = cache.get_many(["x**2", "cos(x)", "cos( x )", "x +* 2"], compiler=compiler)
+        self.assertEqual(compiled, [["cos(x)", "x+*2"]])
+        self.assertIs(results[1], results[2])
+        self.assertEqual(results[1].expression, "cos(x)")
+        self.assertIsInstance(results[3], Exception)
+        self.assertIs(cache.get_many(["cos(x)"])[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# Tests for drawing many curves through line collections over one buffer
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from src.transformations.affine import AffineTransform
+from src.transformations.vector import Vector
+from src.visualiser.curve_collection import CurveCollection, transform_curves, BASE, PREVIEW, PREVIEW_ALPHA
+
+class CurveCollectionTest(unittest.TestCase):
+
+    # Sets up a collection with three curves of different lengths
+    def setUp(self):
+        self.fig = Figure()
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.collection = CurveCollection(self.ax)
+        self.curves = [np.linspace(-1, 1, n) for n in (10, 20, 30)]
+        self.views = [self.collection.add(x, x**k, (k / 3, 0, 0)) for k, x in enumerate(self.curves)]
+        self.collection.sync()
+
+    # Tests that every curve is laid out contiguously and drawn as a view of the buffer
+    def test_layout(self):
+        self.assertEqual(len(self.collection), 3)
+        self.assertEqual(self.collection.buffer.shape, (2 * 60, 2))
+        paths = self.collection.artists[BASE].get_paths()
+        self.assertEqual([len(path.vertices) for path in paths], [10, 20, 30])
+        self.assertTrue(all(np.shares_memory(path.vertices, self.collection.buffer) for path in paths))
+        x, y = self.views[2][0].get_data()
+        self.assertTrue(np.allclose(y, self.curves[2]**2))
+        self.assertEqual(self.collection.artists[PREVIEW].get_paths(), []) # Previews start off hidden
+
+    # Tests that changing a curve without changing its number of points is copied into the buffer in place
+    def test_set_data(self):
+        line, _ = self.views[1]
+        line.set_data(self.curves[1], np.zeros(20))
+        self.assertEqual(self.collection.layouts, 1)
+        self.assertTrue(np.allclose(self.collection.artists[BASE].get_paths()[1].vertices[:, 1], 0))
+
+        line.set_data(np.arange(5.0), np.arange(5.0)) # A different number of points lays the buffer out again
+        self.assertTrue(np.allclose(line.get_xdata(), np.arange(5.0)))
+        self.collection.sync()
+        self.assertEqual(self.collection.layouts, 2)
+        self.assertEqual(self.collection.buffer.shape, (2 * 60 - 15, 2))
+        self.assertTrue(np.allclose(self.views[2][0].get_ydata(), self.curves[2]**2))
+        with self.assertRaises(ValueError):
+            line.set_data(np.arange(3.0), np.arange(4.0))
+
+    # Tests that each curve keeps its own colour, alpha and visibility
+    def test_style(self):
+        line, preview = self.views[1]
+        line.set_alpha(0.3)
+        preview.set_visible(True)
+        self.collection.sync()
+        colors = self.collection.artists[BASE].get_edgecolor()
+        self.assertTrue(np.allclose(colors[1], (1 / 3, 0, 0, 0.3)))
+        self.assertTrue(np.allclose(colors[0], (0, 0, 0, 1)))
+        self.assertEqual(line.get_alpha(), 0.3)
+        self.assertTrue(preview.get_visible())
+        self.assertEqual(len(self.collection.artists[PREVIEW].get_paths()), 1)
+        self.assertTrue(np.allclose(self.collection.artists[PREVIEW].get_edgecolor(), (1 / 3, 0, 0, PREVIEW_ALPHA)))
+
+    # Tests that pending changes are applied when the figure is drawn
+    def test_draw(self):
+        self.views[0][1].set_visible(True)
+        self.views[0][1].set_data(np.arange(4.0), np.arange(4.0))
+        self.fig.canvas.draw()
+        self.assertEqual(len(self.collection.artists[PREVIEW].get_paths()), 1)
+        self.assertEqual(len(self.collection.artists[PREVIEW].get_paths()[0].vertices), 4)
+
+    # Tests transforming several curves with different transforms in one pass
+    def test_transform_curves(self):
+        transforms = [AffineTransform.rotation(Vector([1.0, 0.0]), 30), AffineTransform.scaling(2, 3), AffineTransform()]
+        curves = [(transform, x, x**2) for transform, x in zip(transforms, self.curves)]
+        for (transform, x, y), (x1, y1) in zip(curves, transform_curves(curves)):
+            expected_x, expected_y = transform.apply(x, y)
+            self.assertTrue(np.allclose(x1, expected_x))
+            self.assertTrue(np.allclose(y1, expected_y))
+        self.assertEqual(transform_curves([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# Tests for the custom helper functions
+import unittest
+import numpy as np
+from src.custom import custom_probe_grid, custom_mask_regions, custom_test_valid_function
+
+class CustomTest(unittest.TestCase):
+
+    # Tests that the probe grid is deterministic and covers the bounds of the graph densely
+    def test_probe_grid(self):
+        grid = custom_probe_grid((-2, 3))
+        self.assertTrue(np.array_equal(grid, custom_probe_grid((-2, 3))))
+        self.assertTrue(np.all(np.diff(grid) > 0))
+        self.assertGreater(np.count_nonzero((grid >= -2) & (grid <= 3)), 1000)
+        self.assertLess(grid.min(), -999)
+
+    # Tests finding the runs of a mask, leaving out runs of a single value
+    def test_mask_regions(self):
+        x = np.arange(8.0)
+        mask = np.array([True, False, False, True, True, False, False, True])
+        self.assertEqual(custom_mask_regions(x, mask), [(3.0, 4.0)])
+        self.assertEqual(custom_mask_regions(x, np.zeros(8, dtype=bool)), [])
+
+    # Tests that valid functions are evaluated once over the whole grid and report no invalid regions
+    def test_valid_function(self):
+        calls = []
+        def f(x):
+            calls.append(x)
+            return np.sin(x)
+        self.assertEqual(custom_test_valid_function(f), [])
+        self.assertEqual(len(calls), 1)
+
+    # Tests that the regions where a function is NaN or infinite are reported
+    def test_invalid_regions(self):
+        regions = custom_test_valid_function(np.log, (-10, 10))
+        self.assertEqual(len(regions), 1)
+        start, end = regions[0]
+        self.assertEqual(start, -1000.0)
+        self.assertTrue(-0.1 < end <= 0)
+        self.assertEqual(custom_test_valid_function(lambda x: 1/x, (-1, 1)), []) # A single point has no width
+
+    # Tests that functions which are constant in parts of their expression are broadcast rather than rejected
+    def test_constant_function(self):
+        self.assertEqual(custom_test_valid_function(lambda x: 5), [])
+
+    # Tests that functions with non real values are rejected
+    def test_invalid_function(self):
+        with self.assertRaises(TypeError):
+            custom_test_valid_function(lambda x: x * 1j)
+        with self.assertRaises(Exception):
+            custom_test_valid_function(lambda x: y)  # noqa: F821
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# Tests for the compiled expression cache
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from unittest import mock
+from src.visualiser import expression_cache
+from src.visualiser.expression_cache import ExpressionCache, normalise_expression
+
+class ExpressionCacheTest(unittest.TestCase):
+
+    # Sets up a temporary file for the cache to store sources in
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "expressions.json")
+        self.x = np.linspace(-5, 5, 11)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # Tests that compiled functions evaluate the expression and carry its label
+    def test_compile(self):
+        f = ExpressionCache().get("sin(x) + x**2")
+        self.assertTrue(np.allclose(f(self.x), np.sin(self.x) + self.x**2))
+        self.assertEqual(f.expression, "x**2 + sin(x)")
+
+    # Tests that whitespace differences share a single cache entry
+    def test_normalised_hit(self):
+        cache = ExpressionCache()
+        first = cache.get("sin(x) + 1")
+        self.assertIs(cache.get(" sin( x )+1 "), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(normalise_expression(" a b\tc "), "abc")
+
+    # Tests that invalid expressions are rejected and not cached
+    def test_invalid(self):
+        cache = ExpressionCache()
+        for user_input in ["y", "5", "x +* 2"]:
+            with self.assertRaises(Exception):
+                cache.get(user_input)
+        self.assertEqual(len(cache), 0)
+
+    # Tests that the least recently used function is evicted once the cache is full
+    def test_eviction(self):
+        cache = ExpressionCache(maxsize=2)
+        cache.get("x")
+        cache.get("x**2")
+        cache.get("x")
+        cache.get("x**3")
+        self.assertEqual(len(cache), 2)
+        cache.get("x")
+        self.assertEqual(cache.hits, 2)
+
+    # Tests that a new cache rebuilds functions from the file without compiling them in a process or benchmarking the backends again
+    def test_persistent(self):
+        ExpressionCache(path=self.path).get("exp(-x**2)*cos(x)")
+        self.assertTrue(os.path.exists(self.path))
+        with mock.patch.object(expression_cache, "compile_expression", side_effect=AssertionError("compiled again")), \
+             mock.patch.object(expression_cache, "select_backend", side_effect=AssertionError("benchmarked again")):
+            f = ExpressionCache(path=self.path).get("exp(-x**2)*cos(x)")
+        self.assertTrue(np.allclose(f(self.x), np.exp(-self.x**2)*np.cos(self.x)))
+
+    # Tests that code in the file is never run, functions are generated again from the input and entries which don't match it are ignored
+    def test_tampered_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        source = "def _lambdifygenerated(x):\n    raise RuntimeError('tampered')\n"
+        entry = {"backend": "numpy", "timings": {"numpy": 1.0}, "sources": {"numpy": source}, "source": source}
+        with open(self.path, 'w') as file:
+            json.dump({"x": dict(entry, expression="x"), "x**2": dict(entry, expression="x**3")}, file)
+        cache = ExpressionCache(path=self.path)
+        self.assertTrue(np.allclose(cache.get("x")(self.x), self.x))
+        self.assertTrue(np.allclose(cache.get("x**2")(self.x), self.x**2))
+        with open(self.path) as file:
+            self.assertNotIn("sources", json.load(file)["x**2"])
+
+    # Tests that a corrupted file is ignored rather than stopping functions from being compiled
+    def test_corrupted_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as file:
+            file.write('{"x": {"expression": "x", "source": "import os"}')
+        f = ExpressionCache(path=self.path).get("x")
+        self.assertTrue(np.allclose(f(self.x), self.x))
+
+    # Tests that the backend chosen for a function and the timings of every backend are reported, and kept in the file
+    def test_backend_info(self):
+        cache = ExpressionCache(path=self.path)
+        f = cache.get("log(x)")
+        info = f.backend_info()
+        self.assertEqual(info.expression, "log(x)")
+        self.assertEqual(info.timings[info.backend], min(t for t in info.timings.values() if t is not None))
+        self.assertEqual(cache.backend_info(), [info])
+        self.assertEqual(ExpressionCache(path=self.path).get("log(x)").backend_info(), info)
+
+    # Tests that a fused evaluator gives the same values as evaluating each function separately, computing shared subexpressions once
+    def test_fused(self):
+        cache = ExpressionCache(path=self.path)
+        funcs = [cache.get(e) for e in ["sin(x)", "sin(x)**2", "sin(x) + x", "x*0 + 2"]]
+        evaluator = cache.get_fused(funcs)
+        self.assertEqual(evaluator.source.count("sin(x)"), 1)
+        for y, f in zip(evaluator(self.x), funcs):
+            self.assertTrue(np.allclose(y, np.broadcast_to(f(self.x), self.x.shape)))
+        self.assertIs(cache.get_fused(funcs), evaluator)
+
+    # Tests that fused evaluators are only kept in memory, so their source is never read back from the file
+    def test_fused_not_stored(self):
+        cache = ExpressionCache(path=self.path)
+        funcs = [cache.get(e) for e in ["exp(x)", "exp(x)/x"]]
+        cache.get_fused(funcs)
+        with open(self.path) as file:
+            self.assertEqual(set(json.load(file)), {"exp(x)", "exp(x)/x"})
+        with np.errstate(divide="ignore"):
+            y = ExpressionCache(path=self.path).get_fused(funcs)(self.x)
+        self.assertTrue(np.allclose(y[0], np.exp(self.x)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Tests for coalescing events into frames
+import unittest
+from src.visualiser.frame_scheduler import FrameScheduler
+from tests.fakes import FakeCanvas
+
+class FrameSchedulerTest(unittest.TestCase):
+
+    # Sets up a scheduler driven by a fake timer and a handler recording what it was run with
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.scheduler = FrameScheduler(self.canvas, fps=50)
+        self.calls = []
+
+    # Helper method recording the parameters of a call
+    def record(self, *params):
+        self.calls.append(params)
+
+    # Tests that the timer interval matches the frame rate, and that a frame rate must be positive
+    def test_frame_rate(self):
+        self.assertEqual(self.canvas.timer.interval, 20)
+        with self.assertRaises(ValueError):
+            FrameScheduler(self.canvas, fps=0)
+
+    # Tests that only the newest parameters of each key are run on the next frame
+    def test_latest_wins(self):
+        for angle in range(10):
+            self.scheduler.submit("Rotation", self.record, angle, 0.0)
+        self.scheduler.submit("Shearing", self.record, 1.0, 2.0)
+        self.assertEqual(self.calls, [])
+        self.assertTrue(self.canvas.timer.running)
+        self.canvas.timer.fire()
+        self.assertEqual(self.calls, [(9, 0.0), (1.0, 2.0)])
+        self.assertEqual(self.scheduler.coalesced(), 9)
+        self.assertEqual(self.scheduler.frames, 1)
+
+    # Tests that keys are run in the order of their latest submission
+    def test_order(self):
+        self.scheduler.submit("a", self.record, 1)
+        self.scheduler.submit("b", self.record, 2)
+        self.scheduler.submit("a", self.record, 3)
+        self.canvas.timer.fire()
+        self.assertEqual(self.calls, [(2,), (3,)])
+
+    # Tests that the timer stops once a frame has nothing to do, and starts again on the next submission
+    def test_idle(self):
+        self.scheduler.submit("a", self.record, 1)
+        self.canvas.timer.fire()
+        self.assertTrue(self.canvas.timer.running)
+        self.canvas.timer.fire()
+        self.assertFalse(self.canvas.timer.running)
+        self.assertEqual(self.scheduler.frames, 1)
+        self.scheduler.submit("a", self.record, 2)
+        self.assertTrue(self.canvas.timer.running)
+
+    # Tests flushing and cancelling pending work
+    def test_flush_cancel(self):
+        self.scheduler.submit("a", self.record, 1)
+        self.scheduler.flush()
+        self.assertEqual(self.calls, [(1,)])
+        self.scheduler.submit("a", self.record, 2)
+        self.scheduler.cancel()
+        self.assertFalse(self.scheduler.pending())
+        self.assertFalse(self.canvas.timer.running)
+        self.canvas.timer.fire()
+        self.assertEqual(self.calls, [(1,)])
+
+    # Tests that without a canvas every submission is run straight away
+    def test_no_canvas(self):
+        scheduler = FrameScheduler()
+        scheduler.submit("a", self.record, 1)
+        scheduler.submit("a", self.record, 2)
+        self.assertEqual(self.calls, [(1,), (2,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# Tests for selecting functions a page at a time
+import unittest
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from src.visualiser.function_selector import FunctionSelector
+
+class FunctionSelectorTest(unittest.TestCase):
+
+    # Sets up a figure with the axes the selector is drawn in
+    def setUp(self):
+        self.fig = Figure()
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_axes((0.01, 0.6, 0.2, 0.2))
+        self.labels = [f"f{i}: x+{i}" for i in range(20)]
+
+    # Helper method to get the labels shown on the current page
+    def shown(self, selector):
+        return [text.get_text() for text in selector.check_buttons.labels]
+
+    # Tests that only a page of labels is shown at a time, and that changing page wraps around
+    def test_pages(self):
+        selector = FunctionSelector(self.ax, self.labels, page_size=8)
+        self.assertEqual(self.shown(selector), self.labels[:8])
+        selector.next_button._observers.process("clicked", None)
+        self.assertEqual(self.shown(selector), self.labels[8:16])
+        selector.show_page(2)
+        self.assertEqual(self.shown(selector), self.labels[16:])
+        selector.show_page(3)
+        self.assertEqual(self.shown(selector), self.labels[:8])
+        selector.previous_button._observers.process("clicked", None)
+        self.assertEqual(selector.page, 2)
+
+    # Tests that clicks pass on the label of the function and are remembered when coming back to its page
+    def test_selection_kept_across_pages(self):
+        clicked = []
+        selector = FunctionSelector(self.ax, self.labels, page_size=8)
+        selector.on_clicked(clicked.append)
+        selector.show_page(1)
+        selector.check_buttons.set_active(2)
+        self.assertEqual(clicked, [self.labels[10]])
+        selector.show_page(0)
+        self.assertTrue(all(selector.check_buttons.get_status()))
+        selector.show_page(1)
+        self.assertFalse(selector.check_buttons.get_status()[2])
+        self.assertEqual(selector.get_status(), [i != 10 for i in range(20)])
+
+    # Tests that no page buttons are added when every label fits on one page
+    def test_single_page(self):
+        selector = FunctionSelector(self.ax, self.labels[:3])
+        self.assertIsNone(selector.next_button)
+        self.assertEqual(self.shown(selector), self.labels[:3])
+        self.assertEqual(len(self.fig.axes), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# Tests for compiling the user inputted functions and building the evaluator they are plotted with
+import unittest
+import numpy as np
+from unittest import mock
+from src.visualiser import input_handler
+from src.visualiser.compile_pool import CompileTimeoutError
+from src.visualiser.expression_cache import ExpressionCache, CompiledFunction, FusedEvaluator
+from src.visualiser.input_handler import compile_functions, get_functions, get_evaluator, fusable
+from tests.fakes import FakeWindow
+
+class InputHandlerTest(unittest.TestCase):
+
+    # Sets up an empty in memory cache in place of the one shared by the application, so nothing is stored in the project
+    def setUp(self):
+        patches = [mock.patch.object(input_handler, "EXPRESSION_CACHE", ExpressionCache()), mock.patch.object(input_handler, "FUSED_STARTED", set())]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.x = np.linspace(-5, 5, 11)
+
+    # Helper method to compile functions through the cache the input handler uses
+    def compiled(self, *expressions):
+        return [input_handler.EXPRESSION_CACHE.get(expression) for expression in expressions]
+
+    # Tests that functions are compiled in the background and handed over once the window has polled the job, and that cached functions are handed over straight away
+    def test_compile_functions(self):
+        window = FakeWindow(["x**2", "sin(x)"])
+        results = []
+        job = compile_functions(window, results.append)
+        self.assertIsNotNone(job)
+        self.assertEqual(results, [])
+        window.run_pending()
+        self.assertEqual(len(results), 1)
+        self.assertEqual([func.expression for func in results[0]], ["x**2", "sin(x)"])
+        self.assertTrue(np.allclose(results[0][1](self.x), np.sin(self.x)))
+
+        self.assertIsNone(compile_functions(window, results.append))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(window.pending, [])
+
+    # Tests that plotting without any functions is reported rather than compiled
+    def test_compile_functions_empty(self):
+        window = FakeWindow([])
+        results = []
+        self.assertIsNone(compile_functions(window, results.append))
+        self.assertIn("Please select", window.error_label.text)
+        self.assertEqual((results, window.pending), ([], []))
+
+    # Tests that a cancelled job never hands its functions over
+    def test_compile_functions_cancelled(self):
+        window = FakeWindow(["cos(x)**3"])
+        results = []
+        compile_functions(window, results.append).cancel()
+        window.run_pending()
+        self.assertEqual(results, [])
+
+    # Tests that already compiled functions are labelled and their invalid regions found, clearing any earlier error
+    def test_get_functions_compiled(self):
+        window = FakeWindow([])
+        window.error_label.text = "old error"
+        regions = []
+        funcs, labels = get_functions(window, regions=regions, bounds=(-10, 10), compiled=self.compiled("x**2", "log(x)"))
+        self.assertEqual(labels, ["f0: x**2", "f1: log(x)"])
+        self.assertEqual(len(funcs), len(regions))
+        self.assertEqual(window.error_label.text, "")
+
+    # Tests that functions which took too long to compile are named in the error box
+    def test_get_functions_timeout(self):
+        window = FakeWindow([])
+        compiled = self.compiled("x**2") + [CompileTimeoutError(), CompileTimeoutError()]
+        self.assertIsNone(get_functions(window, compiled=compiled))
+        self.assertTrue(window.error_label.text.startswith("f2, f3 took too long"))
+
+    # Tests that a function which failed to compile is reported as invalid
+    def test_get_functions_invalid(self):
+        window = FakeWindow([])
+        self.assertIsNone(get_functions(window, compiled=self.compiled("x") + [ValueError("x +* 2")]))
+        self.assertIn("Invalid form of function", window.error_label.text)
+
+    # Tests that get_functions compiles the functions itself when they aren't given
+    def test_get_functions_blocking(self):
+        funcs, labels = get_functions(FakeWindow(["x + 1"]))
+        self.assertEqual(labels, ["f0: x + 1"])
+        self.assertTrue(np.allclose(funcs[0](self.x), self.x + 1))
+
+    # Tests that functions whose backend runs the numpy source are fused, while the rest keep their own backend
+    def test_get_evaluator_split(self):
+        funcs = self.compiled("sin(x)**2", "sin(x)*3")
+        other = CompiledFunction("cos(x)", {}, np.cos, backend="math")
+        self.assertTrue(all(fusable(func) for func in funcs))
+        self.assertFalse(fusable(other))
+
+        evaluator = get_evaluator(funcs + [other])
+        self.assertIsNotNone(input_handler.EXPRESSION_CACHE.find_fused(funcs))
+        for y, expected in zip(evaluator(self.x), [np.sin(self.x)**2, 3*np.sin(self.x), np.cos(self.x)]):
+            self.assertTrue(np.allclose(y, expected))
+        self.assertIsInstance(get_evaluator(funcs), FusedEvaluator)
+        self.assertNotIsInstance(get_evaluator(funcs, fused=False), FusedEvaluator)
+        self.assertNotIsInstance(get_evaluator(funcs[:1] + [other]), FusedEvaluator) # A single numpy function has nothing to share
+
+    # Tests that with a window the fused evaluator is compiled in the background, evaluating the functions separately until it arrives and only compiling it once
+    def test_get_evaluator_background(self):
+        window = FakeWindow([])
+        funcs = self.compiled("exp(x)+x", "exp(x)*2")
+        evaluator = get_evaluator(funcs, window=window)
+        self.assertNotIsInstance(evaluator, FusedEvaluator)
+        self.assertEqual(len(window.pending), 1)
+        get_evaluator(funcs, window=window)
+        self.assertEqual(len(window.pending), 1)
+        window.run_pending()
+
+        fused = get_evaluator(funcs, window=window)
+        self.assertIsInstance(fused, FusedEvaluator)
+        self.assertEqual(window.pending, [])
+        for y_fused, y in zip(fused(self.x), evaluator(self.x)):
+            self.assertTrue(np.allclose(y_fused, y))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# Tests for resampling functions over the visible part of the graph
+import unittest
+import numpy as np
+from src.transformations.affine import AffineTransform
+from src.transformations.vector import Vector
+from src.visualiser.level_of_detail import LevelOfDetail, parameter_range, MARGIN, OVERSAMPLE, TILE_PIXELS
+from tests.fakes import FakeCanvas
+
+class LevelOfDetailTest(unittest.TestCase):
+
+    # Sets up a level of detail manager which counts how many points its function is evaluated at
+    def setUp(self):
+        self.evaluated = 0
+        def f(x):
+            self.evaluated += np.size(x)
+            return np.sin(x)
+        self.lod = LevelOfDetail([f])
+
+    # Tests the range of x values which can be visible after transformations
+    def test_parameter_range(self):
+        self.assertEqual(parameter_range([AffineTransform()], (-1, 2), (-5, 5)), (-1.0, 2.0))
+        self.assertEqual(parameter_range([AffineTransform.translation(Vector([10.0, 0.0]))], (-1, 2), (-5, 5)), (-11.0, -8.0))
+        t_min, t_max = parameter_range([AffineTransform(), AffineTransform.rotation(Vector([0.0, 0.0]), 90)], (-1, 2), (-5, 5))
+        self.assertAlmostEqual(t_min, -5.0)
+        self.assertAlmostEqual(t_max, 5.0)
+        self.assertIsNone(parameter_range([AffineTransform.scaling(0, 1)], (-1, 2), (-5, 5)))
+
+    # Tests that the samples cover the range and its margins at a density matched to the width in pixels
+    def test_sample(self):
+        x, y = self.lod.sample(0, 100.0, 101.0, 500)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertLessEqual(x[0], 100.0 - MARGIN)
+        self.assertGreaterEqual(x[-1], 101.0 + MARGIN)
+        self.assertLessEqual(np.diff(x).max(), 1.0 / (500 * OVERSAMPLE) * 2)
+        self.assertTrue(np.allclose(y, np.sin(x)))
+
+    # Tests that going back to a previous view reuses the cached tiles without evaluating the function
+    def test_tile_cache(self):
+        first = self.lod.sample(0, 0.0, 10.0, 400)
+        self.lod.sample(0, 1000.0, 1010.0, 400)
+        evaluated = self.evaluated
+        again = self.lod.sample(0, 0.0, 10.0, 400)
+        self.assertEqual(self.evaluated, evaluated)
+        self.assertTrue(np.array_equal(first[0], again[0]))
+        info = self.lod.cache_info()
+        self.assertGreater(info.hits, 0)
+        self.lod.cache_clear()
+        self.assertEqual(self.lod.cache_info().currsize, 0)
+
+    # Tests that rapid requests are debounced, running only the latest update once the timer fires
+    def test_debounce(self):
+        canvas = FakeCanvas()
+        lod = LevelOfDetail([np.sin], canvas)
+        runs = []
+        lod.request(lambda: runs.append(1))
+        lod.request(lambda: runs.append(2))
+        self.assertEqual(runs, [])
+        self.assertTrue(canvas.timer.running)
+        canvas.timer.fire()
+        self.assertEqual(runs, [2])
+        lod.request(lambda: runs.append(3))
+        lod.flush()
+        self.assertEqual(runs, [2, 3])
+        self.assertFalse(canvas.timer.running)
+
+    # Tests that views covering most of the domain draw the pyramid's envelope, with about two points per pixel
+    def test_envelope(self):
+        lod = LevelOfDetail([np.sin], domain=(-1e6, 1e6))
+        x, y = lod.sample(0, -9e5, 9e5, 400)
+        self.assertLessEqual(len(x), 2 * 400 * (1 + 2*MARGIN) + 4)
+        self.assertGreater(y.max(), 0.99)
+        self.assertEqual(lod.cache_info().misses, 0)
+        x, y = lod.sample(0, 0.0, 1.0, 400) # Deeper than the pyramid's resolution
+        self.assertTrue(np.allclose(y, np.sin(x)))
+        self.assertGreater(lod.cache_info().misses, 0)
+
+    # Tests that ordinary views are sampled by tiles, which keep the breaks at jumps and never give infinite points
+    def test_breaks_kept(self):
+        lod = LevelOfDetail([np.tan, lambda x: 1/x], domain=(-110, 110))
+        x, y = lod.sample(0, -10, 10, 250)
+        self.assertGreater(lod.cache_info().misses, 0) # Drawn from tiles rather than the envelope
+        self.assertGreater(np.count_nonzero(np.isnan(y)), 6)
+        x, y = lod.sample(1, -10, 10, 250)
+        self.assertFalse(np.isinf(y).any())
+
+    # Tests that tiles of curves changing faster than the pixels can show are drawn as an envelope
+    def test_tile_envelope(self):
+        x, y = LevelOfDetail([lambda x: np.sin(1000*x)]).sample(0, 0.0, 100.0, 256)
+        self.assertLessEqual(len(x), 2 * (256 * (1 + 2*MARGIN) + 2*TILE_PIXELS) + 1)
+        self.assertGreater(y.max(), 0.99)
+
+    # Tests that invalid ranges are rejected
+    def test_sample_invalid(self):
+        with self.assertRaises(ValueError):
+            self.lod.sample(0, 1.0, 1.0, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# Tests for keeping track of plotted functions and their transformations
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from src.transformations.affine import AffineTransform
+from src.transformations.vector import Vector
+from src.visualiser.line_registry import LineRegistry
+
+class LineRegistryTest(unittest.TestCase):
+
+    # Sets up a registry with two functions, counting how many times the data of each line is set
+    def setUp(self):
+        self.ax = Figure().add_subplot()
+        self.registry = LineRegistry()
+        self.uploads = []
+        x = np.linspace(-1, 1, 11)
+        for label, y in (("f0: x", x), ("f1: x**2", x**2)):
+            line, = self.ax.plot(x, y)
+            transformation_line, = self.ax.plot(x, y)
+            self.registry.add(label, line, transformation_line, (x, y))
+            line.set_data = lambda *data, line=line, set_data=line.set_data: (self.uploads.append(line), set_data(*data))
+
+    # Tests looking records up by id and by label
+    def test_lookup(self):
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(self.registry[1].label, "f1: x**2")
+        self.assertIs(self.registry.find("f1: x**2"), self.registry[1])
+        self.assertEqual([record.id for record in self.registry], [0, 1])
+        with self.assertRaises(ValueError):
+            self.registry.find("f2: x**3")
+
+    # Tests that a preview is only detected when the previewed transformation is different from the accumulated one
+    def test_previewing(self):
+        record = self.registry[0]
+        self.assertFalse(record.previewing())
+        self.assertTrue(record.set_preview(AffineTransform.rotation(Vector([0.0, 0.0]), 30)))
+        self.assertTrue(record.previewing())
+        self.assertFalse(record.set_preview(AffineTransform.rotation(Vector([0.0, 0.0]), 30)))
+        self.assertTrue(record.set_preview(AffineTransform.rotation(Vector([0.0, 0.0]), 0)))
+        self.assertFalse(record.previewing())
+
+    # Tests that transformation lines are only shown for selected functions with a preview
+    def test_visibility(self):
+        record = self.registry[0]
+        record.set_preview(AffineTransform.scaling(2, 1))
+        record.update_visibility()
+        self.assertTrue(record.transformation_line.get_visible())
+        record.selected = False
+        record.update_visibility()
+        self.assertFalse(record.transformation_line.get_visible())
+        self.assertEqual(self.registry.selected(), [self.registry[1]])
+
+    # Tests that only lines whose transformation or samples changed are uploaded
+    def test_upload(self):
+        translation = AffineTransform.translation(Vector([0.0, 1.0]))
+        self.registry[0].set_transform(translation)
+        self.registry[1].set_transform(AffineTransform())
+        self.assertEqual(self.registry.dirty(), [self.registry[0]])
+        self.assertEqual(self.registry.upload(), 1)
+        self.assertEqual(self.uploads, [self.registry[0].line])
+        x, y = self.registry[0].current_data
+        self.assertTrue(np.allclose(y, self.registry[0].initial_data[1] + 1))
+        self.assertTrue(np.allclose(self.registry[0].line.get_ydata(), y))
+        self.assertEqual(self.registry.upload(), 0)
+
+        x = np.linspace(0, 2, 5)
+        self.registry[1].set_samples((x, x**2))
+        self.assertEqual(self.registry.upload(), 1)
+        self.assertTrue(np.allclose(self.registry[1].line.get_xdata(), x))
+
+    # Tests that changes too small for AffineTransform equality to notice still mark the line as dirty and count as a preview
+    def test_small_changes(self):
+        record = self.registry[0]
+        record.set_transform(AffineTransform.translation(Vector([1000.0, 0.0])))
+        record.upload()
+        record.set_transform(AffineTransform.translation(Vector([1000.009, 0.0])))
+        self.assertTrue(record.dirty)
+        self.assertTrue(record.set_preview(AffineTransform.scaling(1.000005, 1)))
+        self.assertTrue(record.previewing())
+
+
+if __name__ == '__main__':
+    unittest.main()
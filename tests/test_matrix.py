@@ -1,6 +1,10 @@
+import io
+import contextlib
 import unittest
+import numpy as np
 from src.transformations.vector import Vector
-from src.transformations.matrix import Matrix 
+from src.transformations.vector_array import VectorArray
+from src.transformations.matrix import Matrix, identity_matrix
 
 class MatrixTest(unittest.TestCase):
 
@@ -69,6 +73,34 @@ class MatrixTest(unittest.TestCase):
         v = self.matrix1.multiply(self.matrix2)
         self.assertEqual(v, Matrix([[19.0], [49.0], [79.0]]))
 
+    # Tests matrix-vector multiplication
+    def test_multiply_vector(self):
+        v = self.matrix1.multiply(Vector([2.0, 7.0, 1.0]))
+        self.assertIsInstance(v, Vector)
+        self.assertEqual(v, Vector([19.0, 49.0, 79.0]))
+        with self.assertRaises(ValueError):
+            self.matrix1.multiply(Vector([1.0, 2.0]))
+
+    # Tests multiplying many column vectors at once
+    def test_multiply_columns(self):
+        columns = np.arange(12, dtype=float).reshape(3, 4)
+        result = self.matrix6.multiply(columns)
+        self.assertEqual(result.shape, (3, 4))
+        for i in range(4):
+            self.assertEqual(Vector(result[:, i]), self.matrix6.multiply(Vector(columns[:, i])))
+        with self.assertRaises(ValueError):
+            self.matrix6.multiply(np.ones((2, 4)))
+
+    # Tests that multiplying with logging shows the result for every type of input
+    def test_multiply_logging(self):
+        columns = np.arange(12, dtype=float).reshape(3, 4)
+        for m in (self.matrix6.transpose(), Vector([1.0, 2.0, 3.0]), columns, VectorArray._from_array(columns)):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.matrix6.multiply(m, logging=True)
+            self.assertIn("Result of multiplying both matrices is:", output.getvalue())
+            self.assertIn("|", output.getvalue())
+
     # Tests mismatch row-column between 2 matrices undergoing multiplication
     def test_multiply_dimension_mismatch(self):
         with self.assertRaises(ValueError):
@@ -92,11 +124,50 @@ class MatrixTest(unittest.TestCase):
         self.assertEqual(self.matrix5.power(2), Matrix([[235.0, 229.0, 51.0, 77.0], [406.0, 825.0, 164.0, 180.0], [724.0, 1217.0, 241.0, 264.0], [176.0, 218.0, 93.0, 194.0]]))
         self.assertEqual(self.matrix6.power(4), Matrix([[1813.0, 2454.0, 5616.0], [5160.0, 6973.0, 15888.0], [5296.0, 7168.0, 16401.0]]))
 
+    # Tests the zero, first and negative powers of a matrix
+    def test_power_special_cases(self):
+        self.assertEqual(self.matrix6.power(0), identity_matrix(3))
+        self.assertEqual(self.matrix6.power(1), self.matrix6)
+        self.assertEqual(self.matrix6.power(-2), self.matrix6.inverse().multiply(self.matrix6.inverse()))
+        with self.assertRaises(ValueError):
+            self.matrix1.power(-1)
+        with self.assertRaises(ValueError):
+            self.matrix4.power(2)
+
+    # Tests that large powers match repeated application, e.g. a rotation applied once per frame
+    def test_power_large(self):
+        θ = np.pi / 180
+        rotation = Matrix([[np.cos(θ), np.sin(θ)], [-np.sin(θ), np.cos(θ)]])
+        self.assertEqual(rotation.power(3600), identity_matrix(2))
+        self.assertEqual(rotation.power(1000), Matrix([[np.cos(1000*θ), np.sin(1000*θ)], [-np.sin(1000*θ), np.cos(1000*θ)]]))
+
     # Tests determiant of a matrix
     def test_determinant(self):
         self.assertEqual(self.matrix1.determinant(), 0)
-        self.assertEqual(self.matrix5.determinant(), 7122)
-        self.assertEqual(self.matrix6.determinant(), 9)
+        self.assertAlmostEqual(self.matrix5.determinant(), 7122)
+        self.assertAlmostEqual(self.matrix6.determinant(), 9)
+
+    # Tests the exact cofactor expansion determinant used as a reference
+    def test_determinant_cofactor(self):
+        self.assertEqual(self.matrix1.determinant(method="cofactor"), 0)
+        self.assertEqual(self.matrix5.determinant(method="cofactor"), 7122)
+        self.assertEqual(self.matrix6.determinant(method="cofactor"), 9)
+        with self.assertRaises(ValueError):
+            self.matrix6.determinant(method="laplace")
+
+    # Tests that the LU determinant handles matrices too large for cofactor expansion
+    def test_determinant_large(self):
+        values = np.random.default_rng(0).uniform(-1, 1, (11, 11))
+        self.assertAlmostEqual(Matrix(values).determinant(), np.linalg.det(values))
+
+    # Tests that the LU factors reconstruct the matrix
+    def test_lu(self):
+        lu = self.matrix5.lu()
+        self.assertEqual(lu.permutation().multiply(self.matrix5), lu.lower().multiply(lu.upper()))
+        self.assertFalse(lu.singular)
+        self.assertTrue(self.matrix1.lu().singular)
+        with self.assertRaises(ValueError):
+            self.matrix2.lu()
 
     # Tests minor matrix of a matrix
     def test_minorMatrix(self):
@@ -152,5 +223,90 @@ class MatrixTest(unittest.TestCase):
             self.matrix6.toVector()
 
 
+    # Tests that the matrix is stored as a float64 array and exposes it without copying
+    def test_as_array(self):
+        array = self.matrix1.as_array()
+        self.assertEqual(array.dtype, np.float64)
+        self.assertEqual(array.shape, (3, 3))
+        self.assertTrue(np.shares_memory(array, self.matrix1.as_array()))
+
+    # Tests initialising a matrix from a numpy array
+    def test_initialization_from_array(self):
+        m = Matrix(np.arange(6).reshape(2, 3))
+        self.assertEqual(m.d, (2, 3))
+        self.assertEqual(m.values, [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+        with self.assertRaises(ValueError):
+            Matrix(np.zeros(3))
+
+    # Tests that assigning to the elements or rows of the values changes the matrix, while writing to a frozen matrix is rejected
+    def test_set_value_elements(self):
+        m = Matrix([[1, 2], [3, 4]])
+        m.values[0][1] = 5.0
+        m.values[1] = [6.0, 7.0]
+        self.assertEqual(m.values, [[1.0, 5.0], [6.0, 7.0]])
+        with self.assertRaises(TypeError):
+            del m.values[0]
+        with self.assertRaises(AttributeError):
+            m.freeze().values[0][0] = 2.0
+        self.assertEqual(m.d, (2, 2))
+
+    # Tests that matrices use slots rather than an instance dictionary
+    def test_slots(self):
+        self.assertFalse(hasattr(self.matrix1, "__dict__"))
+
+    # Tests that equal matrices have equal hashes
+    def test_hash(self):
+        self.assertEqual(hash(self.matrix1), hash(Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])))
+
+
+    # Tests solving a linear system for a single right hand side
+    def test_solve_vector(self):
+        x = self.matrix6.solve(Vector([1.0, 2.0, 3.0]))
+        self.assertIsInstance(x, Vector)
+        self.assertEqual(self.matrix6.multiply(x.toMatrix()).toVector(), Vector([1.0, 2.0, 3.0]))
+
+    # Tests solving a linear system for several right hand sides at once
+    def test_solve_matrix(self):
+        b = Matrix([[1.0, 0.0], [2.0, 1.0], [3.0, 5.0], [4.0, -2.0]])
+        x = self.matrix5.solve(b)
+        self.assertEqual(x.d, (4, 2))
+        self.assertEqual(self.matrix5.multiply(x), b)
+
+    # Tests that singular and mismatched systems are rejected
+    def test_solve_invalid(self):
+        with self.assertRaises(ValueError):
+            self.matrix1.solve(Vector([1.0, 2.0, 3.0]))
+        with self.assertRaises(ValueError):
+            self.matrix6.solve(Vector([1.0, 2.0]))
+        with self.assertRaises(TypeError):
+            self.matrix6.solve([1.0, 2.0, 3.0])
+
+    # Tests that nearly singular matrices are reported as ill-conditioned
+    def test_solve_ill_conditioned(self):
+        m = Matrix([[1.0, 1.0], [1.0, 1.0 + 1e-13]])
+        with self.assertWarns(RuntimeWarning):
+            m.solve(Vector([1.0, 2.0]))
+
+    # Tests inverting a matrix too large for cofactor expansion
+    def test_inverse_large(self):
+        values = np.random.default_rng(1).uniform(-1, 1, (40, 40)) + 40 * np.eye(40)
+        m = Matrix(values)
+        self.assertTrue(np.allclose(m.inverse().as_array() @ values, np.eye(40)))
+
+
+    # Tests that a frozen matrix rejects mutation and caches a hash equal to the mutable matrix
+    def test_frozen(self):
+        frozen = self.matrix6.freeze()
+        self.assertTrue(frozen.frozen)
+        self.assertEqual(hash(frozen), hash(self.matrix6))
+        self.assertEqual(frozen, self.matrix6)
+        with self.assertRaises(AttributeError):
+            frozen.values = [[1.0]]
+        with self.assertRaises(ValueError):
+            frozen.as_array()[0, 0] = 2.0
+        self.assertTrue(Matrix([[1.0, 2.0]], frozen=True).frozen)
+        self.assertEqual(frozen.inverse(), self.matrix6.inverse())
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
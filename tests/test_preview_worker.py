@@ -0,0 +1,100 @@
+# Tests for computing previews on a worker thread
+import threading
+import unittest
+import numpy as np
+from src.transformations.affine import AffineTransform
+from src.transformations.vector import Vector
+from src.visualiser.preview_worker import PreviewWorker, PreviewJob, compute_preview, compute_preview_batched, freeze
+
+class PreviewWorkerTest(unittest.TestCase):
+
+    # Sets up a worker recording the results handed back to it
+    def setUp(self):
+        self.results = []
+        self.worker = PreviewWorker(self.results.append)
+        self.x = np.linspace(-5, 5, 101)
+        self.y = self.x**2
+
+    # Stops the worker thread
+    def tearDown(self):
+        self.worker.close()
+
+    # Tests that snapshots are read only and that previews apply each transform
+    def test_compute_preview(self):
+        x, y = freeze(self.x, self.y)
+        self.assertFalse(x.flags.writeable)
+        self.assertTrue(self.x.flags.writeable)
+        translation = AffineTransform.translation(Vector([1.0, 2.0]))
+        (index, x1, y1), = compute_preview(PreviewJob(1, ((3, translation, x, y),)))
+        self.assertEqual(index, 3)
+        self.assertTrue(np.allclose(x1, self.x + 1))
+        self.assertTrue(np.allclose(y1, self.y + 2))
+
+    # Tests that previews computed in one pass over every function match previews computed one function at a time
+    def test_compute_preview_batched(self):
+        items = ((0, AffineTransform.rotation(Vector([0.0, 0.0]), 45), self.x, self.y), (2, AffineTransform.scaling(2, 1), self.x[:5], self.y[:5]))
+        job = PreviewJob(1, items)
+        for (index, x, y), (expected_index, expected_x, expected_y) in zip(compute_preview_batched(job), compute_preview(job)):
+            self.assertEqual(index, expected_index)
+            self.assertTrue(np.allclose(x, expected_x))
+            self.assertTrue(np.allclose(y, expected_y))
+
+    # Tests that the newest preview is handed back once it is finished
+    def test_wait(self):
+        generation = self.worker.submit([(0, AffineTransform.scaling(2, 1), self.x, self.y)])
+        self.assertEqual(generation, 1)
+        self.assertTrue(self.worker.wait(5))
+        self.assertFalse(self.worker.pending())
+        (index, x1, y1), = self.results[0]
+        self.assertTrue(np.allclose(x1, 2 * self.x))
+
+    # Tests that results from older generations are discarded
+    def test_stale(self):
+        started, release = threading.Event(), threading.Event()
+        def compute(job):
+            started.set()
+            release.wait(5)
+            return job.generation
+        worker = PreviewWorker(self.results.append, compute=compute)
+        worker.submit([])
+        started.wait(5)
+        worker.submit([]) # Replaces nothing, the first job is already running
+        worker.submit([]) # Replaces the second job before it starts
+        release.set()
+        self.assertTrue(worker.wait(5))
+        worker.close()
+        self.assertEqual(self.results, [3])
+        self.assertEqual(worker.discarded, 1)
+
+    # Tests that cancelling makes results in progress stale
+    def test_cancel(self):
+        started, release = threading.Event(), threading.Event()
+        def compute(job):
+            started.set()
+            release.wait(5)
+        worker = PreviewWorker(self.results.append, compute=compute)
+        worker.submit([])
+        started.wait(5)
+        worker.cancel()
+        self.assertFalse(worker.pending())
+        release.set()
+        worker.close()
+        self.assertFalse(worker.poll())
+        self.assertEqual(self.results, [])
+        self.assertEqual(worker.discarded, 1)
+
+    # Tests that errors raised computing a preview are raised on the polling thread
+    def test_error(self):
+        def compute(job):
+            raise ValueError("Preview failed")
+        worker = PreviewWorker(self.results.append, compute=compute)
+        worker.submit([])
+        with self.assertRaises(ValueError):
+            worker.wait(5)
+        worker.close()
+        with self.assertRaises(RuntimeError):
+            worker.submit([])
+
+
+if __name__ == '__main__':
+    unittest.main()
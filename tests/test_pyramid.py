@@ -0,0 +1,69 @@
+# Tests for the min/max decimation pyramid
+import unittest
+import numpy as np
+from src.visualiser.pyramid import MinMaxPyramid
+
+class MinMaxPyramidTest(unittest.TestCase):
+
+    # Tests that every level keeps the minimum and maximum of the buckets it merges
+    def test_levels(self):
+        pyramid = MinMaxPyramid(lambda x: x, 0, 8, buckets=8, samples=2)
+        self.assertEqual([len(mins) for mins, _ in pyramid.levels], [8, 4, 2, 1])
+        self.assertEqual(pyramid.levels[0][0].tolist(), list(range(8)))
+        self.assertEqual(pyramid.levels[1][1].tolist(), [2.0, 4.0, 6.0, 8.0])
+        self.assertEqual(pyramid.levels[-1][0].tolist(), [0.0])
+        self.assertEqual(pyramid.levels[-1][1].tolist(), [8.0])
+
+    # Tests that the envelope draws at most about two points per pixel and encloses the curve
+    def test_envelope(self):
+        pyramid = MinMaxPyramid(np.sin, -1e6, 1e6, buckets=2**12, samples=32)
+        for pixels in (100, 500, 1000):
+            x, y = pyramid.envelope(-1e6, 1e6, pixels)
+            self.assertLessEqual(len(x), 2*pixels + 4)
+            self.assertTrue(np.all(np.diff(x) >= 0))
+        x, y = pyramid.envelope(-1e5, 1e5, 300)
+        self.assertGreater(y.max(), 0.99)
+        self.assertLess(y.min(), -0.99)
+        self.assertTrue(np.all(x >= -1e5 - pyramid.bucketWidth(8)) and np.all(x <= 1e5 + pyramid.bucketWidth(8)))
+
+    # Tests that memory doesn't grow with the width of the range and functions are only evaluated in chunks
+    def test_bounded_memory(self):
+        sizes = []
+        f = lambda x: sizes.append(x.size) or np.cos(x)
+        small = MinMaxPyramid(f, -10, 10, buckets=1024, samples=8, chunk_buckets=64)
+        large = MinMaxPyramid(f, -1e9, 1e9, buckets=1024, samples=8, chunk_buckets=64)
+        self.assertEqual(small.nbytes(), large.nbytes())
+        self.assertEqual(max(sizes), 64*8)
+
+    # Tests that NaN and infinite values are ignored unless the whole bucket is NaN or infinite, but make their buckets breaks, and constants are broadcast
+    def test_nan_and_constant(self):
+        pyramid = MinMaxPyramid(np.log, -4, 4, buckets=8, samples=5)
+        mins, maxs = pyramid.levels[0]
+        self.assertTrue(np.all(np.isnan(mins[:4])))
+        self.assertTrue(np.all(np.isfinite(maxs[4:])))
+        self.assertEqual(pyramid.breaks[0].tolist(), [True]*5 + [False]*3)
+        x, y = pyramid.envelope(-4, 4, 8)
+        self.assertFalse(np.isinf(y).any())
+        self.assertEqual(pyramid.levels[-1][1][0], np.log(4))
+        constant = MinMaxPyramid(lambda x: 3, 0, 1, buckets=4)
+        self.assertEqual(constant.envelope(0, 1, 4)[1].tolist(), [3.0]*8)
+
+    # Tests that jumps are drawn with a NaN break between the two sides, while continuous and quickly oscillating curves aren't broken
+    def test_jump_breaks(self):
+        x, y = MinMaxPyramid(np.tan, -10, 10, buckets=1024).envelope(-10, 10, 256)
+        self.assertEqual(np.count_nonzero(np.isnan(y)), 6)
+        turns = (x[np.isnan(y)] - np.pi/2) / np.pi
+        self.assertTrue(np.all(np.abs(turns - np.round(turns)) * np.pi < 0.1)) # Every break is at an asymptote
+        for f in (np.sin, lambda x: np.sin(1000*x), lambda x: x**3):
+            self.assertFalse(np.isnan(MinMaxPyramid(f, -10, 10, buckets=1024).envelope(-10, 10, 256)[1]).any())
+
+    # Tests invalid pyramids and envelopes
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            MinMaxPyramid(np.sin, 1, 1)
+        with self.assertRaises(ValueError):
+            MinMaxPyramid(np.sin, 0, 1, buckets=4).envelope(2, 3, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# Tests for adaptively sampling functions
+import unittest
+import numpy as np
+from src.visualiser.sampling import adaptive_sample, adaptive_sample_all, interval_errors, find_breaks, compact_non_finite, region_edges, INITIAL_POINTS
+
+class SamplingTest(unittest.TestCase):
+
+    # Helper method returning the largest distance between a function and the straight lines through its samples, between a and b
+    def max_error(self, f, x, y, a, b):
+        xx = np.linspace(a, b, 100001)
+        with np.errstate(all="ignore"):
+            expected = f(xx)
+        finite = np.isfinite(expected)
+        return np.max(np.abs(expected[finite] - np.interp(xx, x, y)[finite]))
+
+    # Tests that straight lines are not refined at all
+    def test_straight_line(self):
+        x, y = adaptive_sample(lambda x: 2*x + 1, -100, 100, 20)
+        self.assertEqual(len(x), INITIAL_POINTS)
+        self.assertTrue(np.allclose(y, 2*x + 1))
+
+    # Tests that a sharp feature in the view is sampled more accurately than uniform sampling with the same number of points, within the budget
+    def test_sharp_feature(self):
+        f = lambda x: np.sin(50*x)
+        x, y = adaptive_sample(f, -100, 100, 2, budget=3000, view=(-2, 2))
+        self.assertLessEqual(len(x), 3000)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertTrue(np.allclose(y, f(x)))
+        uniform = np.linspace(-100, 100, len(x))
+        self.assertLess(self.max_error(f, x, y, -2, 2), 0.01)
+        self.assertGreater(self.max_error(f, uniform, f(uniform), -2, 2), 0.1)
+
+    # Tests that the edges of the domain of a function are refined to close to where they are
+    def test_domain_edge(self):
+        x, y = adaptive_sample(np.log, -10, 10, 20)
+        self.assertLess(x[np.isfinite(y)].min(), 1e-6)
+
+    # Tests the error of intervals, including ones where the function leaves its domain
+    def test_interval_errors(self):
+        errors = interval_errors(np.array([0.0, 0.0, np.nan, np.nan]), np.array([1.0, 0.5, 1.0, np.nan]), np.array([0.0, 1.0, 0.0, np.inf]), 2.0)
+        self.assertEqual(errors.tolist(), [0.5, 0.0, np.inf, 0.0])
+
+    # Tests that sampling several functions from a shared evaluator gives the same result as sampling each one
+    def test_sample_all(self):
+        funcs = [np.sin, np.exp]
+        results = adaptive_sample_all(lambda x: [f(x) for f in funcs], funcs, -5, 5, 10)
+        for f, (x, y) in zip(funcs, results):
+            expected = adaptive_sample(f, -5, 5, 10)
+            self.assertTrue(np.array_equal(x, expected[0]))
+            self.assertTrue(np.array_equal(y, expected[1]))
+
+    # Tests that asymptotes and jumps are each marked by a single NaN point, so no line is drawn across them
+    def test_breaks(self):
+        x, y = adaptive_sample(np.tan, -5, 5, 10)
+        self.assertEqual(np.count_nonzero(np.isnan(y)), 4)
+        breaks = x[np.isnan(y)]
+        self.assertTrue(np.allclose(breaks, [-3*np.pi/2, -np.pi/2, np.pi/2, 3*np.pi/2], atol=1e-6))
+        x, y = adaptive_sample(np.floor, -2.5, 2.5, 5)
+        self.assertTrue(np.allclose(x[np.isnan(y)], [-2, -1, 0, 1, 2], atol=1e-6))
+        finite = np.isfinite(y)
+        self.assertTrue(np.allclose(y[finite], np.floor(x[finite])))
+
+    # Tests that steep but continuous curves aren't broken
+    def test_no_breaks(self):
+        for f in (np.exp, lambda x: np.arctan(1000*x), lambda x: x**3):
+            x, y = adaptive_sample(f, -5, 5, 10)
+            self.assertFalse(np.isnan(y).any())
+        intervals, positions = find_breaks(lambda x: 100*x, np.array([0.0, 1.0]), np.array([0.0, 100.0]), 1.0)
+        self.assertEqual(len(intervals), 0)
+
+    # Tests that runs of undefined points are compacted into a single NaN point
+    def test_compact_non_finite(self):
+        x = np.arange(7.0)
+        y = np.array([np.nan, np.nan, 1.0, np.inf, -np.inf, np.nan, 2.0])
+        x, y = compact_non_finite(x, y)
+        self.assertEqual(x.tolist(), [0.0, 2.0, 3.0, 6.0])
+        self.assertTrue(np.array_equal(y, [np.nan, 1.0, np.nan, 2.0], equal_nan=True))
+
+    # Tests that regions are only used as hints: their edges are sampled, and parts of the function inside them are still found
+    def test_regions(self):
+        evaluated = []
+        def f(x):
+            evaluated.append(np.copy(x))
+            return np.log(np.sin(10*x))
+        x, y = adaptive_sample(f, 103, 104, 20, x=np.linspace(103, 104, 65), regions=[(102.5, 103.5)])
+        self.assertIn(103.5, np.concatenate(evaluated))
+        self.assertGreater(np.count_nonzero(np.isfinite(y[(x > 103) & (x < 103.5)])), 0)
+        self.assertTrue(np.allclose(x, np.sort(x)))
+        self.assertEqual(region_edges([(-10.0, -0.01), (0.0, 20.0)], -5, 10).tolist(), [-0.01, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# Tests for streaming curves through chunked generators
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.transformations.affine import AffineTransform
+from src.transformations.vector import Vector
+from src.visualiser.function_save import DataSaver
+from src.visualiser.streaming import evaluate_chunks, array_chunks, transform_chunks, curve_stream, write_values
+
+class StreamingTest(unittest.TestCase):
+
+    # Tests that evaluating in chunks gives the same points as evaluating all at once, without ever passing more than a chunk to the function
+    def test_evaluate_chunks(self):
+        sizes = []
+        f = lambda x: sizes.append(len(x)) or np.cos(x)
+        chunks = list(evaluate_chunks(f, -3, 7, 1001, chunk_size=64))
+        x = np.concatenate([chunk[0] for chunk in chunks])
+        y = np.concatenate([chunk[1] for chunk in chunks])
+        self.assertTrue(np.allclose(x, np.linspace(-3, 7, 1001)))
+        self.assertEqual(x[-1], 7)
+        self.assertTrue(np.allclose(y, np.cos(x)))
+        self.assertEqual(max(sizes), 64)
+        self.assertEqual([len(chunk[1]) for chunk in evaluate_chunks(lambda x: 2, 0, 1, 5, chunk_size=3)], [3, 2])
+        with self.assertRaises(ValueError):
+            next(evaluate_chunks(np.cos, 0, 1, 1))
+
+    # Tests that transforming chunks gives the same result as transforming the whole curve
+    def test_transform_chunks(self):
+        x, y = np.linspace(0, 1, 100), np.linspace(2, 3, 100)
+        t = AffineTransform.rotation(Vector([1.0, 1.0]), 30)
+        chunks = list(transform_chunks(array_chunks(x, y, 7), t))
+        expected = t.apply(x, y)
+        self.assertTrue(np.allclose(np.concatenate([c[0] for c in chunks]), expected[0]))
+        self.assertTrue(np.allclose(np.concatenate([c[1] for c in chunks]), expected[1]))
+        with self.assertRaises(ValueError):
+            next(array_chunks(x, y[:5]))
+
+    # Tests that values are written exactly, chunk by chunk
+    def test_write_values(self):
+        file = io.StringIO()
+        count = write_values(file, curve_stream(lambda x: x / 3, 0, 1, 10, chunk_size=4)(), 1)
+        self.assertEqual(count, 10)
+        self.assertTrue(np.array_equal(np.fromstring(file.getvalue().strip("[]"), sep=","), np.linspace(0, 1, 10) / 3))
+
+    # Tests saving arrays and streams, and reading them back without any values being lost
+    def test_save_and_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            saver = DataSaver("stream")
+            saver.filePath = os.path.join(directory, "stream.csv")
+            x = np.linspace(-10, 10, 5000)
+            saver.save([{"function_label": "f0: sin(x)", "xdata": x, "ydata": np.sin(x), "bounds": np.array([-10, 10, -5, 5])},
+                        {"function_label": "f1: x", "xdata": x, "ydata": x, "bounds": "N/A"}])
+            data = saver.read()
+            self.assertTrue(np.array_equal(data[0]["ydata"], np.sin(x)))
+            self.assertEqual(data[0]["bounds"].tolist(), [-10, 10, -5, 5])
+            self.assertEqual(data[1]["bounds"], "N/A")
+
+            saver.save_stream([{"function_label": "f0: log(x)", "stream": curve_stream(np.log, -1, 1, 200001, AffineTransform.scaling(2, 1), chunk_size=1000), "bounds": [-1, 1, -1, 1]}])
+            data = saver.read()
+            self.assertEqual(len(data[0]["xdata"]), 200001)
+            x = np.linspace(-1, 1, 200001)
+            self.assertTrue(np.allclose(data[0]["xdata"][x > 0], 2*x[x > 0]))
+            self.assertTrue(np.allclose(data[0]["ydata"][x > 0], np.log(x[x > 0])))
+            self.assertTrue(np.isnan(data[0]["ydata"][0]))
+
+    # Tests that labels holding the delimiter, quotes or new lines are quoted so they read back unchanged
+    def test_save_quoted_label(self):
+        with tempfile.TemporaryDirectory() as directory:
+            saver = DataSaver("quoted")
+            saver.filePath = os.path.join(directory, "quoted.csv")
+            labels = ['f0: "abs"|x|', "", "f2: x\r\n+1"]
+            saver.save([{"function_label": label, "xdata": np.arange(3.0), "ydata": np.arange(3.0) * i, "bounds": "N/A"} for i, label in enumerate(labels)])
+            data = saver.read()
+            self.assertEqual([row["function_label"] for row in data], labels)
+            self.assertEqual(data[2]["ydata"].tolist(), [0.0, 2.0, 4.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
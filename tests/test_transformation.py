@@ -1,7 +1,8 @@
 # Tests for transformation module
 import unittest
 from src.transformations.vector import Vector
-from src.transformations.transformation import translation, projection, shearing, scaling, reflection, rotation
+from src.transformations.transformation import translation, projection, shearing, scaling, reflection, rotation, OPERATOR_CACHE
+from src.transformations.operator_cache import OperatorCache, CacheInfo
 
 # Tests for on standard linear transformations
 class TestTransformations(unittest.TestCase):
@@ -42,6 +43,16 @@ class TestTransformations(unittest.TestCase):
         expected_negative = Vector([-1, 0])
         self.assertEqual(projected_negative, expected_negative)
 
+    # Tests that translation, projection and reflection still work on vectors which aren't 2D
+    def test_n_dimensional(self):
+        v, u = Vector([1, 2, 3]), Vector([1, 1, 1])
+        self.assertEqual(translation(v, u), Vector([2, 3, 4]))
+        self.assertEqual(projection(v, u), Vector([2, 2, 2]))
+        self.assertEqual(reflection(v, u), Vector([3, 2, 1]))
+        self.assertEqual(translation(Vector([5]), Vector([-2])), Vector([3]))
+        with self.assertRaises(ValueError):
+            translation(v, self.u)
+
     # Shearing tests
     def test_shearing(self):
         sheared = shearing(self.v1, 2, 3)
@@ -153,13 +164,40 @@ class TestTransformations(unittest.TestCase):
 
     # Cache max limit test
     def test_cache_size_limit(self):
-        self.assertEqual(translation.cache_info().maxsize, 1024)
-        self.assertEqual(projection.cache_info().maxsize, 1024)
-        self.assertEqual(shearing.cache_info().maxsize, 1024)
-        self.assertEqual(scaling.cache_info().maxsize, 1024)
-        self.assertEqual(reflection.cache_info().maxsize, 1024)
-        self.assertEqual(rotation.cache_info().maxsize, 1024)
-
+        self.assertEqual(OPERATOR_CACHE.cache_info().maxsize, 1024)
+
+    # Tests that revisiting the same parameters reuses the cached operator
+    def test_operator_cache_hits(self):
+        cache = OperatorCache(maxsize=4)
+        first = cache.get("rotation", self.origin, 30)
+        self.assertIs(cache.get("rotation", Vector([0, 0]), 30.0), first)
+        self.assertEqual(cache.cache_info(), CacheInfo(hits=1, misses=1, maxsize=4, currsize=1))
+
+    # Tests that different points transformed with the same parameters share one operator
+    def test_operator_cache_shared_between_points(self):
+        OPERATOR_CACHE.cache_clear()
+        for i in range(50):
+            shearing(Vector([i, -i]), 2, 3)
+        self.assertEqual(OPERATOR_CACHE.cache_info().misses, 1)
+        self.assertEqual(OPERATOR_CACHE.cache_info().hits, 49)
+
+    # Tests that the least recently used operator is evicted once the cache is full
+    def test_operator_cache_eviction(self):
+        cache = OperatorCache(maxsize=2)
+        cache.get("scaling", 1, 2)
+        cache.get("scaling", 3, 4)
+        cache.get("scaling", 1, 2)  # Makes (3, 4) the least recently used operator
+        cache.get("scaling", 5, 6)
+        self.assertEqual(len(cache), 2)
+        cache.get("scaling", 1, 2)
+        self.assertEqual(cache.cache_info().hits, 2)
+        cache.get("scaling", 3, 4)
+        self.assertEqual(cache.cache_info().misses, 4)
+
+    # Tests that unknown transformations are rejected
+    def test_operator_cache_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            OperatorCache().get("squashing", 1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import math
 from src.transformations.vector import Vector
 from src.transformations.matrix import Matrix 
@@ -117,5 +118,74 @@ class VectorTest(unittest.TestCase):
         self.assertEqual(self.vector4.toMatrix(), Matrix([[3.0], [15.0], [12.0], [5.0]]))
 
 
+    # Test that the vector is stored as a float64 array and exposes it without copying
+    def test_as_array(self):
+        array = self.vector1.as_array()
+        self.assertEqual(array.dtype, np.float64)
+        self.assertTrue(np.shares_memory(array, self.vector1.as_array()))
+        self.assertEqual(array.tolist(), [1.0, 2.0, 3.0])
+
+    # Test that vectors use slots rather than an instance dictionary
+    def test_slots(self):
+        self.assertFalse(hasattr(self.vector1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.vector1.extra = 1
+
+    # Test that replacing the values of a vector revalidates them
+    def test_set_values(self):
+        v = Vector([1.0, 2.0])
+        v.values = [3.0, 4.0, 5.0]
+        self.assertEqual(v.d, 3)
+        self.assertEqual(v.values, [3.0, 4.0, 5.0])
+        with self.assertRaises(ValueError):
+            v.values = []
+
+    # Test that assigning to the elements of the values changes the vector, while resizing them or writing to a frozen vector is rejected
+    def test_set_value_elements(self):
+        v = Vector([1.0, 2.0, 3.0])
+        values = v.values
+        values[0] = 5.0
+        values[1:] = [6.0, 7.0]
+        self.assertEqual(v.values, [5.0, 6.0, 7.0])
+        self.assertEqual(values, [5.0, 6.0, 7.0])
+        with self.assertRaises(TypeError):
+            v.values.append(8.0)
+        with self.assertRaises(AttributeError):
+            v.freeze().values[0] = 1.0
+        self.assertEqual(v.d, 3)
+
+    # Test that comparing a vector to a non vector is not equal rather than an error
+    def test_equality_non_vector(self):
+        self.assertNotEqual(self.vector1, [1.0, 2.0, 3.0])
+
+
+    # Test that a frozen vector rejects mutation, including through its array view
+    def test_frozen_rejects_mutation(self):
+        frozen = Vector([1.0, 2.0], frozen=True)
+        self.assertTrue(frozen.frozen)
+        with self.assertRaises(AttributeError):
+            frozen.values = [3.0, 4.0]
+        with self.assertRaises(ValueError):
+            frozen.as_array()[0] = 5.0
+        self.assertEqual(frozen.values, [1.0, 2.0])
+
+    # Test that freezing copies the vector so later changes to the original don't leak into it
+    def test_freeze_copies(self):
+        v = Vector([1.0, 2.0])
+        frozen = v.freeze()
+        v.as_array()[0] = 10.0
+        self.assertEqual(frozen.values, [1.0, 2.0])
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertFalse(v.frozen)
+
+    # Test that frozen vectors hash the same as equal mutable vectors and keep working as dictionary keys
+    def test_frozen_hash(self):
+        frozen = self.vector1.freeze()
+        self.assertEqual(hash(frozen), hash(self.vector1))
+        cache = {frozen: "value"}
+        self.assertEqual(cache[Vector([1.0, 2.0, 3.0])], "value")
+        self.assertFalse(frozen.scale(2).frozen)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,104 @@
+import math
+import unittest
+import numpy as np
+from src.transformations.vector import Vector
+from src.transformations.vector_array import VectorArray
+from src.transformations.matrix import Matrix
+from src.transformations.transformation import translation, projection, shearing, scaling, reflection, rotation
+
+class VectorArrayTest(unittest.TestCase):
+
+    # Sets up the vector arrays being used in the tests
+    def setUp(self):
+        self.x = np.array([1.0, -2.0, 3.0, 0.5])
+        self.y = np.array([2.0, 4.0, -1.0, 0.0])
+        self.array1 = VectorArray.fromXY(self.x, self.y)
+        self.array2 = VectorArray([[3.0, 1.0, 0.0, -1.0], [1.0, 1.0, 2.0, 5.0]])
+        self.vectors1 = [Vector([xi, yi]) for xi, yi in zip(self.x, self.y)]
+
+    # Ensures that vector arrays are correctly being initialized
+    def test_initialization(self):
+        self.assertEqual(self.array1.d, 2)
+        self.assertEqual(len(self.array1), 4)
+        self.assertEqual(self.array1.values, [self.x.tolist(), self.y.tolist()])
+        self.assertEqual(VectorArray.fromVectors(self.vectors1), self.array1)
+        self.assertEqual(self.array1[2], Vector([3.0, -1.0]))
+
+    # Tests vector array initialisation errors
+    def test_initialization_invalid(self):
+        with self.assertRaises(ValueError):
+            VectorArray([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            VectorArray.fromXY(self.x, self.y[:2])
+        with self.assertRaises(ValueError):
+            VectorArray.fromVectors([Vector([1.0, 2.0]), Vector([1.0, 2.0, 3.0])])
+
+    # Tests scaling by a single scalar and by one scalar per vector
+    def test_scale(self):
+        self.assertEqual(self.array1.scale(2), VectorArray.fromXY(2*self.x, 2*self.y))
+        k = np.array([1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(self.array1.scale(k), VectorArray.fromXY(k*self.x, k*self.y))
+
+    # Tests adding vector arrays together and adding a single vector to every point
+    def test_add(self):
+        self.assertEqual(self.array1.add(self.array2), VectorArray(self.array1.as_array() + self.array2.as_array()))
+        self.assertEqual(self.array1.add(Vector([1.0, -1.0])), VectorArray.fromXY(self.x + 1, self.y - 1))
+        with self.assertRaises(ValueError):
+            self.array1.add(Vector([1.0, 2.0, 3.0]))
+        with self.assertRaises(TypeError):
+            self.array1.add([1.0, 2.0])
+
+    # Tests that the vectorised operations agree with the single vector operations
+    def test_matches_vector(self):
+        u = Vector([1.0, 1.0])
+        dots, magnitudes, angles = self.array1.dotProduct(u), self.array1.magnitude(), self.array1.angle(u)
+        for i, v in enumerate(self.vectors1):
+            self.assertAlmostEqual(dots[i], v.dotProduct(u))
+            self.assertAlmostEqual(magnitudes[i], v.magnitude())
+            self.assertAlmostEqual(angles[i], v.angle(u))
+            self.assertEqual(self.array1.normalize()[i], v.normalize())
+        self.assertTrue(np.allclose(self.array1.dotProduct(self.array2), np.sum(self.array1.as_array() * self.array2.as_array(), axis=0)))
+
+    # Tests normalizing a vector array containing a zero vector
+    def test_normalize_zero_vector(self):
+        with self.assertRaises(ZeroDivisionError):
+            VectorArray([[1.0, 0.0], [1.0, 0.0]]).normalize()
+
+    # Tests the angle between parallel vectors is 0 rather than an error from rounding
+    def test_angle_parallel(self):
+        self.assertTrue(np.allclose(self.array1.angle(self.array1.scale(3)), 0.0, atol=1e-6))
+        self.assertAlmostEqual(VectorArray([[1.0], [0.0]]).angle(Vector([0.0, 1.0]))[0], 90.0)
+
+    # Tests applying a matrix to every vector
+    def test_transform(self):
+        m = Matrix([[0.0, 1.0], [-1.0, 0.0]])
+        result = self.array1.transform(m)
+        self.assertIsInstance(result, VectorArray)
+        for i, v in enumerate(self.vectors1):
+            self.assertEqual(result[i], m.multiply(v))
+
+    # Tests that the transformations accept vector arrays directly
+    def test_transformations(self):
+        u = Vector([1.0, 2.0])
+        cases = [(translation, (u,)), (projection, (u,)), (shearing, (2, 3)), (scaling, (-1, 4)), (reflection, (Vector([math.cos(1), math.sin(1)]),)), (rotation, (u, 60))]
+        for t, args in cases:
+            result = t(self.array1, *args)
+            self.assertIsInstance(result, VectorArray)
+            for i, v in enumerate(self.vectors1):
+                self.assertEqual(result[i], t(v, *args))
+
+    # Tests that translation, projection and reflection accept vector arrays which aren't 2D, matching each of their vectors
+    def test_n_dimensional_transformations(self):
+        array = VectorArray(np.arange(12.0).reshape(3, 4))
+        u = Vector([1.0, 1.0, 1.0])
+        self.assertEqual(translation(VectorArray(np.ones((3, 4))), u), VectorArray(np.full((3, 4), 2.0)))
+        for t in (translation, projection, reflection):
+            result = t(array, u)
+            self.assertIsInstance(result, VectorArray)
+            self.assertEqual(result.d, 3)
+            for i in range(len(array)):
+                self.assertEqual(result[i], t(array[i], u))
+
+
+if __name__ == '__main__':
+    unittest.main()